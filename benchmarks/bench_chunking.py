@@ -0,0 +1,100 @@
+"""Peak memory and chunks/s of streamed versus materialised chunking.
+
+Builds synthetic case pages (see ``synthetic_pdf.py``) in memory and prepares
+index batches the way `MedicalSummaryPipeline.build_vector_index` does, in two ways:
+
+- ``split``: `DocumentChunker.split()` materialises every chunk, then every
+  LangChain `Document`, before anything is upserted (the previous index path).
+- ``iter_split``: offset-based chunks are streamed into `index_batch_size`
+  batches of `Document`s, each dropped once handed to the (here, no-op) upsert.
+
+Throughput is timed first; peak allocation is then measured separately with
+``tracemalloc`` so tracing overhead does not skew the timings.
+
+    python benchmarks/bench_chunking.py [--pages 500 2000 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+
+from langchain_core.documents import Document  # noqa: E402
+from synthetic_pdf import page_lines  # noqa: E402
+
+from medical_summary_builder.config import settings  # noqa: E402
+from medical_summary_builder.pipelines import MedicalSummaryPipeline  # noqa: E402
+from medical_summary_builder.preprocessing import DocumentChunker  # noqa: E402
+
+
+def case_pages(pages: int) -> list[Document]:
+    rng = random.Random(0)
+    # Real pages are denser than the synthetic layout; repeat the body to reach ~3,000 characters.
+    return [
+        Document(
+            page_content="\n".join(page_lines(number, rng)) * 2,
+            metadata={"source": "case.pdf", "page_number": number, "total_pages": pages},
+        )
+        for number in range(1, pages + 1)
+    ]
+
+
+def materialised(chunker: DocumentChunker, pages: list[Document]) -> int:
+    chunks = chunker.split(pages)
+    documents = [
+        Document(
+            id=MedicalSummaryPipeline.chunk_id("case", chunk.metadata, chunk.text),
+            page_content=chunk.text,
+            metadata=chunk.metadata,
+        )
+        for chunk in chunks
+    ]
+    return len(documents)
+
+
+def streamed(chunker: DocumentChunker, pages: list[Document]) -> int:
+    batch: list[Document] = []
+    total = 0
+    for chunk in chunker.iter_split(pages):
+        text = chunk.text
+        metadata = chunk.metadata
+        batch.append(Document(id=MedicalSummaryPipeline.chunk_id("case", metadata, text), page_content=text, metadata=metadata))
+        if len(batch) >= settings.index_batch_size:
+            total += len(batch)
+            batch = []
+    return total + len(batch)
+
+
+def measure(func, chunker: DocumentChunker, pages: list[Document]) -> tuple[int, float, float]:
+    start = time.perf_counter()
+    chunks = func(chunker, pages)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(chunker, pages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return chunks, seconds, peak / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[500, 2000, 5000])
+    args = parser.parse_args()
+
+    chunker = DocumentChunker(settings.chunk_size, settings.chunk_overlap)
+    print(f"{'pages':>6}  {'mode':<11} {'chunks':>7} {'seconds':>8} {'chunks/s':>9} {'peak MiB':>9}")
+    for pages in args.pages:
+        documents = case_pages(pages)
+        for name, func in (("split", materialised), ("iter_split", streamed)):
+            chunks, seconds, peak = measure(func, chunker, documents)
+            print(f"{pages:>6}  {name:<11} {chunks:>7} {seconds:8.3f} {chunks / seconds:9.0f} {peak:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
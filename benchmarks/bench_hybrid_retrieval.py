@@ -0,0 +1,90 @@
+"""Agent tool latency and tokens per call: dense-only versus hybrid retrieval.
+
+Indexes a case file into the local vector backend with the deterministic
+embedder from ``offline_stubs.py``, then calls `medical_record_search` the way
+the agent does with the plain k=25 dense retriever (``hybrid_retrieval_enabled``
+off) and with `HybridRetriever`. Each query list is run twice; the second pass
+shows what the per-run query cache saves when the agent repeats itself.
+
+Tokens per call are what the agent reads back. Hits count queries whose known
+answer string appears in the tool output; with the fake embedder the dense
+ranking is arbitrary, so dense hits only reflect how much text is returned.
+
+    python benchmarks/bench_hybrid_retrieval.py ["Data/Medical File.pdf"]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import offline_stubs
+
+from medical_summary_builder.config import settings
+from medical_summary_builder.pipelines import MedicalSummaryPipeline
+from medical_summary_builder.pipelines.orchestrator import medical_record_search
+from medical_summary_builder.utils import count_tokens
+
+DEFAULT_PDF = Path(__file__).resolve().parent.parent / "Data" / "Medical File.pdf"
+
+# (query, answer string) pairs for the sample case file, phrased like agent tool calls.
+QUERIES = [
+    ("claimant date of birth", "05/21/1965"),
+    ("claimant social security number SSN", "456-12-7890"),
+    ("alleged onset date", "07/01/2022"),
+    ("hip x-ray arthritis findings", "arthritis"),
+    ("cervical spine MRI disc herniation", "C4-C5"),
+    ("hemoglobin A1c lab result", "A1c"),
+    ("highest grade of education completed", "grade"),
+    ("date last insured", "Last Insured"),
+]
+
+
+def run_queries(retriever, queries: list[str]) -> tuple[list[float], list[str]]:
+    config = {"configurable": {"retriever": retriever, "duplicate_pages": {}}}
+    seconds, outputs = [], []
+    for query in queries:
+        start = time.perf_counter()
+        outputs.append(medical_record_search(query, config))
+        seconds.append(time.perf_counter() - start)
+    return seconds, outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", type=Path, nargs="?", default=DEFAULT_PDF)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory(prefix="msb-bench-") as scratch_name:
+        offline_stubs.install(Path(scratch_name))
+        pipeline = MedicalSummaryPipeline()
+        namespace = pipeline.case_namespace(args.pdf)
+        pages = pipeline.ingest_source(args.pdf, use_page_cache=False)
+        pipeline.build_vector_index(pages, namespace=namespace)
+
+        queries = [query for query, _ in QUERIES]
+        print(
+            f"{'retriever':<10} {'pass':<7} {'mean ms':>8} {'median ms':>9} {'passages':>9} "
+            f"{'tokens/call':>12} {'hits':>6}"
+        )
+        for name, hybrid in (("dense", False), ("hybrid", True)):
+            settings.hybrid_retrieval_enabled = hybrid
+            retriever = pipeline.create_retriever(pages, namespace=namespace)
+            for label in ("cold", "repeat"):
+                seconds, outputs = run_queries(retriever, queries)
+                passages = statistics.mean(output.count("[Page: ") for output in outputs)
+                tokens = statistics.mean(count_tokens(output) for output in outputs)
+                hits = sum(answer.lower() in output.lower() for (_, answer), output in zip(QUERIES, outputs))
+                print(
+                    f"{name:<10} {label:<7} {statistics.mean(seconds) * 1000:8.2f} {statistics.median(seconds) * 1000:9.2f} "
+                    f"{passages:9.1f} {tokens:12.0f} {f'{hits}/{len(QUERIES)}':>6}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Agent output parsing time on multi-megabyte transcripts.
+
+Builds an agent answer that embeds long tool outputs (full of braces, brackets
+and quotes, as retrieved medical text is) ahead of the final JSON summary, then
+times `MedicalSummaryPipeline._parse_json_string` against the previous
+two-pass, string-unaware candidate scan that tried every candidate eagerly.
+
+    python benchmarks/bench_json_parser.py [--megabytes 1 4 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+
+from medical_summary_builder.pipelines import MedicalSummaryPipeline  # noqa: E402
+from medical_summary_builder.pipelines.orchestrator import AgentSummary  # noqa: E402
+
+TOOL_OUTPUT = (
+    "[Page: 12/504]\nPatient seen {follow-up} for hip pain [R > L]; notes: \"pain 7/10\". "
+    "Plan: {PT 2x/week} [reassess in 6 weeks]. Claimant's mother present. "
+)
+
+
+def transcript(megabytes: float, events: int = 200) -> str:
+    summary = {
+        "profile": {"claimant_name": "Jane Q. Doe", "ssn": "123-45-6789", "date_of_birth": "04/12/1968"},
+        "events": [
+            {"date": f"{1 + i % 12:02d}/15/2023", "provider": f"Clinic {{{i}}}", "reason": "Visit [follow-up]", "reference": f"Pg {i}"}
+            for i in range(events)
+        ],
+        "custom_tables": {},
+    }
+    padding = TOOL_OUTPUT * int(megabytes * 1024 * 1024 / len(TOOL_OUTPUT))
+    return f"Evidence gathered:\n{padding}\nFinal answer:\n```json\n{json.dumps(summary)}\n```"
+
+
+def legacy_parse(pipeline: MedicalSummaryPipeline, text: str) -> AgentSummary | None:
+    """The scan this benchmark replaced: one pass per bracket type, every candidate materialised up front."""
+
+    def balanced(value: str) -> list[str]:
+        substrings = []
+        for opening, closing in (("{", "}"), ("[", "]")):
+            stack: list[int] = []
+            start = None
+            for idx, char in enumerate(value):
+                if char == opening:
+                    if not stack:
+                        start = idx
+                    stack.append(idx)
+                elif char == closing and stack:
+                    stack.pop()
+                    if not stack and start is not None:
+                        substrings.append(value[start : idx + 1])
+                        start = None
+        return substrings
+
+    stripped = text.strip()
+    candidates = [stripped, *balanced(stripped)]
+    for candidate in candidates:
+        try:
+            data = json.loads(candidate)
+        except json.JSONDecodeError:
+            try:
+                data = ast.literal_eval(candidate)
+            except (ValueError, SyntaxError):
+                continue
+        try:
+            return AgentSummary.model_validate(pipeline._normalize_agent_payload(data))
+        except Exception:
+            continue
+    return None
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--megabytes", type=float, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the current parser.")
+    args = parser.parse_args()
+
+    # Parsing needs no clients, so skip the constructor and its API-key checks.
+    pipeline = MedicalSummaryPipeline.__new__(MedicalSummaryPipeline)
+
+    print(f"{'size':>8} {'current':>10} {'legacy':>10} {'events':>7}")
+    for megabytes in args.megabytes:
+        text = transcript(megabytes)
+        parsed, current = timed(pipeline._parse_json_string, text)
+        legacy = "-"
+        if not args.skip_legacy:
+            _, seconds = timed(legacy_parse, pipeline, text)
+            legacy = f"{seconds:.3f}s"
+        print(f"{len(text) / 1e6:7.1f}M {current:9.3f}s {legacy:>10} {len(parsed.events) if parsed else 0:>7}")
+
+
+if __name__ == "__main__":
+    main()
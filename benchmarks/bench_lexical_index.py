@@ -0,0 +1,93 @@
+"""Build and query latency of the BM25 `LexicalPageIndex` versus dense retrieval.
+
+Indexes a case PDF (or a synthetic 2,000-page corpus when no PDF is given) and
+times the fallback-extraction keyword queries against it. With ``--compare-dense``
+the same queries are run through the configured vector backend for the case.
+
+    python benchmarks/bench_lexical_index.py [--pdf-path "Data/Medical File.pdf"] [--compare-dense]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+from langchain_core.documents import Document
+
+from medical_summary_builder.data_ingestion import PDFMedicalLoader
+from medical_summary_builder.preprocessing import LexicalPageIndex
+
+QUERIES = [
+    "claimant profile information",
+    "Social Security Number SSN",
+    "Last Insured: Application",
+    "PFD",
+    "Alleged onset",
+    "Date of Birth",
+    "th grade education",
+    "Medical Records treatment start date",
+]
+
+VOCABULARY = (
+    "patient hip pain xray arthritis follow up clinic hypertension diabetes lumbar "
+    "radiculopathy mri therapy medication refill depression anxiety onset claimant "
+    "provider assessment plan history exam normal abnormal grade education"
+).split()
+
+
+def synthetic_pages(count: int, words_per_page: int = 350) -> list[Document]:
+    rng = random.Random(0)
+
+    def word() -> str:
+        # Mix common clinical terms with rare tokens so the vocabulary grows like a real file.
+        if rng.random() < 0.9:
+            return rng.choice(VOCABULARY)
+        return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+
+    return [
+        Document(
+            page_content=" ".join(word() for _ in range(words_per_page)),
+            metadata={"page_number": page, "page_label": f"{page}/{count}"},
+        )
+        for page in range(1, count + 1)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf-path", type=Path)
+    parser.add_argument("--pages", type=int, default=2000, help="Synthetic page count when no PDF is given.")
+    parser.add_argument("--compare-dense", action="store_true")
+    args = parser.parse_args()
+
+    if args.pdf_path:
+        pages = PDFMedicalLoader(args.pdf_path).load()
+    else:
+        pages = synthetic_pages(args.pages)
+
+    start = time.perf_counter()
+    index = LexicalPageIndex(pages)
+    print(f"BM25 build: {len(pages)} pages, {len(index.vocabulary)} terms in {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    for query in QUERIES:
+        index.search(query, k=25)
+    lexical = (time.perf_counter() - start) / len(QUERIES)
+    print(f"BM25 query (mean of {len(QUERIES)}): {lexical * 1000:.2f}ms")
+
+    if args.compare_dense and args.pdf_path:
+        from medical_summary_builder.pipelines import MedicalSummaryPipeline
+
+        pipeline = MedicalSummaryPipeline()
+        retriever = pipeline.vector_index_manager.as_retriever(namespace=pipeline.case_namespace(args.pdf_path))
+        start = time.perf_counter()
+        for query in QUERIES:
+            retriever.invoke(query)
+        dense = (time.perf_counter() - start) / len(QUERIES)
+        print(f"Dense query (mean of {len(QUERIES)}): {dense * 1000:.2f}ms ({dense / lexical:.0f}x BM25)")
+
+
+if __name__ == "__main__":
+    main()
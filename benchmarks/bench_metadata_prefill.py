@@ -0,0 +1,97 @@
+"""Agent LLM calls and seconds per case with metadata prefill on and off.
+
+Runs the agent path of `MedicalSummaryPipeline.run` offline (see
+``offline_stubs.py``) with ``metadata_prefill_enabled`` off and on. The stub
+agent searches once per profile field, then for the timeline, and skips the
+search for every field the prompt already lists as a pre-filled candidate, as
+the prompt invites the model to do. Each stub LLM call sleeps ``--latency``
+seconds to stand in for a hosted model's round trip, so the seconds column is
+what a real run would roughly save.
+
+    python benchmarks/bench_metadata_prefill.py ["Data/Medical File.pdf" ...] [--pages 100] [--latency 0.5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from langchain_core.messages import BaseMessage, HumanMessage
+
+import offline_stubs
+from synthetic_pdf import write_case_pdf
+
+from medical_summary_builder.config import settings
+from medical_summary_builder.llm import LLMClientFactory
+from medical_summary_builder.pipelines import MedicalSummaryPipeline
+from medical_summary_builder.pipelines.orchestrator import PREFILL_LABELS
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "Data"
+TEMPLATE_PATH = DATA_DIR / "Medical Summary.docx"
+TIMELINE_QUERIES = ["timeline of medical events provider visit", "imaging and lab results", "treating source opinions"]
+
+# LLM calls and agent seconds of the current run, filled in by `ProfileSearchingStub`.
+USAGE: dict[str, float] = {}
+
+
+class ProfileSearchingStub(offline_stubs.StubChatModel):
+    """Stub agent that searches for each profile field the prompt does not pre-fill."""
+
+    latency: float = 0.0
+
+    def search_queries(self, messages: list[BaseMessage]) -> list[str]:
+        prompt = next((str(message.content) for message in messages if isinstance(message, HumanMessage)), "")
+        profile = [f"claimant {label}" for label in PREFILL_LABELS.values() if f"- {label}: " not in prompt]
+        return profile + TIMELINE_QUERIES
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        start = time.perf_counter()
+        time.sleep(self.latency)
+        result = super()._generate(messages, stop, run_manager, **kwargs)
+        USAGE["calls"] = USAGE.get("calls", 0) + 1
+        USAGE.setdefault("start", start)
+        USAGE["end"] = time.perf_counter()
+        return result
+
+
+def run_case(pipeline: MedicalSummaryPipeline, pdf_path: Path, prefill: bool) -> tuple[int, float]:
+    settings.metadata_prefill_enabled = prefill
+    USAGE.clear()
+    pipeline.run(pdf_path=pdf_path, template_path=TEMPLATE_PATH, skip_indexing=True)
+    return int(USAGE["calls"]), USAGE["end"] - USAGE["start"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdfs", type=Path, nargs="*", default=[DATA_DIR / "Medical File.pdf"])
+    parser.add_argument("--pages", type=int, default=100, help="Size of the synthetic case added to the inputs.")
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds each stub LLM call takes.")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory(prefix="msb-bench-") as scratch_name:
+        scratch = Path(scratch_name)
+        offline_stubs.install(scratch)
+        answer = offline_stubs.canned_summary().model_dump_json()
+        LLMClientFactory.create = staticmethod(lambda **_: ProfileSearchingStub(answer=answer, latency=args.latency))
+        pipeline = MedicalSummaryPipeline()
+        cases = [*args.pdfs, write_case_pdf(scratch / f"synthetic-{args.pages}.pdf", args.pages)]
+
+        print(f"{'case':<24} {'prefill':<8} {'LLM calls':>9} {'agent s':>8} {'calls saved':>11} {'s saved':>8}")
+        for pdf_path in cases:
+            pages = pipeline.ingest_source(pdf_path, use_page_cache=False)
+            pipeline.build_vector_index(pages, namespace=pipeline.case_namespace(pdf_path))
+            off_calls, off_seconds = run_case(pipeline, pdf_path, prefill=False)
+            on_calls, on_seconds = run_case(pipeline, pdf_path, prefill=True)
+            print(f"{pdf_path.name[:24]:<24} {'off':<8} {off_calls:>9} {off_seconds:8.2f}")
+            print(
+                f"{pdf_path.name[:24]:<24} {'on':<8} {on_calls:>9} {on_seconds:8.2f} "
+                f"{off_calls - on_calls:>11} {off_seconds - on_seconds:8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""OCR throughput on scanned pages, per worker count, cold and warm cache.
+
+Writes a synthetic case file where every ``--scanned-every``-th page is an
+image-only scan (see ``synthetic_pdf.py``), then loads it with OCR enabled for
+each ``--workers`` value: first with an empty OCR cache, then again with the
+cache warm. Reports wall-clock pages/s and OCR pages/s per core.
+
+Needs pytesseract and the Tesseract binary.
+
+    python benchmarks/bench_ocr.py [--pages 60] [--scanned-every 2] [--workers 1 2 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic_pdf import write_case_pdf
+
+from medical_summary_builder.data_ingestion import PageOCR, PDFMedicalLoader, ocr_available
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--scanned-every", type=int, default=2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--language", default="eng")
+    args = parser.parse_args()
+
+    if not ocr_available():
+        raise SystemExit("pytesseract or the tesseract binary is not installed.")
+
+    with tempfile.TemporaryDirectory(prefix="msb-bench-") as scratch_name:
+        scratch = Path(scratch_name)
+        pdf_path = write_case_pdf(scratch / "scanned.pdf", args.pages, scanned_every=args.scanned_every)
+
+        print(f"{'workers':>7}  {'cache':<5} {'seconds':>8} {'pages/s':>8} {'OCR pages':>9} {'cached':>6} {'OCR pages/s/core':>17}")
+        for workers in args.workers:
+            ocr = PageOCR(language=args.language, cache_path=scratch / f"ocr-{workers}.sqlite3")
+            for cache_state in ("cold", "warm"):
+                loader = PDFMedicalLoader(pdf_path, max_workers=workers, ocr=ocr)
+                start = time.perf_counter()
+                documents = loader.load()
+                seconds = time.perf_counter() - start
+                stats = loader.ocr_stats
+                per_core = stats.pages / stats.seconds if stats.seconds else 0.0
+                print(
+                    f"{loader.max_workers:>7}  {cache_state:<5} {seconds:8.2f} {len(documents) / seconds:8.1f} "
+                    f"{stats.pages:>9} {stats.cached:>6} {per_core:17.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
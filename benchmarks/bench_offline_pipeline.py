@@ -0,0 +1,154 @@
+"""Per-stage pipeline throughput with no network access and no API keys.
+
+Generates synthetic case files (see ``synthetic_pdf.py``), swaps the LLM,
+embedder and vector store for the deterministic stand-ins in ``offline_stubs.py``,
+and times each stage: page extraction (pages/s), chunking (chunks/s), indexing
+(chunks/s), agent output parsing, report rendering, and an end-to-end run.
+
+Results are saved as JSON; pass a previous result file with ``--compare`` to flag
+stages whose throughput dropped by more than ``--tolerance``.
+
+    python benchmarks/bench_offline_pipeline.py --pages 10 100 1000 [--compare outputs/benchmarks/offline-....json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import logging
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+import offline_stubs
+from synthetic_pdf import write_case_pdf
+
+from medical_summary_builder.config import settings
+from medical_summary_builder.data_ingestion import PDFMedicalLoader
+from medical_summary_builder.pipelines import MedicalSummaryPipeline
+from medical_summary_builder.reporting import ReportWriter
+from medical_summary_builder.utils import load_json, save_json
+
+TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "Data" / "Medical Summary.docx"
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def stage(seconds: float, items: int) -> dict[str, float]:
+    return {"seconds": round(seconds, 4), "items": items, "per_second": round(items / seconds, 2) if seconds else 0.0}
+
+
+def agent_result(pages: int) -> dict:
+    """A transcript shaped like a real run: tool outputs, then a long final answer."""
+
+    summary = offline_stubs.canned_summary(events=max(10, pages // 5))
+    messages = [HumanMessage("Summarise the case.")]
+    for index in range(max(2, pages // 50)):
+        messages.append(AIMessage("", tool_calls=[{"name": "medical_record_search", "args": {"query": "q"}, "id": str(index)}]))
+        messages.append(ToolMessage("[Page: 1/1]\n" + "Clinic note {follow-up} text. " * 200, tool_call_id=str(index)))
+    messages.append(AIMessage("Here is the summary.\n\n```json\n" + summary.model_dump_json(indent=2) + "\n```"))
+    return {"messages": messages}
+
+
+def bench_case(pipeline: MedicalSummaryPipeline, pdf_path: Path, pages: int, scratch: Path) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+
+    loader = PDFMedicalLoader(
+        pdf_path,
+        max_workers=settings.pdf_extraction_workers,
+        pages_per_shard=settings.pdf_pages_per_shard,
+    )
+    documents, seconds = timed(loader.load)
+    results["extract_pages"] = stage(seconds, len(documents))
+
+    chunks, seconds = timed(pipeline.chunker.split, documents)
+    results["chunk"] = stage(seconds, len(chunks))
+
+    namespace = pipeline.case_namespace(pdf_path)
+    _, seconds = timed(pipeline.build_vector_index, documents, namespace=namespace)
+    results["index"] = stage(seconds, len(chunks))
+
+    transcript = agent_result(pages)
+    parsed, seconds = timed(pipeline._parse_agent_result, transcript)
+    results["parse_agent_result"] = stage(seconds, len(parsed.events) if parsed else 0)
+
+    writer = ReportWriter(scratch / f"reports-{pages}")
+    summary = offline_stubs.canned_summary(events=max(10, pages // 5))
+    _, markdown_seconds = timed(writer.write_markdown, summary)
+    _, docx_seconds = timed(writer.write_docx, summary)
+    results["render_reports"] = stage(markdown_seconds + docx_seconds, len(summary.events))
+
+    _, seconds = timed(pipeline.run, pdf_path=pdf_path, template_path=TEMPLATE_PATH, skip_indexing=True)
+    results["end_to_end"] = stage(seconds, len(documents))
+    return results
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for pages, stages in current["results"].items():
+        for name, values in stages.items():
+            previous = baseline.get("results", {}).get(pages, {}).get(name)
+            if not previous or not previous["per_second"]:
+                continue
+            ratio = values["per_second"] / previous["per_second"]
+            marker = "REGRESSION" if ratio < 1 - tolerance else ""
+            print(f"  {pages:>6} pages  {name:<20} {ratio:7.2f}x  {marker}")
+            if marker:
+                regressions.append(f"{name}@{pages}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 1000], help="Synthetic case sizes (10 to 5000).")
+    parser.add_argument("--results-dir", type=Path, default=settings.outputs_dir / "benchmarks")
+    parser.add_argument("--compare", type=Path, help="Earlier result file to compare throughput against.")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed fractional throughput drop.")
+    args = parser.parse_args()
+    results_dir = args.results_dir.resolve()
+
+    with tempfile.TemporaryDirectory(prefix="msb-bench-") as scratch_name:
+        scratch = Path(scratch_name)
+        offline_stubs.install(scratch)
+        pipeline = MedicalSummaryPipeline()
+        pipeline.warm_up()
+        # Keep per-stage log lines from interleaving with the results table.
+        logging.getLogger("medical_summary_builder").setLevel(logging.WARNING)
+
+        report = {
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "pdf_extraction_workers": settings.pdf_extraction_workers,
+            "results": {},
+        }
+        print(f"{'pages':>6}  {'stage':<20} {'seconds':>9} {'items':>7} {'items/s':>10}")
+        for pages in args.pages:
+            pdf_path = write_case_pdf(scratch / f"case-{pages}.pdf", pages)
+            results = bench_case(pipeline, pdf_path, pages, scratch)
+            report["results"][str(pages)] = results
+            for name, values in results.items():
+                print(f"{pages:>6}  {name:<20} {values['seconds']:9.3f} {values['items']:>7} {values['per_second']:>10.1f}")
+
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S")
+    path = save_json(report, results_dir / f"offline-{stamp}.json")
+    print(f"Results saved to {path}")
+
+    if args.compare:
+        print(f"Throughput relative to {args.compare}:")
+        regressions = compare(report, load_json(args.compare), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} stage(s) regressed: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""End-to-end indexing time: sequential versus overlapped extract/chunk/embed/upsert.
+
+Uses the offline stand-ins from ``offline_stubs.py`` with an embedder that sleeps
+``--embed-latency`` seconds per request to stand in for the network, and times
+two ways of indexing a synthetic case file:
+
+- ``sequential``: extract every page, then chunk, embed and upsert one batch at a
+  time (``index_upsert_workers=1``).
+- ``overlapped``: stream pages from the extractor while ``--workers`` batches are
+  embedded and upserted in the background, as `MedicalSummaryPipeline.run` does.
+
+    python benchmarks/bench_overlapped_indexing.py [--pages 500 2000] [--embed-latency 0.15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+import offline_stubs
+from synthetic_pdf import write_case_pdf
+
+from medical_summary_builder.config import settings
+from medical_summary_builder.llm import EmbeddingFactory
+from medical_summary_builder.pipelines import MedicalSummaryPipeline
+
+
+class SlowEmbeddings(DeterministicFakeEmbedding):
+    """Fake embedder that pays a fixed round-trip latency per embedding request."""
+
+    latency: float = 0.1
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(self.latency)
+        return super().embed_documents(texts)
+
+
+def sequential(pipeline: MedicalSummaryPipeline, pdf_path: Path, namespace: str) -> None:
+    settings.index_upsert_workers = 1
+    pages = pipeline.ingest_source(pdf_path, use_page_cache=False)
+    pipeline.build_vector_index(pages, namespace=namespace)
+
+
+def overlapped(pipeline: MedicalSummaryPipeline, pdf_path: Path, namespace: str, workers: int) -> None:
+    settings.index_upsert_workers = workers
+    pipeline.build_vector_index(pipeline.iter_source(pdf_path, use_page_cache=False), namespace=namespace)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[500, 2000])
+    parser.add_argument("--embed-latency", type=float, default=0.15, help="Simulated seconds per embedding request.")
+    parser.add_argument("--workers", type=int, default=settings.index_upsert_workers or 2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="msb-bench-") as scratch_name:
+        scratch = Path(scratch_name)
+        offline_stubs.install(scratch)
+        EmbeddingFactory.create = staticmethod(lambda **_: SlowEmbeddings(size=256, latency=args.embed_latency))
+        pipeline = MedicalSummaryPipeline()
+        logging.getLogger("medical_summary_builder").setLevel(logging.WARNING)
+
+        print(f"{'pages':>6}  {'mode':<11} {'seconds':>8} {'pages/s':>8} {'chunks':>7}")
+        for pages in args.pages:
+            pdf_path = write_case_pdf(scratch / f"case-{pages}.pdf", pages)
+            for name in ("sequential", "overlapped"):
+                namespace = f"{name}-{pages}"
+                start = time.perf_counter()
+                if name == "sequential":
+                    sequential(pipeline, pdf_path, namespace)
+                else:
+                    overlapped(pipeline, pdf_path, namespace, args.workers)
+                seconds = time.perf_counter() - start
+                chunks = len(pipeline.vector_index_manager.backend.open(namespace))
+                print(f"{pages:>6}  {name:<11} {seconds:8.2f} {pages / seconds:8.1f} {chunks:>7}")
+
+
+if __name__ == "__main__":
+    main()
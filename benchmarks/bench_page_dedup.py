@@ -0,0 +1,62 @@
+"""Chunk embeddings saved by near-duplicate page detection.
+
+Runs `NearDuplicateFilter` over the loaded pages of each case file and reports
+the duplicate pages found, the chunk embeddings that skipping them saves, and
+the time the pass takes. Besides the given PDFs, a synthetic case is built in
+which ``--refaxed`` of the pages are appended again, like records faxed twice;
+each copy carries its own dated fax header line.
+
+    python benchmarks/bench_page_dedup.py ["Data/Medical File.pdf" ...] [--pages 500] [--refaxed 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic_pdf import write_case_pdf
+
+from medical_summary_builder.config import settings
+from medical_summary_builder.data_ingestion import PDFMedicalLoader
+from medical_summary_builder.preprocessing import DocumentChunker, NearDuplicateFilter
+
+DEFAULT_PDF = Path(__file__).resolve().parent.parent / "Data" / "Medical File.pdf"
+
+
+def refaxed_case(path: Path, pages: int, share: float) -> Path:
+    """A synthetic case with a random ``share`` of its pages appended a second time under a fax header."""
+
+    return write_case_pdf(path, pages, refaxed=sorted(random.Random(0).sample(range(pages), int(pages * share))))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdfs", type=Path, nargs="*", default=[DEFAULT_PDF])
+    parser.add_argument("--pages", type=int, default=500, help="Pages in the synthetic case before re-faxing.")
+    parser.add_argument("--refaxed", type=float, default=0.2, help="Share of synthetic pages appended again.")
+    args = parser.parse_args()
+
+    chunker = DocumentChunker(settings.chunk_size, settings.chunk_overlap)
+    print(f"{'case':<24} {'pages':>6} {'duplicates':>10} {'clusters':>8} {'chunks':>7} {'saved':>6} {'seconds':>8}")
+    with tempfile.TemporaryDirectory(prefix="msb-bench-") as scratch_name:
+        synthetic = refaxed_case(Path(scratch_name) / "refaxed.pdf", args.pages, args.refaxed)
+        for pdf_path in [*args.pdfs, synthetic]:
+            pages = PDFMedicalLoader(pdf_path, max_workers=settings.pdf_extraction_workers).load()
+            dedup = NearDuplicateFilter(min_similarity=settings.page_dedup_min_similarity)
+            start = time.perf_counter()
+            kept = list(dedup.filter(pages))
+            seconds = time.perf_counter() - start
+
+            chunks = sum(1 for _ in chunker.iter_split(kept))
+            saved = sum(1 for _ in chunker.iter_split(dedup.duplicates))
+            print(
+                f"{pdf_path.name[:24]:<24} {len(pages):>6} {len(dedup.duplicates):>10} "
+                f"{len(dedup.duplicate_pages):>8} {chunks:>7} {saved:>6} {seconds:8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Token volume and retrieval hits for plain-text versus markdown page ingestion.
+
+Loads a case file in each ``PAGE_FORMAT`` (markdown pages also go through the
+repeated header/footer stripper, as in `MedicalSummaryPipeline.iter_source`),
+chunks it, and reports pages, chunks and tokens embedded. Retrieval quality is
+checked offline with BM25 over the chunks: each query has a known answer string,
+and a hit means it appears in the top ``--k`` chunks. Tokens returned for those
+chunks approximate what the agent would read.
+
+    python benchmarks/bench_page_format.py ["Data/Medical File.pdf"] [--k 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from langchain_core.documents import Document
+
+from medical_summary_builder.config import settings
+from medical_summary_builder.data_ingestion import PDFMedicalLoader
+from medical_summary_builder.preprocessing import BoilerplateStripper, DocumentChunker, LexicalPageIndex
+from medical_summary_builder.utils import count_tokens
+
+DEFAULT_PDF = Path(__file__).resolve().parent.parent / "Data" / "Medical File.pdf"
+
+# (query, answer string) pairs for the sample case file.
+QUERIES = [
+    ("claimant date of birth", "05/21/1965"),
+    ("claimant social security number", "456-12-7890"),
+    ("alleged onset date", "07/01/2022"),
+    ("hip x-ray arthritis findings", "arthritis changes in r hip"),
+    ("cervical spine MRI disc herniation", "c4-c5"),
+    ("hemoglobin A1c lab result", "hemoglobin a1c"),
+    ("highest grade of education completed", "grade education"),
+    ("date last insured", "date last insured"),
+]
+
+
+def normalise(text: str) -> str:
+    return " ".join(re.sub(r"[|\\]", " ", text).lower().split())
+
+
+def load(pdf_path: Path, page_format: str) -> tuple[list[Document], float, int]:
+    loader = PDFMedicalLoader(pdf_path, max_workers=settings.pdf_extraction_workers, page_format=page_format)
+    start = time.perf_counter()
+    if page_format == "markdown":
+        stripper = BoilerplateStripper()
+        pages = list(stripper.strip(loader.iter_documents()))
+        removed = stripper.removed_lines
+    else:
+        pages = loader.load()
+        removed = 0
+    return pages, time.perf_counter() - start, removed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", type=Path, nargs="?", default=DEFAULT_PDF)
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    chunker = DocumentChunker(settings.chunk_size, settings.chunk_overlap)
+    print(
+        f"{'format':<9} {'seconds':>8} {'pages':>6} {'boilerplate':>11} {'chunks':>7} "
+        f"{'tokens embedded':>15} {'hits':>6} {'tokens returned':>15}"
+    )
+    for page_format in ("text", "markdown"):
+        pages, seconds, removed = load(args.pdf, page_format)
+        chunks = [Document(page_content=chunk.text, metadata=chunk.metadata) for chunk in chunker.iter_split(pages)]
+        embedded = sum(count_tokens(chunk.page_content) for chunk in chunks)
+
+        index = LexicalPageIndex(chunks)
+        hits = returned = 0
+        for query, answer in QUERIES:
+            results = [doc for doc, _ in index.search(query, k=args.k)]
+            hits += any(answer in normalise(doc.page_content) for doc in results)
+            returned += sum(count_tokens(doc.page_content) for doc in results)
+
+        print(
+            f"{page_format:<9} {seconds:8.2f} {len(pages):>6} {removed:>11} {len(chunks):>7} "
+            f"{embedded:>15} {f'{hits}/{len(QUERIES)}':>6} {returned:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Startup and first-request latency of a warm `MedicalSummaryPipeline`.
+
+Measures pipeline construction, explicit warm-up, and the per-run agent setup
+cost with and without the cached graph. With ``--pdf-path``/``--template-path``
+it also times two consecutive end-to-end runs on the same warm pipeline.
+
+    python benchmarks/bench_pipeline_startup.py [--pdf-path ... --template-path ...]
+
+Requires the same API keys as a normal run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from medical_summary_builder.agents import create_react_agent
+from medical_summary_builder.pipelines import MedicalSummaryPipeline
+from medical_summary_builder.pipelines.orchestrator import AGENT_SYSTEM_PROMPT
+
+
+def timed(label: str, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"{label:<40} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf-path", type=Path)
+    parser.add_argument("--template-path", type=Path)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    pipeline = timed("pipeline construction", MedicalSummaryPipeline)
+    timed("warm_up()", pipeline.warm_up)
+
+    cold = []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        create_react_agent(tools=[], system_prompt=AGENT_SYSTEM_PROMPT, provider="openai")
+        cold.append(time.perf_counter() - start)
+    warm = []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        pipeline._get_summary_agent()
+        warm.append(time.perf_counter() - start)
+    print(f"{'agent setup per run (rebuilt, mean)':<40} {sum(cold) / len(cold):8.4f}s")
+    print(f"{'agent setup per run (cached, mean)':<40} {sum(warm) / len(warm):8.6f}s")
+
+    if args.pdf_path and args.template_path:
+        for label in ("first request", "second request"):
+            timed(
+                label,
+                pipeline.run,
+                pdf_path=args.pdf_path,
+                template_path=args.template_path,
+            )
+
+
+if __name__ == "__main__":
+    main()
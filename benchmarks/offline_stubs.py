@@ -0,0 +1,134 @@
+"""Deterministic local stand-ins for the paid services, for offline benchmarks.
+
+`install()` routes `LLMClientFactory` to `StubChatModel`, `EmbeddingFactory` to a
+hash-seeded fake embedder, and the vector store to the embedded local backend,
+with every on-disk cache redirected to a scratch directory. Call it before
+constructing a `MedicalSummaryPipeline`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from medical_summary_builder.config import settings
+from medical_summary_builder.llm import EmbeddingFactory, LLMClientFactory
+from medical_summary_builder.pipelines.orchestrator import RETRIEVER_TOOL_NAME
+from medical_summary_builder.schemas import ClaimantProfile, MedicalEvent, MedicalSummary
+
+SEARCH_QUERIES = ["claimant profile SSN date of birth", "timeline of medical events provider visit"]
+
+
+def canned_summary(events: int = 20) -> MedicalSummary:
+    start = datetime.date(2022, 1, 3)
+    return MedicalSummary(
+        profile=ClaimantProfile(
+            claimant_name="Jane Q. Doe",
+            ssn="123-45-6789",
+            date_of_birth=datetime.date(1968, 4, 12),
+            alleged_onset_date=datetime.date(2022, 9, 15),
+            date_last_insured=datetime.date(2027, 12, 31),
+            age_at_aod=54,
+            current_age=58,
+            education="12th grade",
+            claim_title="T2",
+        ),
+        events=[
+            MedicalEvent(
+                date=start + datetime.timedelta(days=17 * index),
+                provider=f"Provider {index % 7}",
+                reason="Follow-up visit, stable",
+                reference=f"Pg {index + 2}",
+            )
+            for index in range(events)
+        ],
+    )
+
+
+class StubChatModel(BaseChatModel):
+    """Chat model that searches a fixed number of times, then answers with a canned summary.
+
+    When asked for a structured response (an ``AgentSummary`` tool), it returns the
+    canned summary as that tool call. Decisions depend only on the request, so
+    every run is reproducible.
+    Token usage is estimated from message length to keep telemetry meaningful.
+    """
+
+    answer: str = json.dumps({"profile": {}, "events": [], "custom_tables": {}})
+    searches: int = len(SEARCH_QUERIES)
+
+    @property
+    def _llm_type(self) -> str:
+        return "offline-stub"
+
+    def search_queries(self, messages: list[BaseMessage]) -> list[str]:
+        """The searches to run before answering; override to plan them from the prompt."""
+
+        return [SEARCH_QUERIES[index % len(SEARCH_QUERIES)] for index in range(self.searches)]
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        done = sum(isinstance(message, ToolMessage) for message in messages)
+        tool_names = {tool["function"]["name"] for tool in kwargs.get("tools") or []}
+        queries = self.search_queries(messages)
+        if "AgentSummary" in tool_names:
+            message = AIMessage(
+                content="",
+                tool_calls=[{"name": "AgentSummary", "args": json.loads(self.answer), "id": "call_summary"}],
+            )
+        elif tool_names and done < len(queries):
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": RETRIEVER_TOOL_NAME,
+                        "args": {"query": queries[done]},
+                        "id": f"call_{done}",
+                    }
+                ],
+            )
+        else:
+            message = AIMessage(content=f"JSON output: {self.answer}")
+
+        input_tokens = sum(len(str(item.content)) for item in messages) // 4
+        output_tokens = len(str(message.content)) // 4 + 8
+        message.usage_metadata = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def bind_tools(self, tools: Any, **kwargs: Any):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+
+def install(scratch_dir: Path, *, embedding_size: int = 256) -> None:
+    """Swap in the offline stand-ins and point every cache and output at ``scratch_dir``."""
+
+    answer = canned_summary().model_dump_json()
+    LLMClientFactory.create = staticmethod(lambda **_: StubChatModel(answer=answer))
+    EmbeddingFactory.create = staticmethod(lambda **_: DeterministicFakeEmbedding(size=embedding_size))
+
+    settings.vector_backend = "local"
+    settings.cache_dir = scratch_dir / "cache"
+    settings.outputs_dir = scratch_dir / "outputs"
+    settings.reports_dir = scratch_dir / "outputs" / "reports"
+    settings.diagnostics_dir = scratch_dir / "outputs" / "diagnostics"
+    settings.llm_cache_enabled = False
+    settings.page_cache_enabled = False
+    settings.agent_trace_enabled = False
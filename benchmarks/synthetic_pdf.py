@@ -0,0 +1,173 @@
+"""Deterministic synthetic case files for offline benchmarks.
+
+Writes plain PDF 1.4 by hand (one Helvetica text stream per page, no external
+dependencies) so any page count can be generated quickly and reproducibly.
+The content mimics an SSA case file: a profile page with labelled fields, then
+clinic notes with dates, providers and complaints.
+
+    python benchmarks/synthetic_pdf.py --pages 500 --output /tmp/case-500.pdf
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from pathlib import Path
+from typing import Sequence
+
+PROVIDERS = [
+    "Willow Creek Med Ctr",
+    "Central Plains Med Ctr",
+    "Metro Health & Wellness",
+    "Sterling Health Clinic",
+    "Riverside Orthopedics",
+    "Lakeview Behavioral Health",
+]
+COMPLAINTS = [
+    "hip pain, x-ray shows moderate arthritis",
+    "right hip pain, arthroplasty evaluation",
+    "post-op follow-up, stable gait",
+    "breast lump, hypertension review",
+    "lumbar radiculopathy, MRI ordered",
+    "depression and anxiety, medication refill",
+    "diabetes management, A1c elevated",
+]
+FILLER = (
+    "Patient reports intermittent symptoms. Vitals within normal limits. Assessment and plan discussed "
+    "with the claimant, who verbalised understanding. Continue current medications and follow up as needed."
+)
+
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
+LINES_PER_PAGE = 48
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def page_lines(page_number: int, rng: random.Random) -> list[str]:
+    if page_number == 1:
+        return [
+            "DISABILITY DETERMINATION SERVICES - CASE FILE",
+            "Claimant Name: Jane Q. Doe",
+            "SSN: 123-45-6789",
+            "Date of Birth: 04/12/1968",
+            "Alleged Onset Date: 09/15/2022",
+            "Date Last Insured: 12/31/2027",
+            "Claim Type: Title II (T2)",
+            "Highest grade completed: 12",
+            "Alleged impairments: hip arthritis; hypertension; depression",
+        ]
+
+    year = 2020 + rng.randrange(5)
+    lines = [
+        f"Date of service: {rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/{year}",
+        f"Provider: {rng.choice(PROVIDERS)}",
+        f"Reason for visit: {rng.choice(COMPLAINTS)}",
+    ]
+    words = FILLER.split()
+    while len(lines) < LINES_PER_PAGE:
+        start = rng.randrange(len(words))
+        lines.append(" ".join(words[start:] + words[:start])[:95])
+    return lines
+
+
+def _scanned_page(lines: list[str]) -> tuple[bytes, int, int]:
+    """Render ``lines`` to a 150 dpi greyscale JPEG, like a faxed page with no text layer."""
+
+    from io import BytesIO
+
+    from PIL import Image, ImageDraw, ImageFont
+
+    width, height = PAGE_WIDTH * 150 // 72, PAGE_HEIGHT * 150 // 72
+    image = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=22)
+    for number, line in enumerate(lines):
+        draw.text((100, 100 + number * 28), line, fill=0, font=font)
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=75)
+    return buffer.getvalue(), width, height
+
+
+def fax_header(copy: int, rng: random.Random) -> str:
+    """A fax machine's header line, dated and numbered differently on every transmission."""
+
+    return (
+        f"FAX {rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2024 {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d} "
+        f"FROM (555) 010-{rng.randint(1000, 9999)} TO DDS INTAKE P. {copy:03d}"
+    )
+
+
+def write_case_pdf(
+    path: Path | str, pages: int, *, seed: int = 0, scanned_every: int = 0, refaxed: Sequence[int] = ()
+) -> Path:
+    """Write a ``pages``-page synthetic case file to ``path`` and return it.
+
+    With ``scanned_every=n``, every n-th page is an image-only scan (needs Pillow).
+    Pages whose 0-based index is in ``refaxed`` are appended again at the end with
+    a `fax_header` line on top, like records faxed twice.
+    """
+
+    rng = random.Random(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Object numbers: 1 catalog, 2 page tree, 3 font, then each page's objects in order.
+    objects: dict[int, bytes] = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    page_texts = [page_lines(index + 1, rng) for index in range(pages)]
+    copies = [[fax_header(copy + 1, rng), *page_texts[index]] for copy, index in enumerate(refaxed)]
+    for index, lines in enumerate(page_texts + copies):
+        page_id, content_id = len(objects) + 2, len(objects) + 3
+        kids.append(f"{page_id} 0 R")
+        if scanned_every and index < pages and (index + 1) % scanned_every == 0:
+            image_id = len(objects) + 4
+            jpeg, width, height = _scanned_page(lines)
+            objects[image_id] = (
+                b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceGray "
+                b"/BitsPerComponent 8 /Filter /DCTDecode /Length %d >>\nstream\n%s\nendstream"
+                % (width, height, len(jpeg), jpeg)
+            )
+            stream = f"q {PAGE_WIDTH} 0 0 {PAGE_HEIGHT} 0 0 cm /Im1 Do Q".encode("latin-1")
+            resources = f"/XObject << /Im1 {image_id} 0 R >>"
+        else:
+            text = "\n".join(f"({_escape(line)}) Tj T*" for line in lines)
+            stream = f"BT /F1 10 Tf 12 TL 50 {PAGE_HEIGHT - 50} Td\n{text}\nET".encode("latin-1")
+            resources = "/Font << /F1 3 0 R >>"
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << {resources} >> /Contents {content_id} 0 R >>"
+        ).encode("latin-1")
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode("latin-1")
+
+    with path.open("wb") as handle:
+        handle.write(b"%PDF-1.4\n")
+        offsets = {}
+        for number in sorted(objects):
+            offsets[number] = handle.tell()
+            handle.write(b"%d 0 obj\n%s\nendobj\n" % (number, objects[number]))
+        xref_offset = handle.tell()
+        handle.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for number in sorted(objects):
+            handle.write(b"%010d 00000 n \n" % offsets[number])
+        handle.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset))
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scanned-every", type=int, default=0, help="Make every n-th page an image-only scan.")
+    args = parser.parse_args()
+    print(write_case_pdf(args.output, args.pages, seed=args.seed, scanned_every=args.scanned_every))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 """Agent executors for iterative extraction and table population."""
 
-from .react_agent import create_react_agent
+from .react_agent import create_react_agent, supports_structured_output
 
-__all__ = ["create_react_agent"]
+__all__ = ["create_react_agent", "supports_structured_output"]
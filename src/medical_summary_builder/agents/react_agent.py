@@ -1,23 +1,38 @@
 from __future__ import annotations
 
-from typing import Any, Sequence, Type, Union
+from typing import Sequence, Type, Union
 
+from langchain_core.language_models.chat_models import BaseChatModel
 from langgraph.prebuilt import chat_agent_executor
 from pydantic import BaseModel
 
 from ..llm import LLMClientFactory
 
 
+def supports_structured_output(llm: BaseChatModel) -> bool:
+    """Whether the chat model can honour a ``response_format`` (native or via tool calling)."""
+
+    model_type = type(llm)
+    return (
+        model_type.with_structured_output is not BaseChatModel.with_structured_output
+        or model_type.bind_tools is not BaseChatModel.bind_tools
+    )
+
+
 def create_react_agent(
     tools: Sequence,
     *,
     system_prompt: str | None = None,
-    response_format: Union[Type[BaseModel], tuple[str, Type[BaseModel]], None] = None,
+    response_format: Union[Type[BaseModel], dict, tuple[str, Union[Type[BaseModel], dict]], None] = None,
     provider: str | None = None,
+    llm: BaseChatModel | None = None,
 ):
-    """Instantiate a ReAct-style agent for iterative extraction."""
+    """Instantiate a ReAct-style agent for iterative extraction.
+
+    Pass ``llm`` to reuse an existing chat client (and its connection pool).
+    """
 
-    llm = LLMClientFactory.create(temperature=0.1, provider=provider)
+    llm = llm or LLMClientFactory.create(temperature=0.1, provider=provider)
 
     return chat_agent_executor.create_react_agent(
         model=llm,
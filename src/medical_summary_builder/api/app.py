@@ -1,29 +1,56 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 
+from .. import telemetry
 from ..config import settings
-from ..schemas import MedicalSummary
+from ..pipelines.orchestrator import ExtractionMode
 from ..services import SummaryBuilderService
+from .jobs import JobQueueFullError, JobState, JobSubmission, SummaryJobQueue
+from .uploads import UploadTooLargeError, store_upload
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Medical Summary Builder API")
     service = SummaryBuilderService()
+    jobs = SummaryJobQueue(
+        service,
+        max_workers=settings.api_max_concurrent_jobs,
+        max_queued=settings.api_max_queued_jobs,
+        max_retained=settings.api_max_retained_jobs,
+    )
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):
+        # Build the agent graph and open client connections before accepting traffic.
+        await run_in_threadpool(service.pipeline.warm_up)
+        yield
+        jobs.shutdown()
+
+    app = FastAPI(title="Medical Summary Builder API", lifespan=lifespan)
 
     @app.get("/health", tags=["system"])
     def health_check() -> dict[str, str]:
         return {"status": "ok"}
 
-    @app.post("/summaries", response_model=MedicalSummary, tags=["summaries"])
+    @app.get("/metrics", tags=["system"])
+    def get_metrics() -> dict[str, Any]:
+        """Per-stage timings and LLM/tool usage aggregated over runs since startup."""
+
+        return telemetry.metrics.snapshot()
+
+    @app.post("/summaries", response_model=JobSubmission, status_code=202, tags=["summaries"])
     async def build_summary(
         pdf_file: UploadFile = File(..., description="Medical case PDF"),
         template_file: UploadFile = File(..., description="Summary template DOCX"),
         custom_instruction: Optional[str] = None,
-    ) -> MedicalSummary:
+        extraction_mode: Optional[ExtractionMode] = None,
+    ) -> JobSubmission:
         if pdf_file.content_type != "application/pdf":
             raise HTTPException(status_code=400, detail="pdf_file must be a PDF")
         if template_file.content_type not in {
@@ -32,21 +59,44 @@ def create_app() -> FastAPI:
         }:
             raise HTTPException(status_code=400, detail="template_file must be a DOCX document")
 
-        pdf_path = settings.cache_dir / "uploads" / pdf_file.filename
-        template_path = settings.cache_dir / "uploads" / template_file.filename
-        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        upload_dir = settings.cache_dir / "uploads"
+        try:
+            pdf_path = await store_upload(
+                pdf_file, upload_dir, suffix=".pdf", max_bytes=settings.api_max_upload_bytes
+            )
+            template_path = await store_upload(
+                template_file, upload_dir, suffix=".docx", max_bytes=settings.api_max_upload_bytes
+            )
+        except UploadTooLargeError as exc:
+            raise HTTPException(status_code=413, detail=str(exc)) from exc
+
+        try:
+            job = jobs.submit(
+                pdf_path=pdf_path,
+                template_path=template_path,
+                custom_instruction=custom_instruction,
+                extraction_mode=extraction_mode,
+            )
+        except JobQueueFullError as exc:
+            raise HTTPException(status_code=429, detail=f"Summary queue is full: {exc}") from exc
 
-        pdf_bytes = await pdf_file.read()
-        template_bytes = await template_file.read()
-        pdf_path.write_bytes(pdf_bytes)
-        template_path.write_bytes(template_bytes)
+        return JobSubmission(job_id=job.id, status=job.status)
 
-        summary = service.build_summary(
-            pdf_path=pdf_path,
-            template_path=template_path,
-            custom_instruction=custom_instruction,
-        )
+    @app.get("/summaries/{job_id}", response_model=JobState, tags=["summaries"])
+    def get_summary(job_id: str) -> JobState:
+        job = jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Unknown summary job")
+        return JobState.from_job(job)
 
-        return summary
+    @app.get("/summaries/{job_id}/reports/{report_format}", tags=["summaries"])
+    def get_summary_report(job_id: str, report_format: str) -> FileResponse:
+        job = jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Unknown summary job")
+        report_path: Path | None = job.reports.get(report_format)
+        if report_path is None:
+            raise HTTPException(status_code=404, detail=f"No '{report_format}' report for this job")
+        return FileResponse(report_path, filename=report_path.name)
 
     return app
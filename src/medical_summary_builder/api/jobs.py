@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from .. import telemetry
+from ..config import settings
+from ..schemas import MedicalSummary
+from ..services import SummaryBuilderService
+
+logger = logging.getLogger(__name__)
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when the number of queued jobs has reached ``api_max_queued_jobs``."""
+
+
+@dataclass
+class SummaryJob:
+    id: str
+    status: JobStatus = "queued"
+    created_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    started_at: Optional[datetime.datetime] = None
+    finished_at: Optional[datetime.datetime] = None
+    result: Optional[MedicalSummary] = None
+    reports: dict[str, Path] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class JobSubmission(BaseModel):
+    job_id: str
+    status: JobStatus
+
+
+class JobState(BaseModel):
+    job_id: str
+    status: JobStatus
+    created_at: datetime.datetime
+    started_at: Optional[datetime.datetime] = None
+    finished_at: Optional[datetime.datetime] = None
+    error: Optional[str] = None
+    result: Optional[MedicalSummary] = None
+    reports: list[str] = Field(default_factory=list, description="Report formats available for download")
+
+    @classmethod
+    def from_job(cls, job: SummaryJob) -> "JobState":
+        return cls(
+            job_id=job.id,
+            status=job.status,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            error=job.error,
+            result=job.result,
+            reports=sorted(job.reports),
+        )
+
+
+class SummaryJobQueue:
+    """Run summary builds on a bounded worker pool so request handlers return immediately."""
+
+    def __init__(
+        self,
+        service: SummaryBuilderService,
+        *,
+        max_workers: int,
+        max_queued: int,
+        max_retained: int,
+    ) -> None:
+        self.service = service
+        self.max_queued = max_queued
+        self.max_retained = max_retained
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="summary-job")
+        self._jobs: dict[str, SummaryJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, **build_kwargs: Any) -> SummaryJob:
+        with self._lock:
+            queued = sum(1 for job in self._jobs.values() if job.status == "queued")
+            if queued >= self.max_queued:
+                raise JobQueueFullError(f"{queued} jobs already queued")
+            job = SummaryJob(id=uuid.uuid4().hex)
+            self._jobs[job.id] = job
+            self._prune()
+
+        self._executor.submit(self._run, job, build_kwargs)
+        return job
+
+    def get(self, job_id: str) -> SummaryJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: SummaryJob, build_kwargs: dict[str, Any]) -> None:
+        job.status = "running"
+        job.started_at = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            output_dir = settings.reports_dir / job.id
+            with telemetry.span("summary_job", job_id=job.id):
+                summary = self.service.build_summary(emit_reports=False, **build_kwargs)
+                job.reports = self.service.write_reports(
+                    summary,
+                    output_dir=output_dir,
+                    template_path=build_kwargs.get("template_path"),
+                )
+            job.result = summary
+            job.status = "succeeded"
+        except Exception as exc:
+            logger.exception("Summary job %s failed", job.id)
+            job.error = str(exc)
+            job.status = "failed"
+        finally:
+            job.finished_at = datetime.datetime.now(datetime.timezone.utc)
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs once more than ``max_retained`` are held."""
+
+        finished = [job for job in self._jobs.values() if job.status in {"succeeded", "failed"}]
+        for job in sorted(finished, key=lambda item: item.created_at)[: max(0, len(self._jobs) - self.max_retained)]:
+            del self._jobs[job.id]
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
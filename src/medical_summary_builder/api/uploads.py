@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from ..utils import content_hasher, ensure_directory
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured size limit."""
+
+
+async def store_upload(
+    upload: UploadFile,
+    directory: Path,
+    *,
+    suffix: str,
+    max_bytes: int,
+    chunk_size: int = 1 << 20,
+) -> Path:
+    """Stream an upload to a content-addressed file, reusing an identical stored copy.
+
+    The file is named after its content hash, so identical uploads share one path
+    (and therefore the page-text cache and vector namespace derived from it).
+    """
+
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLargeError(f"{upload.filename} is {upload.size} bytes; limit is {max_bytes}")
+
+    ensure_directory(directory)
+    hasher = content_hasher()
+    size = 0
+    fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            while chunk := await upload.read(chunk_size):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(f"{upload.filename} exceeds the {max_bytes} byte limit")
+                hasher.update(chunk)
+                await run_in_threadpool(handle.write, chunk)
+
+        stored_path = directory / f"{hasher.hexdigest()}{suffix}"
+        if stored_path.exists():
+            os.unlink(tmp_name)
+        else:
+            os.replace(tmp_name, stored_path)
+        return stored_path
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
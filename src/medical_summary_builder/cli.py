@@ -7,7 +7,7 @@ from typing import Optional
 import typer
 
 from .config import settings
-from .services import SummaryBuilderService
+from .services import BatchSummaryRunner, SummaryBuilderService
 
 
 def build(
@@ -18,10 +18,21 @@ def build(
     ),
     skip_reports: bool = typer.Option(False, help="If set, do not emit markdown/DOCX reports."),
     skip_indexing: bool = typer.Option(False, help="If set, skip PDF chunking and vector indexing."),
+    no_page_cache: bool = typer.Option(False, help="If set, bypass the extracted page-text cache for this run."),
+    purge_page_cache: bool = typer.Option(False, help="If set, empty the extracted page-text cache before running."),
+    extraction_mode: Optional[str] = typer.Option(
+        None, help="Extraction engine: 'agent' (ReAct agent over retrieval) or 'map_reduce' (parallel page windows)."
+    ),
 ) -> None:
     """Build a medical summary from the provided case file."""
 
+    if extraction_mode not in {None, "agent", "map_reduce"}:
+        raise typer.BadParameter("must be 'agent' or 'map_reduce'", param_hint="--extraction-mode")
+
     service = SummaryBuilderService()
+    if purge_page_cache:
+        service.pipeline.page_cache.purge()
+        typer.echo("Page-text cache purged.")
     instruction_text: Optional[str] = None
 
     if custom_instruction_file:
@@ -33,19 +44,91 @@ def build(
         custom_instruction=instruction_text,
         emit_reports=not skip_reports,
         skip_indexing=skip_indexing,
+        use_page_cache=not no_page_cache,
+        extraction_mode=extraction_mode,
     )
     typer.echo("Summary generation completed.")
     if settings.reports_dir.exists() and not skip_reports:
         typer.echo(f"Reports saved to: {settings.reports_dir}")
 
 
+def batch(
+    source: Path = typer.Argument(..., exists=True, readable=True, help="Directory of case PDFs, or a manifest file with one PDF path per line."),
+    template_path: Path = typer.Option(..., exists=True, readable=True, help="Path to the medical summary template (DOCX)."),
+    output_dir: Optional[Path] = typer.Option(None, help="Root folder for per-case outputs (default: <reports_dir>/batch)."),
+    custom_instruction_file: Optional[Path] = typer.Option(
+        None, exists=True, readable=True, help="Optional path to a markdown file with custom table instructions."
+    ),
+    workers: int = typer.Option(2, min=1, help="Number of cases processed concurrently."),
+) -> None:
+    """Summarise every case file in a directory or manifest, resuming past completed cases."""
+
+    pdf_paths = BatchSummaryRunner.discover(source)
+    if not pdf_paths:
+        typer.echo(f"No PDF case files found in {source}.")
+        raise typer.Exit(code=1)
+
+    instruction_text: Optional[str] = None
+    if custom_instruction_file:
+        instruction_text = custom_instruction_file.read_text(encoding="utf-8")
+
+    runner = BatchSummaryRunner(
+        SummaryBuilderService(),
+        output_dir=output_dir or settings.reports_dir / "batch",
+        max_workers=workers,
+    )
+    typer.echo(f"Processing {len(pdf_paths)} case files with {workers} workers...")
+    report = runner.run(
+        pdf_paths,
+        template_path=template_path,
+        custom_instruction=instruction_text,
+        on_case_done=lambda pdf_path, status: typer.echo(f"[{status}] {pdf_path}"),
+    )
+
+    typer.echo(
+        f"Completed {len(report.completed)}, skipped {len(report.skipped)}, failed {len(report.failed)} "
+        f"in {report.elapsed_seconds:.1f}s ({report.cases_per_minute:.2f} cases/min)."
+    )
+    typer.echo(f"Outputs saved to: {runner.output_dir}")
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+def replay(
+    trace_path: Path = typer.Argument(..., exists=True, readable=True, help="Run trace saved under <diagnostics_dir>/traces."),
+    template_path: Optional[Path] = typer.Option(
+        None, exists=True, readable=True, help="Optional medical summary template (DOCX) for the DOCX report."
+    ),
+    output_dir: Optional[Path] = typer.Option(None, help="Folder for the regenerated reports (default: <reports_dir>)."),
+    skip_reports: bool = typer.Option(False, help="If set, only print the parsed summary."),
+) -> None:
+    """Rebuild a summary from a saved run trace without calling any model."""
+
+    service = SummaryBuilderService()
+    summary = service.replay_summary(
+        trace_path,
+        template_path=template_path,
+        emit_reports=not skip_reports,
+        output_dir=output_dir,
+    )
+    typer.echo(summary.model_dump_json(indent=2))
+    if not skip_reports:
+        typer.echo(f"Reports saved to: {output_dir or settings.reports_dir}")
+
+
+app = typer.Typer(add_completion=False, help="Medical Summary Builder command-line interface.")
+app.command("build")(build)
+app.command("batch")(batch)
+app.command("replay")(replay)
+
+
 def main() -> None:
-    # Backward compatibility: allow calling `python -m medical_summary_builder.cli build ...`
-    # by stripping the legacy subcommand name before Typer parses arguments.
-    if len(sys.argv) > 1 and sys.argv[1] == "build":
-        sys.argv.pop(1)
+    # Backward compatibility: invocations without a subcommand
+    # (`python -m medical_summary_builder.cli --pdf-path ...`) run `build`.
+    if len(sys.argv) < 2 or sys.argv[1] not in {"build", "batch", "replay", "--help"}:
+        sys.argv.insert(1, "build")
 
-    typer.run(build)
+    app()
 
 
 if __name__ == "__main__":
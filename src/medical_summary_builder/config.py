@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -18,15 +18,39 @@ class Settings(BaseSettings):
     pinecone_api_key: Optional[str] = Field(default=None, env="PINECONE_API_KEY")
     pinecone_environment: Optional[str] = Field(default=None, env="PINECONE_ENVIRONMENT")
     pinecone_index: str = Field(default="medical-summary-index")
+    vector_backend: Literal["pinecone", "local"] = Field(default="pinecone")
 
     model_name: str = Field(default="Qwen/Qwen3-235B-A22B-Thinking-2507")
     nebius_embedding_model: str = Field(default="Qwen/Qwen3-Embedding-8B")
     openai_embedding_model: str = Field(default="text-embedding-3-small")
     embedding_dimensions: int = Field(default=1536)
+    embedding_batch_max_tokens: int = Field(default=8000)
+    embedding_batch_max_inputs: int = Field(default=64)
+    embedding_max_concurrency: int = Field(default=4)
+    embedding_max_retries: int = Field(default=3)
+    embedding_cache_enabled: bool = Field(default=True)
+    embedding_cache_max_bytes: int = Field(default=1024 * 1024 * 1024)
+    llm_cache_enabled: bool = Field(default=True)
+    llm_cache_max_bytes: int = Field(default=1024 * 1024 * 1024)
 
     # Chunking parameters
     chunk_size: int = Field(default=1500)
     chunk_overlap: int = Field(default=200)
+    index_batch_size: int = Field(default=256)
+    index_upsert_workers: int = Field(default=2)
+
+    # PDF extraction parameters
+    pdf_extraction_workers: int = Field(default=4)
+    pdf_pages_per_shard: int = Field(default=50)
+    page_cache_enabled: bool = Field(default=True)
+    page_cache_max_bytes: int = Field(default=512 * 1024 * 1024)
+    page_format: Literal["text", "markdown"] = Field(default="text")
+    page_dedup_enabled: bool = Field(default=True)
+    page_dedup_min_similarity: float = Field(default=0.9)
+    # OCR of text-less (scanned) pages; needs pytesseract and the Tesseract binary.
+    ocr_enabled: bool = Field(default=False)
+    ocr_language: str = Field(default="eng")
+    ocr_cache_max_bytes: int = Field(default=256 * 1024 * 1024)
 
     # Directories
     cache_dir: Path = Field(default=Path(".cache/"))
@@ -37,7 +61,25 @@ class Settings(BaseSettings):
     reports_dir: Path = Field(default=Path("outputs/reports/"))
     diagnostics_dir: Path = Field(default=Path("outputs/diagnostics/"))
 
+    # Extraction behaviour
+    extraction_mode: Literal["agent", "map_reduce"] = Field(default="agent")
+    agent_structured_output: bool = Field(default=True)
+    extraction_window_pages: int = Field(default=3)
+    map_reduce_max_concurrency: int = Field(default=4)
+    metadata_prefill_enabled: bool = Field(default=True)
+    hybrid_retrieval_enabled: bool = Field(default=True)
+    retrieval_top_k: int = Field(default=8)
+    retrieval_max_tokens: int = Field(default=4000)
+    retrieval_max_concurrency: int = Field(default=8)
+
+    # API job queue
+    api_max_concurrent_jobs: int = Field(default=2)
+    api_max_queued_jobs: int = Field(default=16)
+    api_max_retained_jobs: int = Field(default=500)
+    api_max_upload_bytes: int = Field(default=512 * 1024 * 1024)
+
     # Runtime flags
+    agent_trace_enabled: bool = Field(default=True)
     enable_telemetry: bool = Field(default=False)
     dry_run: bool = Field(default=False)
 
@@ -1,11 +1,16 @@
 """Utilities for loading and normalizing source medical documents."""
 
+from .ocr import PageOCR, ocr_available
+from .page_cache import PageTextCache
 from .pdf_loader import PDFMedicalLoader
 from .docx_loader import TemplateLoader
 from .converters import DocumentConverter
 
 __all__ = [
+    "PageOCR",
+    "PageTextCache",
     "PDFMedicalLoader",
     "TemplateLoader",
     "DocumentConverter",
+    "ocr_available",
 ]
@@ -1,10 +1,33 @@
 from __future__ import annotations
 
+import html
+import re
 from pathlib import Path
 from typing import Iterable
 
 from markdownify import markdownify as html_to_markdown
 
+# Two or more spaces separate columns in pypdf's layout-mode output.
+_COLUMN_GAP = re.compile(r"\s{2,}")
+_SPACES = re.compile(r"\s+")
+# A form label without its colon: at most four words, no digits, naming a field ("Patient Name", "DOB").
+_LABEL = re.compile(
+    r"(?i)^(?=(?:\S+\s){0,3}\S+$)[^\d|:]*\b(?:name|date|dob|birth|ssn|social security|sex|gender|age|phone|tel|fax|"
+    r"address|provider|physician|doctor|facility|clinic|diagnosis|dx|mrn|account|acct|id|no|number|claim|claimant|"
+    r"patient|onset|insured|grade|education|title|type|employer|occupation|height|weight|bp|pulse|allergies|"
+    r"medications|impairments?|complaint|reason|referral|status)\b[^\d|:]*$"
+)
+
+
+def _join_cells(cells: list[str]) -> str:
+    """One line for a row of layout columns; only a label cell is joined to its value with a colon."""
+
+    if cells[0].endswith(":"):
+        return f"{cells[0]} {' | '.join(cells[1:])}"
+    if len(cells) == 2 and _LABEL.match(cells[0]):
+        return f"{cells[0]}: {cells[1]}"
+    return " | ".join(cells)
+
 
 class DocumentConverter:
     """Convert source documents into normalized markdown strings."""
@@ -15,6 +38,41 @@ class DocumentConverter:
 
         return html_to_markdown(html_content, heading_style="ATX")
 
+    @staticmethod
+    def layout_page_to_markdown(layout_text: str, *, min_table_rows: int = 3) -> str:
+        """Convert a page extracted with pypdf's ``extraction_mode="layout"`` into compact markdown.
+
+        Runs of at least ``min_table_rows`` lines that split into three or more columns
+        become markdown tables. Other rows keep their cells on one line, as ``key: value``
+        when the first cell is a form label and separated by `` | `` otherwise. Lines
+        have their whitespace collapsed, and runs of blank lines shrink to one.
+        """
+
+        blocks: list[str] = []
+        table: list[list[str]] = []
+
+        def flush_table() -> None:
+            if len(table) >= min_table_rows and max(map(len, table)) >= 3:
+                rows = "".join(
+                    "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>" for row in table
+                )
+                blocks.append(DocumentConverter.pdf_page_to_markdown(f"<table>{rows}</table>").strip())
+            else:
+                blocks.extend(_join_cells(row) for row in table)
+            table.clear()
+
+        for line in layout_text.splitlines():
+            cells = _COLUMN_GAP.split(line.strip())
+            if len(cells) >= 2:
+                table.append(cells)
+                continue
+            flush_table()
+            line = _SPACES.sub(" ", line).strip()
+            if line or (blocks and blocks[-1]):
+                blocks.append(line)
+        flush_table()
+        return "\n".join(blocks).strip()
+
     @staticmethod
     def save_markdown(pages: Iterable[str], output_path: Path | str) -> Path:
         """Persist markdown pages to disk as a single file."""
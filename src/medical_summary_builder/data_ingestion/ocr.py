@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import shutil
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import zstandard
+from pypdf import PageObject
+
+from ..utils import DiskLRUCache
+
+try:  # Optional: `pip install pytesseract` plus the Tesseract binary on PATH.
+    import pytesseract
+except ImportError:  # pragma: no cover - optional dependency
+    pytesseract = None
+
+logger = logging.getLogger(__name__)
+
+# One cache handle per worker process; `DiskLRUCache` holds a lock, so it cannot travel with the pickled settings.
+_worker_caches: dict[tuple[Path, int], DiskLRUCache] = {}
+
+
+def ocr_available() -> bool:
+    """Whether pytesseract is installed and the Tesseract binary can be found."""
+
+    return pytesseract is not None and shutil.which(pytesseract.pytesseract.tesseract_cmd) is not None
+
+
+@lru_cache(maxsize=1)
+def _engine_version() -> str:
+    return f"tesseract-{pytesseract.get_tesseract_version()}"
+
+
+@dataclass
+class OCRStats:
+    pages: int = 0
+    cached: int = 0
+    seconds: float = 0.0
+
+    def add(self, other: "OCRStats") -> None:
+        self.pages += other.pages
+        self.cached += other.cached
+        self.seconds += other.seconds
+
+
+@dataclass(frozen=True)
+class PageOCR:
+    """Tesseract OCR for pages without a text layer, cached by the hash of the page's images.
+
+    Instances are picklable so they can be handed to extraction worker processes.
+    """
+
+    language: str = "eng"
+    cache_path: Path | None = None
+    cache_max_bytes: int = 256 * 1024 * 1024
+
+    def _cache(self) -> DiskLRUCache | None:
+        if self.cache_path is None:
+            return None
+        key = (self.cache_path, self.cache_max_bytes)
+        if key not in _worker_caches:
+            _worker_caches[key] = DiskLRUCache(self.cache_path, max_bytes=self.cache_max_bytes)
+        return _worker_caches[key]
+
+    def page_text(self, page: PageObject, stats: OCRStats) -> str:
+        """OCR every image on ``page``; returns "" for pages without images or on engine errors."""
+
+        start = time.perf_counter()
+        try:
+            images = list(page.images)
+        except Exception as exc:  # pypdf raises a variety of errors on unusual image filters
+            logger.warning("Could not read images for OCR: %s", exc)
+            return ""
+        if not images:
+            return ""
+
+        digest = hashlib.sha256()
+        for image in images:
+            digest.update(image.data)
+        key = f"{digest.hexdigest()}:{_engine_version()}:{self.language}"
+        cache = self._cache()
+        if cache is not None and (cached := cache.get(key)) is not None:
+            stats.cached += 1
+            return zstandard.decompress(cached).decode("utf-8")
+
+        try:
+            text = "\n".join(pytesseract.image_to_string(image.image, lang=self.language).strip() for image in images)
+        except (pytesseract.TesseractError, OSError, ValueError) as exc:
+            logger.warning("OCR failed for page %s: %s", page.page_number, exc)
+            return ""
+        stats.pages += 1
+        stats.seconds += time.perf_counter() - start
+        if cache is not None:
+            cache.put(key, zstandard.compress(text.encode("utf-8"), 3))
+        return text
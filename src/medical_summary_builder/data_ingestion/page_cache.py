@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Mapping
+
+import pypdf
+import zstandard
+
+from ..utils import DiskLRUCache
+
+# Bump whenever page text extraction changes so stale entries are never served.
+EXTRACTOR_VERSION = f"pypdf-{pypdf.__version__}-v1"
+
+
+class PageTextCache:
+    """Content-addressed cache of extracted page text, keyed by PDF hash and page index."""
+
+    def __init__(self, path: Path | str, *, max_bytes: int, extractor_version: str = EXTRACTOR_VERSION) -> None:
+        self.store = DiskLRUCache(path, max_bytes=max_bytes)
+        self.extractor_version = extractor_version
+
+    def _key(self, pdf_hash: str, page_index: int) -> str:
+        return f"{pdf_hash}:{self.extractor_version}:{page_index}"
+
+    def get_pages(self, pdf_hash: str, page_indices: Iterable[int]) -> dict[int, str]:
+        """Return the cached text for whichever of ``page_indices`` are present."""
+
+        keys = {self._key(pdf_hash, index): index for index in page_indices}
+        found = self.store.get_many(keys)
+        return {keys[key]: zstandard.decompress(value).decode("utf-8") for key, value in found.items()}
+
+    def put_pages(self, pdf_hash: str, pages: Mapping[int, str]) -> None:
+        self.store.put_many(
+            {
+                self._key(pdf_hash, index): zstandard.compress(text.encode("utf-8"), 3)
+                for index, text in pages.items()
+            }
+        )
+
+    def purge(self) -> None:
+        self.store.purge()
@@ -1,47 +1,209 @@
 from __future__ import annotations
 
+import heapq
+import logging
+import math
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Literal, Sequence
 
 from langchain_core.documents import Document
-from pypdf import PdfReader
+from pypdf import PageObject, PdfReader
+
+from ..utils import file_digest
+from .converters import DocumentConverter
+from .ocr import OCRStats, PageOCR
+from .page_cache import PageTextCache
+
+logger = logging.getLogger(__name__)
+
+PageFormat = Literal["text", "markdown"]
+
+
+# Per-worker-process reader, so the PDF structure is parsed once per worker, not once per shard.
+_worker_reader: tuple[str, PdfReader] | None = None
+
+
+def _page_text(page: PageObject, ocr: PageOCR | None, stats: OCRStats, page_format: PageFormat = "text") -> str:
+    if page_format == "markdown":
+        try:
+            text = page.extract_text(extraction_mode="layout") or ""
+        except Exception as exc:  # layout mode is stricter about malformed fonts than plain mode
+            logger.debug("Layout extraction failed on page %s, using plain text: %s", page.page_number, exc)
+            text = page.extract_text() or ""
+    else:
+        text = page.extract_text() or ""
+    if ocr is not None and not text.strip():
+        text = ocr.page_text(page, stats)
+    if page_format == "markdown":
+        text = DocumentConverter.layout_page_to_markdown(text)
+    return text
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """Start method for extraction workers: forkserver, or spawn where it is unavailable.
+
+    Loaders run on API job and batch threads, and forking a multithreaded process
+    can copy locks held by other threads into the child, deadlocking it.
+    """
+
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _extract_pages(
+    path: str,
+    page_indices: Sequence[int],
+    ocr: PageOCR | None = None,
+    page_format: PageFormat = "text",
+) -> tuple[list[str], OCRStats]:
+    """Extract the text of the given pages in a worker process, OCR-ing text-less pages if enabled."""
+
+    global _worker_reader
+    if _worker_reader is None or _worker_reader[0] != path:
+        _worker_reader = (path, PdfReader(path))
+    reader = _worker_reader[1]
+    stats = OCRStats()
+    return [_page_text(reader.pages[index], ocr, stats, page_format) for index in page_indices], stats
 
 
 class PDFMedicalLoader:
     """Load medical PDF source files into LangChain `Document` objects."""
 
-    def __init__(self, path: Path | str, *, include_empty: bool = False) -> None:
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        include_empty: bool = False,
+        max_workers: int = 1,
+        pages_per_shard: int = 50,
+        cache: PageTextCache | None = None,
+        ocr: PageOCR | None = None,
+        page_format: PageFormat = "text",
+    ) -> None:
         self.path = Path(path)
         self.include_empty = include_empty
+        # More processes than cores only adds spawn and IPC overhead.
+        self.max_workers = max(1, min(max_workers, os.cpu_count() or 1))
+        self.pages_per_shard = max(1, pages_per_shard)
+        self.cache = cache
+        self.ocr = ocr
+        self.page_format = page_format
+        self.ocr_stats = OCRStats()
 
     def load(self) -> list[Document]:
         """Return a list of `Document` chunks — one per PDF page."""
 
+        return list(self.iter_documents())
+
+    def iter_documents(self) -> Iterator[Document]:
+        """Yield one `Document` per page, in page order, as extraction completes.
+
+        With ``max_workers > 1`` page ranges are sharded across a process pool so
+        downstream consumers can start on early pages while later ones are parsed.
+        Pages already present in the page cache are served without re-parsing.
+        With ``ocr`` set, pages without a text layer are OCR'd in the same workers,
+        and cached blank pages are retried. ``page_format="markdown"`` extracts the
+        layout-preserving text instead and converts each page to compact markdown.
+        """
+
         if not self.path.exists():
             raise FileNotFoundError(f"PDF source not found: {self.path}")
 
         reader = PdfReader(str(self.path))
         total_pages = len(reader.pages)
-        documents: list[Document] = []
 
-        for page_index, page in enumerate(reader.pages, start=1):
-            text = page.extract_text() or ""
+        pdf_hash: str | None = None
+        cached: dict[int, str] = {}
+        if self.cache is not None:
+            pdf_hash = file_digest(self.path)
+            if self.page_format != "text":
+                pdf_hash = f"{pdf_hash}:{self.page_format}"
+            cached = self.cache.get_pages(pdf_hash, range(total_pages))
+            if self.ocr is not None:
+                cached = {index: text for index, text in cached.items() if text.strip()}
+        missing = [index for index in range(total_pages) if index not in cached]
+
+        # OCR costs seconds per page, so spread even short runs of pages across every worker.
+        shard_size = self.pages_per_shard
+        if self.ocr is not None:
+            shard_size = max(1, min(shard_size, math.ceil(len(missing) / self.max_workers)))
+        self.ocr_stats = OCRStats()
+        if self.max_workers == 1 or len(missing) <= shard_size:
+            extracted = self._iter_sequential_page_texts(reader, missing)
+        else:
+            extracted = self._iter_parallel_page_texts(missing, shard_size)
+        del reader
+
+        if pdf_hash is not None:
+            extracted = self._store_in_cache(pdf_hash, extracted)
+
+        for page_index, text in heapq.merge(sorted(cached.items()), extracted):
             if text.strip() or self.include_empty:
-                documents.append(
-                    Document(
-                        page_content=text,
-                        metadata={
-                            "source": str(self.path),
-                            "page_number": page_index,
-                            "page_label": f"{page_index}/{total_pages}",
-                        },
-                    )
-                )
-
-        return documents
+                yield self._build_document(text, page_index + 1, total_pages)
+
+        if self.ocr_stats.pages or self.ocr_stats.cached:
+            logger.info(
+                "OCR'd %d text-less pages of %s (%d more from cache) at %.2f pages/s per core.",
+                self.ocr_stats.pages,
+                self.path.name,
+                self.ocr_stats.cached,
+                self.ocr_stats.pages / self.ocr_stats.seconds if self.ocr_stats.seconds else 0.0,
+            )
 
     def iter_text(self) -> Iterable[str]:
         """Yield the raw text of each page for lightweight processing."""
 
-        for document in self.load():
+        for document in self.iter_documents():
             yield document.page_content
+
+    def _iter_sequential_page_texts(self, reader: PdfReader, page_indices: Sequence[int]) -> Iterator[tuple[int, str]]:
+        for index in page_indices:
+            yield index, _page_text(reader.pages[index], self.ocr, self.ocr_stats, self.page_format)
+
+    def _iter_parallel_page_texts(self, page_indices: Sequence[int], shard_size: int) -> Iterator[tuple[int, str]]:
+        shards = iter(page_indices[start : start + shard_size] for start in range(0, len(page_indices), shard_size))
+        executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=_worker_context())
+        # Keep a bounded window of shards in flight so memory stays flat on huge files.
+        pending: deque[tuple[Sequence[int], Future[tuple[list[str], OCRStats]]]] = deque()
+
+        def submit_next() -> None:
+            shard = next(shards, None)
+            if shard is not None:
+                pending.append((shard, executor.submit(_extract_pages, str(self.path), shard, self.ocr, self.page_format)))
+
+        try:
+            for _ in range(self.max_workers * 2):
+                submit_next()
+            while pending:
+                shard, future = pending.popleft()
+                texts, stats = future.result()
+                self.ocr_stats.add(stats)
+                submit_next()
+                yield from zip(shard, texts)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _store_in_cache(self, pdf_hash: str, page_texts: Iterator[tuple[int, str]]) -> Iterator[tuple[int, str]]:
+        buffer: dict[int, str] = {}
+        for page_index, text in page_texts:
+            buffer[page_index] = text
+            if len(buffer) >= self.pages_per_shard:
+                self.cache.put_pages(pdf_hash, buffer)
+                buffer = {}
+            yield page_index, text
+        if buffer:
+            self.cache.put_pages(pdf_hash, buffer)
+
+    def _build_document(self, text: str, page_number: int, total_pages: int) -> Document:
+        return Document(
+            page_content=text,
+            metadata={
+                "source": str(self.path),
+                "page_number": page_number,
+                "page_label": f"{page_number}/{total_pages}",
+            },
+        )
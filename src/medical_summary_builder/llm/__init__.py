@@ -1,9 +1,13 @@
 """LLM client wrappers and factories."""
 
 from .client import LLMClientFactory
+from .embedding_cache import CachedEmbeddings
 from .embeddings import EmbeddingFactory
+from .response_cache import DiskLLMCache
 
 __all__ = [
+    "CachedEmbeddings",
+    "DiskLLMCache",
     "LLMClientFactory",
     "EmbeddingFactory",
 ]
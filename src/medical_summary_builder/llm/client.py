@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Literal, Optional
 
 from langchain_openai import ChatOpenAI
 from langchain_nebius import ChatNebius
+from langchain_core.caches import BaseCache
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from ..config import settings
+from ..utils import DiskLRUCache
+from .response_cache import DiskLLMCache
 
 ModelProvider = Literal["nebius", "openai"]
 
 
+@lru_cache(maxsize=1)
+def shared_response_cache() -> DiskLLMCache:
+    """Process-wide LLM response cache, so every client shares one store and its counters."""
+
+    return DiskLLMCache(DiskLRUCache(settings.cache_dir / "llm_responses.sqlite3", max_bytes=settings.llm_cache_max_bytes))
+
+
 class LLMClientFactory:
     """Factory for chat completion models used throughout the pipeline."""
 
@@ -20,9 +31,13 @@ class LLMClientFactory:
         provider: ModelProvider | None = "openai",#None,
         model_name: Optional[str] = None,
         temperature: float = 0.2,
+        cache: BaseCache | None = None,
     ) -> BaseChatModel:
         selected_provider: ModelProvider
 
+        if cache is None and settings.llm_cache_enabled:
+            cache = shared_response_cache()
+
         if provider is not None:
             selected_provider = provider
         elif settings.nebius_api_key:
@@ -37,6 +52,7 @@ class LLMClientFactory:
                 model=model_name or settings.model_name,
                 temperature=temperature,
                 nebius_api_key=settings.nebius_api_key,
+                cache=cache,
             )
 
         if not settings.openai_api_key:
@@ -46,4 +62,5 @@ class LLMClientFactory:
             model=model_name or "gpt-5-nano",
             # temperature=temperature,
             api_key=settings.openai_api_key,
+            cache=cache,
         )
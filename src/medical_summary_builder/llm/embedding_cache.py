@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from array import array
+from typing import List, Sequence, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from ..utils import DiskLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that persists vectors keyed by text hash, model and dimensions.
+
+    Vectors are stored as packed float32 in a size-bounded `DiskLRUCache`, so
+    boilerplate chunks and recurring agent queries are embedded once across cases.
+    When the inner embeddings can report which model produced each vector
+    (``embed_with_models``), vectors from a fallback model are stored under that
+    model's key and never served as the primary model's.
+    """
+
+    def __init__(self, inner: Embeddings, store: DiskLRUCache, *, model_name: str, dimensions: int) -> None:
+        self.inner = inner
+        self.store = store
+        self.model_name = model_name
+        self.dimensions = dimensions
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _key(self, text: str, kind: str, model_name: str | None = None) -> str:
+        payload = f"{model_name or self.model_name}\0{self.dimensions}\0{kind}\0{text}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def _embed_missing(self, texts: List[str], kind: str) -> Sequence[Tuple[str, List[float]]]:
+        """Embed cache misses, pairing each vector with the model that produced it."""
+
+        embed_with_models = getattr(self.inner, "embed_with_models", None)
+        if embed_with_models is not None:
+            return embed_with_models(texts)
+        if kind == "query":
+            return [(self.model_name, self.inner.embed_query(texts[0]))]
+        return [(self.model_name, vector) for vector in self.inner.embed_documents(texts)]
+
+    def _lookup(self, texts: List[str], kind: str) -> List[List[float]]:
+        keys = [self._key(text, kind) for text in texts]
+        cached = self.store.get_many(set(keys))
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+
+        vectors = {key: array("f", value).tolist() for key, value in cached.items()}
+        if missing:
+            fresh = self._embed_missing(list(missing.values()), kind)
+            stored: dict[str, bytes] = {}
+            for (key, text), (model_name, vector) in zip(missing.items(), fresh):
+                vectors[key] = vector
+                store_key = key if model_name == self.model_name else self._key(text, kind, model_name)
+                stored[store_key] = array("f", vector).tobytes()
+            self.store.put_many(stored)
+
+        with self._lock:
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+        logger.debug("Embedding cache: %d/%d hits (%s).", len(texts) - len(missing), len(texts), kind)
+        return [vectors[key] for key in keys]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self._lookup(texts, "document")
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._lookup([text], "query")[0]
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "stored_bytes": self.store.total_bytes(),
+        }
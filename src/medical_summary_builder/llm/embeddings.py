@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 import openai
 from langchain_core.embeddings import Embeddings
 from langchain_core.pydantic_v1 import PrivateAttr
 from langchain_openai import OpenAIEmbeddings
+from tenacity import Retrying, stop_after_attempt, wait_exponential
 
 from ..config import settings
+from ..utils import DiskLRUCache, count_tokens
+from .embedding_cache import CachedEmbeddings
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +22,8 @@ class NebiusOpenAIEmbeddings(Embeddings):
     """
     Custom embeddings that prioritize Nebius and fall back to OpenAI.
     Truncates embeddings to a specified dimension.
+    Inputs are split into token-budgeted batches that are embedded concurrently;
+    only batches that still fail after retries are re-sent to OpenAI.
     """
 
     _nebius_client: Optional[openai.OpenAI] = PrivateAttr(default=None)
@@ -36,45 +43,98 @@ class NebiusOpenAIEmbeddings(Embeddings):
                 dimensions=settings.embedding_dimensions,
             )
 
+    @property
+    def model_name(self) -> str:
+        """Name of the primary embedding model, used to key cached vectors."""
+
+        if self._nebius_client:
+            return settings.nebius_embedding_model
+        return settings.openai_embedding_model
+
     def _get_nebius_embeddings(self, texts: List[str]) -> List[List[float]]:
         if not self._nebius_client:
             raise RuntimeError("Nebius client not configured. NEBIUS_API_KEY missing?")
 
-        response = self._nebius_client.embeddings.create(model=settings.nebius_embedding_model, input=texts)
+        for attempt in Retrying(
+            stop=stop_after_attempt(settings.embedding_max_retries),
+            wait=wait_exponential(multiplier=0.5, max=8),
+            reraise=True,
+        ):
+            with attempt:
+                response = self._nebius_client.embeddings.create(model=settings.nebius_embedding_model, input=texts)
         return [item.embedding for item in response.data]
 
     def _truncate_embeddings(self, embeddings: List[List[float]]) -> List[List[float]]:
         return [emb[: settings.embedding_dimensions] for emb in embeddings]
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+    @staticmethod
+    def _batch_texts(texts: List[str]) -> List[List[str]]:
+        """Split texts into contiguous batches that respect the per-request token and input limits."""
+
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = count_tokens(text)
+            if current and (
+                current_tokens + tokens > settings.embedding_batch_max_tokens
+                or len(current) >= settings.embedding_batch_max_inputs
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _embed_batch_with_model(self, texts: List[str]) -> Tuple[str, List[List[float]]]:
+        """Embed one batch with Nebius, falling back to OpenAI for this batch only; returns the model used."""
+
         if self._nebius_client:
             try:
-                logger.info("Attempting to use Nebius for embeddings.")
-                embeddings = self._get_nebius_embeddings(texts)
-                return self._truncate_embeddings(embeddings)
+                return settings.nebius_embedding_model, self._truncate_embeddings(self._get_nebius_embeddings(texts))
             except Exception as e:
-                logger.warning(f"Nebius embedding failed: {e}. Falling back to OpenAI.")
+                logger.warning(f"Nebius embedding failed for a batch of {len(texts)} texts: {e}. Falling back to OpenAI.")
 
         if self._openai_client:
-            logger.info("Using OpenAI for embeddings.")
-            return self._openai_client.embed_documents(texts)
+            return settings.openai_embedding_model, self._openai_client.embed_documents(texts)
 
         raise ValueError("No embedding client configured. Set NEBIUS_API_KEY or OPENAI_API_KEY.")
 
-    def embed_query(self, text: str) -> List[float]:
-        if self._nebius_client:
-            try:
-                logger.info("Attempting to use Nebius for query embedding.")
-                embeddings = self._get_nebius_embeddings([text])
-                return self._truncate_embeddings(embeddings)[0]
-            except Exception as e:
-                logger.warning(f"Nebius query embedding failed: {e}. Falling back to OpenAI.")
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return self._embed_batch_with_model(texts)[1]
 
-        if self._openai_client:
-            logger.info("Using OpenAI for query embedding.")
-            return self._openai_client.embed_query(text)
+    def embed_with_models(self, texts: List[str]) -> List[Tuple[str, List[float]]]:
+        """Embed like `embed_documents`, pairing each vector with the model that produced it."""
 
-        raise ValueError("No embedding client configured. Set NEBIUS_API_KEY or OPENAI_API_KEY.")
+        batches = self._batch_texts(texts)
+        if len(batches) <= 1:
+            results = [self._embed_batch_with_model(texts)] if texts else []
+        else:
+            logger.info("Embedding %d texts in %d batches.", len(texts), len(batches))
+            with ThreadPoolExecutor(max_workers=min(settings.embedding_max_concurrency, len(batches))) as executor:
+                results = list(executor.map(self._embed_batch_with_model, batches))
+        return [(model_name, embedding) for model_name, batch in results for embedding in batch]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [embedding for _, embedding in self.embed_with_models(texts)]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        semaphore = asyncio.Semaphore(settings.embedding_max_concurrency)
+
+        async def embed(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._embed_batch, batch)
+
+        results = await asyncio.gather(*(embed(batch) for batch in self._batch_texts(texts)))
+        return [embedding for batch in results for embedding in batch]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed_batch([text])[0]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await asyncio.to_thread(self._embed_batch, [text]))[0]
 
 
 class EmbeddingFactory:
@@ -83,4 +143,13 @@ class EmbeddingFactory:
     @staticmethod
     def create(*, provider: Optional[str] = None, model_name: Optional[str] = None) -> Embeddings:
         # provider and model_name are ignored to support the new Nebius-first with OpenAI fallback logic.
-        return NebiusOpenAIEmbeddings()
+        embeddings = NebiusOpenAIEmbeddings()
+        if not settings.embedding_cache_enabled:
+            return embeddings
+
+        return CachedEmbeddings(
+            embeddings,
+            DiskLRUCache(settings.cache_dir / "embeddings.sqlite3", max_bytes=settings.embedding_cache_max_bytes),
+            model_name=embeddings.model_name,
+            dimensions=settings.embedding_dimensions,
+        )
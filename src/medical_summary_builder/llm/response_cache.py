@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Optional
+
+import zstandard
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+from ..utils import DiskLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class DiskLLMCache(BaseCache):
+    """LangChain LLM cache persisted in a size-bounded `DiskLRUCache`.
+
+    Keys hash the serialised model configuration (model, parameters, bound tools)
+    together with the full prompt, which for chat models includes every prior tool
+    result, so a re-run of an unchanged case replays each agent turn from disk.
+    """
+
+    def __init__(self, store: DiskLRUCache) -> None:
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        blob = self.store.get(self._key(prompt, llm_string))
+        generations = None
+        if blob is not None:
+            try:
+                generations = [loads(item) for item in json.loads(zstandard.decompress(blob))]
+            except Exception as exc:
+                logger.warning("Discarding unreadable LLM cache entry: %s", exc)
+
+        with self._lock:
+            if generations is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        payload = json.dumps([dumps(generation) for generation in return_val]).encode("utf-8")
+        self.store.put(self._key(prompt, llm_string), zstandard.compress(payload, 3))
+
+    def clear(self, **kwargs: Any) -> None:
+        self.store.purge()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
@@ -1,5 +1,6 @@
 """Pipeline orchestration utilities."""
 
+from .map_reduce import MapReduceExtractor, MapReduceResult
 from .orchestrator import MedicalSummaryPipeline
 
-__all__ = ["MedicalSummaryPipeline"]
+__all__ = ["MapReduceExtractor", "MapReduceResult", "MedicalSummaryPipeline"]
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+from langchain_core.documents import Document
+from langchain_core.language_models.chat_models import BaseChatModel
+
+from .. import telemetry
+from ..preprocessing import page_citation
+from ..schemas import ClaimantProfile, MedicalEvent, MedicalSummary
+
+logger = logging.getLogger(__name__)
+
+WINDOW_PROMPT = (
+    "You are given {page_count} consecutive pages of a medical case file. Extract only what these pages state.\n"
+    "Return JSON with keys 'profile', 'events', and 'custom_tables'.\n"
+    "The 'profile' object may include claimant_name, ssn, date_of_birth, alleged_onset_date, date_last_insured, "
+    "age_at_aod, current_age, education, claim_title; omit fields these pages do not mention.\n"
+    "The 'events' array lists every medical visit, test, or procedure as objects with keys date (MM/DD/YYYY), "
+    "provider, reason, and reference (the page label, e.g. Pg 12). A visit is identified by its date and provider.\n"
+    "The 'custom_tables' object maps table names to arrays of row dictionaries (use an empty object if none).\n"
+    "Return empty values rather than guessing."
+)
+
+
+@dataclass
+class MapReduceResult:
+    """Merged summary plus the per-run cost of the map phase."""
+
+    summary: MedicalSummary
+    windows: int = 0
+    failed_windows: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    elapsed_seconds: float = 0.0
+    responses: list[str] = field(default_factory=list)
+
+
+class MapReduceExtractor:
+    """Extract a summary window by window, then merge the partial results.
+
+    Each window of ``window_size`` consecutive pages is sent to the LLM as one
+    independent request, with at most ``max_concurrency`` in flight. Partial
+    profiles are merged field by field in page order and events are de-duplicated
+    on (date, provider), so cost grows linearly with the page count instead of
+    with the number of sequential agent turns.
+    """
+
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        *,
+        parse: Callable[[str], Any],
+        window_size: int = 3,
+        max_concurrency: int = 4,
+    ) -> None:
+        self.llm = llm
+        self.parse = parse
+        self.window_size = max(1, window_size)
+        self.max_concurrency = max(1, max_concurrency)
+
+    def windows(self, pages: Sequence[Document]) -> list[list[Document]]:
+        return [list(pages[start : start + self.window_size]) for start in range(0, len(pages), self.window_size)]
+
+    def extract(self, pages: Sequence[Document], *, custom_instruction: Optional[str] = None) -> MapReduceResult:
+        start = time.perf_counter()
+        windows = self.windows(pages)
+        prompts = [self._window_prompt(window, custom_instruction) for window in windows]
+        responses = self.llm.batch(
+            prompts,
+            config={"max_concurrency": self.max_concurrency, "callbacks": telemetry.callbacks()},
+            return_exceptions=True,
+        )
+
+        result = MapReduceResult(summary=MedicalSummary(), windows=len(windows))
+        for window, response in zip(windows, responses):
+            if isinstance(response, Exception):
+                logger.warning("Window starting at page %s failed: %s", window[0].metadata.get("page_number"), response)
+                result.responses.append("")
+                continue
+            usage = getattr(response, "usage_metadata", None) or {}
+            result.input_tokens += usage.get("input_tokens", 0)
+            result.output_tokens += usage.get("output_tokens", 0)
+            result.responses.append(self._response_text(response))
+
+        result.summary, result.failed_windows = self.merge(result.responses)
+        result.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            "Map-reduce extraction: %d windows (%d failed), %d events after merge, %d input / %d output tokens in %.1fs.",
+            result.windows,
+            result.failed_windows,
+            len(result.summary.events),
+            result.input_tokens,
+            result.output_tokens,
+            result.elapsed_seconds,
+        )
+        return result
+
+    def merge(self, responses: Sequence[str]) -> tuple[MedicalSummary, int]:
+        """Parse raw window responses and reduce them; returns the summary and the unparsable count.
+
+        Kept separate from the LLM calls so a saved trace can be replayed offline.
+        """
+
+        partials = [self.parse(text) if text else None for text in responses]
+        return self.reduce([partial for partial in partials if partial is not None]), partials.count(None)
+
+    def reduce(self, partials: Sequence[Any]) -> MedicalSummary:
+        """Merge window results: first value per profile field, events unique on (date, provider)."""
+
+        profile_values: dict[str, Any] = {}
+        events: dict[tuple[Any, str], MedicalEvent] = {}
+        custom_tables: dict[str, list[dict[str, str]]] = {}
+        seen_rows: set[tuple[str, tuple[tuple[str, str], ...]]] = set()
+
+        for partial in partials:
+            for name, value in partial.profile.model_dump().items():
+                if name not in profile_values and value not in (None, "", "N/A"):
+                    profile_values[name] = value
+
+            for event in partial.events:
+                key = (event.date, self._provider_key(event.provider))
+                existing = events.get(key)
+                if existing is None:
+                    events[key] = event.model_copy()
+                    continue
+                if not existing.reason and event.reason:
+                    existing.reason = event.reason
+                existing.reference = self._merge_references(existing.reference, event.reference)
+
+            for table_name, rows in partial.custom_tables.items():
+                for row in rows:
+                    row_key = (table_name, tuple(sorted(row.items())))
+                    if row_key not in seen_rows:
+                        seen_rows.add(row_key)
+                        custom_tables.setdefault(table_name, []).append(row)
+
+        ordered_events = sorted(events.values(), key=lambda event: (event.date is None, event.date or datetime.date.min))
+        return MedicalSummary(
+            profile=ClaimantProfile(**profile_values),
+            events=ordered_events,
+            custom_tables=custom_tables,
+        )
+
+    def _window_prompt(self, window: Sequence[Document], custom_instruction: Optional[str]) -> str:
+        parts = [WINDOW_PROMPT.format(page_count=len(window))]
+        if custom_instruction:
+            parts.append("Custom table guidance:\n" + custom_instruction)
+        parts.append("Pages:")
+        parts.extend(
+            f"[Page: {page_citation(doc.metadata)}]\n{doc.page_content}"
+            for doc in window
+        )
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        content = getattr(response, "content", response)
+        if isinstance(content, list):
+            content = "".join(part if isinstance(part, str) else str(part.get("text", "")) for part in content)
+        return content if isinstance(content, str) else ""
+
+    @staticmethod
+    def _provider_key(provider: Optional[str]) -> str:
+        return re.sub(r"[^a-z0-9]+", " ", (provider or "").lower()).strip()
+
+    @staticmethod
+    def _merge_references(first: Optional[str], second: Optional[str]) -> Optional[str]:
+        references: list[str] = []
+        for value in (first, second):
+            for reference in (value or "").split(","):
+                reference = reference.strip()
+                if reference and reference not in references:
+                    references.append(reference)
+        return ", ".join(references) or None
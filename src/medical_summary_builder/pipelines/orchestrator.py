@@ -2,30 +2,114 @@ from __future__ import annotations
 
 import logging
 import json
+import re
 import datetime
 import ast
-from dataclasses import dataclass
+import copy
+import hashlib
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Iterator, Literal, Optional
 
-from langchain.tools.retriever import create_retriever_tool
 from langchain_core.documents import Document
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage, messages_from_dict, messages_to_dict
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field, ValidationError
 
-from ..agents import create_react_agent
+from .. import telemetry
+from ..agents import create_react_agent, supports_structured_output
 from ..config import settings
-from ..data_ingestion import DocumentConverter, PDFMedicalLoader, TemplateLoader
+from ..data_ingestion import DocumentConverter, PageOCR, PageTextCache, PDFMedicalLoader, TemplateLoader, ocr_available
 from ..logging_config import configure_logging
-from ..preprocessing import DocumentChunker, MetadataRouter, PageRelevanceRanker
+from ..preprocessing import (
+    BoilerplateStripper,
+    DocumentChunker,
+    LexicalPageIndex,
+    MetadataRecord,
+    MetadataRouter,
+    NearDuplicateFilter,
+    PageRelevanceRanker,
+    page_citation,
+)
 from ..schemas import ClaimantProfile, MedicalEvent, MedicalSummary
-from ..utils import ensure_directory
-from ..vectorstore import VectorIndexManager
-from ..llm import EmbeddingFactory, LLMClientFactory
+from ..utils import count_tokens, ensure_directory, file_digest, load_json, save_json
+from ..vectorstore import HybridRetriever, VectorIndexManager, search_many
+from ..llm import CachedEmbeddings, EmbeddingFactory, LLMClientFactory
+from .map_reduce import MapReduceExtractor, MapReduceResult
 
+ExtractionMode = Literal["agent", "map_reduce"]
 
 logger = logging.getLogger(__name__)
 
+RETRIEVER_TOOL_NAME = "medical_record_search"
+RETRIEVER_TOOL_DESCRIPTION = (
+    "Searches and returns information from the claimant's medical records. "
+    "Please use different keywords to search in parallel until you have all needed evidences."
+)
+
+AGENT_SYSTEM_PROMPT = (
+    "You are an expert at extracting information from medical records. "
+    "First, use the supplied tool multiple times (using different kinds of keywords to search in parallel) and iteratively to gather all required authoritative evidence. "
+    "Populate all of these key profile fields: Claimant Name, SSN, Date of Birth (DOB), AOD, Age at AOD, Date Last Insured (DLI), Current Age, Last Grade Completed (Education), Attended Special Ed Classes (e.g., Yes or No), Claim Title (II/XVI e.g., T16), Alleged impairments. "
+    "Then retrieve more medical records data to construct a timeline of medical events with Date, Provider, Reason, and Reference (page label such as Pg 12). The Timeline of Medical Events dates usually we base on the 3 factors, (Date/Physician) would be the unique attribute for medical visit, for example: 09/15/2022    Willow Creek Med Ctr        Hip pain, X-ray arthritis       Pg 19, 01/27/2023    Central Plains Med Ctr      R hip pain, arthroplasty eval   Pg 91, 02/08/2023    Central Plains Med Ctr      Right total hip replacement     Pg 91, 04/13/2023    Metro Health & Wellness     Post-op follow-up, stable       Pg 14, 07/06/2023    Sterling Health Clinic      Breast lump, hypertension       Pg 16, etc."
+    "After gathering all evidence, please make sure all fields are reasonable & valid and produce a JSON object with the following shape: {\n"
+    "  \"profile\": ClaimantProfile fields (claimant_name, ssn, date_of_birth, alleged_onset_date, date_last_insured, "
+    "age_at_aod, current_age, education, claim_title),\n"
+    "  \"events\": list of medical events with keys date (MM/DD/YYYY), provider, reason, reference (e.g., Pg 504),\n"
+    "  \"custom_tables\": mapping of table names to lists of row dictionaries.\n"
+    "}\n"
+    "Cite the exact page numbers in the reference column; when a passage is duplicated on other pages, cite those too. "
+    "Ensure that every field is populated with the best available evidence or N/A if truly unavailable."
+)
+
+
+_JSON_STRUCTURAL = re.compile(r"[{}\[\]\"']")
+# JSON and Python string literals cannot span lines, so neither can a skipped string.
+_JSON_STRING_END = {
+    '"': re.compile(r'[^"\\\n]*(?:\\.[^"\\\n]*)*"'),
+    "'": re.compile(r"[^'\\\n]*(?:\\.[^'\\\n]*)*'"),
+}
+
+PREFILL_LABELS = {
+    "claimant_name": "Claimant Name",
+    "ssn": "SSN",
+    "dob": "Date of Birth",
+    "aod": "Alleged Onset Date (AOD)",
+    "dli": "Date Last Insured (DLI)",
+    "education": "Last Grade Completed",
+    "claim_title": "Claim Title",
+    "alleged_impairments": "Alleged impairments",
+}
+
+
+def medical_record_search(query: str, config: RunnableConfig) -> str:
+    """Search the current case's records using the retriever passed in the run config."""
+
+    retriever = config["configurable"]["retriever"]
+    # Stored chunk metadata may predate duplicates found later in the file, so use the run's full map.
+    duplicate_pages = config["configurable"].get("duplicate_pages") or {}
+    start = time.perf_counter()
+    documents = retriever.invoke(query)
+    output = "\n\n".join(
+        f"[Page: {page_citation(doc.metadata, duplicate_pages.get(doc.metadata.get('page_number')))}]\n{doc.page_content}"
+        for doc in documents
+    )
+    logger.info(
+        "%s(%r): %d passages, ~%d tokens in %.2fs",
+        RETRIEVER_TOOL_NAME,
+        query,
+        len(documents),
+        count_tokens(output),
+        time.perf_counter() - start,
+    )
+    return output
+
 
 class AgentSummary(BaseModel):
     profile: ClaimantProfile = Field(default_factory=ClaimantProfile)
@@ -46,22 +130,158 @@ class MedicalSummaryPipeline:
     """High-level orchestration of the medical summary generation workflow."""
 
     def __init__(self) -> None:
-        self.llm = LLMClientFactory.create(provider="openai")
-        self.embedding_model = EmbeddingFactory.create()
         self.chunker = DocumentChunker(settings.chunk_size, settings.chunk_overlap)
-        self.metadata_router = MetadataRouter(self.llm)
-        self.page_ranker = PageRelevanceRanker(self.llm)
-        self.vector_index_manager = VectorIndexManager(self.embedding_model)
+        self.metadata_router = MetadataRouter()
+        self.page_cache = self.create_page_cache()
+        self.page_ocr = self.create_page_ocr()
+        # Model clients are created on first use, so `replay` needs no API keys.
+        self._llm = None
+        self._embedding_model = None
+        self._vector_index_manager: VectorIndexManager | None = None
+        self._page_ranker: PageRelevanceRanker | None = None
+        self._clients_lock = threading.Lock()
+        self._summary_agent = None
+        self._agent_lock = threading.Lock()
+        self._setup_done = False
+
+    @property
+    def llm(self):
+        with self._clients_lock:
+            if self._llm is None:
+                self._llm = LLMClientFactory.create(provider="openai")
+            return self._llm
+
+    @property
+    def embedding_model(self):
+        with self._clients_lock:
+            if self._embedding_model is None:
+                self._embedding_model = EmbeddingFactory.create()
+            return self._embedding_model
+
+    @property
+    def vector_index_manager(self) -> VectorIndexManager:
+        embedding_model = self.embedding_model
+        with self._clients_lock:
+            if self._vector_index_manager is None:
+                self._vector_index_manager = VectorIndexManager(embedding_model)
+            return self._vector_index_manager
+
+    @property
+    def page_ranker(self) -> PageRelevanceRanker:
+        llm = self.llm
+        with self._clients_lock:
+            if self._page_ranker is None:
+                self._page_ranker = PageRelevanceRanker(llm, window_size=settings.extraction_window_pages)
+            return self._page_ranker
+
+    @staticmethod
+    def create_page_cache() -> PageTextCache:
+        return PageTextCache(
+            settings.cache_dir / "page_text.sqlite3",
+            max_bytes=settings.page_cache_max_bytes,
+        )
+
+    @staticmethod
+    def create_page_ocr() -> PageOCR | None:
+        if not settings.ocr_enabled:
+            return None
+        if not ocr_available():
+            logger.warning("OCR is enabled but pytesseract or the tesseract binary is missing; scanned pages will be skipped.")
+            return None
+        return PageOCR(
+            language=settings.ocr_language,
+            cache_path=settings.cache_dir / "ocr_text.sqlite3",
+            cache_max_bytes=settings.ocr_cache_max_bytes,
+        )
 
     def setup(self) -> None:
+        if self._setup_done:
+            return
         configure_logging()
         ensure_directory(settings.outputs_dir)
         ensure_directory(settings.reports_dir)
         ensure_directory(settings.diagnostics_dir)
+        self._setup_done = True
 
-    def ingest_source(self, pdf_path: Path | str) -> list[Document]:
-        loader = PDFMedicalLoader(pdf_path)
-        return loader.load()
+    def warm_up(self) -> None:
+        """Build the agent graph and open long-lived clients ahead of the first request."""
+
+        self.setup()
+        self._get_summary_agent()
+        self.vector_index_manager.warm_up()
+        count_tokens("warm-up")
+
+    def _get_summary_agent(self):
+        """Return the compiled ReAct agent, building it once per pipeline.
+
+        The retriever tool resolves the case retriever from the run config, so one
+        graph serves every case without rebinding tools.
+        """
+
+        with self._agent_lock:
+            if self._summary_agent is None:
+                retriever_tool = StructuredTool.from_function(
+                    func=medical_record_search,
+                    name=RETRIEVER_TOOL_NAME,
+                    description=RETRIEVER_TOOL_DESCRIPTION,
+                )
+                # A JSON schema rather than the model class: the payload still goes through
+                # _normalize_agent_payload, which accepts the MM/DD/YYYY dates models emit.
+                response_format = None
+                if settings.agent_structured_output and supports_structured_output(self.llm):
+                    response_format = AgentSummary.model_json_schema()
+                self._summary_agent = create_react_agent(
+                    tools=[retriever_tool],
+                    system_prompt=AGENT_SYSTEM_PROMPT,
+                    response_format=response_format,
+                    llm=self.llm,
+                )
+            return self._summary_agent
+
+    def ingest_source(
+        self,
+        pdf_path: Path | str,
+        *,
+        use_page_cache: bool = True,
+        dedup: NearDuplicateFilter | None = None,
+    ) -> list[Document]:
+        return list(self.iter_source(pdf_path, use_page_cache=use_page_cache, dedup=dedup))
+
+    def iter_source(
+        self,
+        pdf_path: Path | str,
+        *,
+        use_page_cache: bool = True,
+        dedup: NearDuplicateFilter | None = None,
+    ) -> Iterator[Document]:
+        """Stream source pages in order so chunking can start before extraction finishes.
+
+        In markdown page format, repeated headers and footers are stripped on the way through.
+        With ``dedup``, near-duplicate pages are dropped and their labels kept on the first copy.
+        """
+
+        documents = self._create_loader(pdf_path, use_page_cache=use_page_cache).iter_documents()
+        if settings.page_format == "markdown":
+            documents = BoilerplateStripper().strip(documents)
+        if dedup is not None:
+            documents = dedup.filter(documents)
+        return documents
+
+    @staticmethod
+    def create_dedup_filter() -> NearDuplicateFilter | None:
+        if not settings.page_dedup_enabled:
+            return None
+        return NearDuplicateFilter(min_similarity=settings.page_dedup_min_similarity)
+
+    def _create_loader(self, pdf_path: Path | str, *, use_page_cache: bool) -> PDFMedicalLoader:
+        return PDFMedicalLoader(
+            pdf_path,
+            max_workers=settings.pdf_extraction_workers,
+            pages_per_shard=settings.pdf_pages_per_shard,
+            cache=self.page_cache if use_page_cache and settings.page_cache_enabled else None,
+            ocr=self.page_ocr,
+            page_format=settings.page_format,
+        )
 
     def convert_template(self, template_path: Path | str) -> Path:
         template = TemplateLoader(template_path).load()
@@ -70,13 +290,97 @@ class MedicalSummaryPipeline:
         markdown_path.write_text("\n".join(paragraph.text for paragraph in template.paragraphs), encoding="utf-8")
         return markdown_path
 
-    def build_vector_index(self, documents: list[Document]) -> None:
-        chunked_documents = self.chunker.split(documents)
-        langchain_documents = [
-            Document(page_content=chunk.text, metadata=chunk.metadata)
-            for chunk in chunked_documents
-        ]
-        self.vector_index_manager.upsert(langchain_documents)
+    @staticmethod
+    def case_namespace(pdf_path: Path | str) -> str:
+        """Vector namespace for a case file, derived from its content so re-uploads share it."""
+
+        return file_digest(pdf_path)
+
+    @staticmethod
+    def chunk_id(namespace: str, metadata: dict[str, object], text: str) -> str:
+        """Deterministic chunk id: case hash, page number, offset within the page and a hash of the chunk text.
+
+        The text hash gives a chunk a new id whenever its content changes (page format,
+        chunk size or overlap, OCR), so upserts that skip stored ids never keep a stale one.
+        """
+
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+        return f"{namespace}:{metadata.get('page_number')}:{metadata.get('start_index')}:{digest}"
+
+    def create_retriever(self, pages: list[Document], *, namespace: str | None = None) -> BaseRetriever:
+        """Per-run retriever for the case: hybrid dense + BM25 unless disabled in settings."""
+
+        dense = self.vector_index_manager.as_retriever(namespace=namespace)
+        if not settings.hybrid_retrieval_enabled:
+            return dense
+
+        start = time.perf_counter()
+        lexical_index = LexicalPageIndex(pages)
+        logger.info("Built BM25 page index over %d pages in %.2fs.", len(pages), time.perf_counter() - start)
+        return HybridRetriever(
+            dense=dense,
+            lexical_index=lexical_index,
+            k=settings.retrieval_top_k,
+            max_tokens=settings.retrieval_max_tokens,
+            excerpt_chars=settings.chunk_size,
+        )
+
+    def build_vector_index(self, documents: Iterable[Document], *, namespace: str | None = None) -> None:
+        """Chunk, embed and upsert ``documents`` as overlapping stages.
+
+        Pages are pulled from ``documents`` (a lazy extractor when called from `run`)
+        and chunked on this thread, while up to ``index_upsert_workers`` batches of
+        ``index_batch_size`` chunks are embedded and upserted in the background. At most
+        twice that many batches are in flight; beyond that, chunking waits for the
+        oldest upsert, so slow embedding throttles extraction instead of growing memory.
+        """
+
+        with telemetry.span("build_vector_index") as stage:
+            batches = self._iter_index_batches(documents, namespace=namespace)
+            workers = max(1, settings.index_upsert_workers)
+            indexed = 0
+            if workers == 1:
+                for batch in batches:
+                    indexed += self._upsert_batch(batch, namespace)
+                stage.add(chunks=indexed)
+                return
+
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="index-upsert")
+            pending: deque[Future[int]] = deque()
+            try:
+                for batch in batches:
+                    if len(pending) >= workers * 2:
+                        indexed += pending.popleft().result()
+                    pending.append(executor.submit(self._upsert_batch, batch, namespace))
+                while pending:
+                    indexed += pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True)
+            stage.add(chunks=indexed)
+
+    def _iter_index_batches(self, documents: Iterable[Document], *, namespace: str | None) -> Iterator[list[Document]]:
+        batch: list[Document] = []
+        for chunk in self.chunker.iter_split(documents):
+            text = chunk.text
+            metadata = chunk.metadata
+            batch.append(
+                Document(
+                    id=self.chunk_id(namespace, metadata, text) if namespace else None,
+                    page_content=text,
+                    metadata=metadata,
+                )
+            )
+            if len(batch) >= settings.index_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _upsert_batch(self, batch: list[Document], namespace: str | None) -> int:
+        self.vector_index_manager.upsert(batch, namespace=namespace)
+        return len(batch)
 
     def run(
         self,
@@ -85,91 +389,333 @@ class MedicalSummaryPipeline:
         template_path: Path | str,
         custom_instruction: Optional[str] = None,
         skip_indexing: bool = False,
+        use_page_cache: bool = True,
+        extraction_mode: ExtractionMode | None = None,
     ) -> MedicalSummary:
         self.setup()
-        if not skip_indexing:
-            documents = self.ingest_source(pdf_path)
-            self.build_vector_index(documents)
-        self.convert_template(template_path)
-
-        retriever = self.vector_index_manager.as_retriever()
-        retriever_tool = create_retriever_tool(
-            retriever,
-            "medical_record_search",
-            "Searches and returns information from the claimant's medical records. Please use different keywords to search in parallel until you have all needed evidences.",
-        )
+        extraction_mode = extraction_mode or settings.extraction_mode
+        with telemetry.span("pipeline.run", pdf_path=str(pdf_path), extraction_mode=extraction_mode) as run_span:
+            cache_before = self._embedding_cache_stats()
+            try:
+                return self._run(
+                    run_span,
+                    pdf_path=pdf_path,
+                    template_path=template_path,
+                    custom_instruction=custom_instruction,
+                    skip_indexing=skip_indexing,
+                    use_page_cache=use_page_cache,
+                    extraction_mode=extraction_mode,
+                )
+            finally:
+                self._report_embedding_cache(run_span, cache_before)
 
-        # Step 1: Run a ReAct agent to retrieve relevant information and generate a summary.
-        agent_system_prompt = (
-            "You are an expert at extracting information from medical records. "
-            "First, use the supplied tool multiple times (using different kinds of keywords to search in parallel) and iteratively to gather all required authoritative evidence. "
-            "Populate all of these key profile fields: Claimant Name, SSN, Date of Birth (DOB), AOD, Age at AOD, Date Last Insured (DLI), Current Age, Last Grade Completed (Education), Attended Special Ed Classes (e.g., Yes or No), Claim Title (II/XVI e.g., T16), Alleged impairments. "
-            "Then retrieve more medical records data to construct a timeline of medical events with Date, Provider, Reason, and Reference (page label such as Pg 12). The Timeline of Medical Events dates usually we base on the 3 factors, (Date/Physician) would be the unique attribute for medical visit, for example: 09/15/2022    Willow Creek Med Ctr        Hip pain, X-ray arthritis       Pg 19, 01/27/2023    Central Plains Med Ctr      R hip pain, arthroplasty eval   Pg 91, 02/08/2023    Central Plains Med Ctr      Right total hip replacement     Pg 91, 04/13/2023    Metro Health & Wellness     Post-op follow-up, stable       Pg 14, 07/06/2023    Sterling Health Clinic      Breast lump, hypertension       Pg 16, etc."
-            "After gathering all evidence, please make sure all fields are reasonable & valid and produce a JSON object with the following shape: {\n"
-            "  \"profile\": ClaimantProfile fields (claimant_name, ssn, date_of_birth, alleged_onset_date, date_last_insured, "
-            "age_at_aod, current_age, education, claim_title),\n"
-            "  \"events\": list of medical events with keys date (MM/DD/YYYY), provider, reason, reference (e.g., Pg 504),\n"
-            "  \"custom_tables\": mapping of table names to lists of row dictionaries.\n"
-            "}\n"
-            "Cite the exact page numbers in the reference column. "
-            "Ensure that every field is populated with the best available evidence or N/A if truly unavailable."
-        )
+    def _run(
+        self,
+        run_span: telemetry.Span,
+        *,
+        pdf_path: Path | str,
+        template_path: Path | str,
+        custom_instruction: Optional[str],
+        skip_indexing: bool,
+        use_page_cache: bool,
+        extraction_mode: ExtractionMode,
+    ) -> MedicalSummary:
+        namespace = self.case_namespace(pdf_path)
+        dedup = self.create_dedup_filter()
+        # Map-reduce reads every page directly, so it needs no vector index.
+        indexing = not skip_indexing and extraction_mode != "map_reduce"
+        if not indexing:
+            with telemetry.span("ingest_source"):
+                pages = self.ingest_source(pdf_path, use_page_cache=use_page_cache, dedup=dedup)
+        else:
+            pages = []
+            source = self._collect_pages(self.iter_source(pdf_path, use_page_cache=use_page_cache, dedup=dedup), pages)
+            self.build_vector_index(source, namespace=namespace)
+        run_span.add(pages=len(pages))
+        duplicate_pages = self._report_duplicates(run_span, dedup, indexed=indexing)
+        self.convert_template(template_path)
 
-        summary_agent = create_react_agent(
-            tools=[retriever_tool],
-            system_prompt=agent_system_prompt,
-            provider="openai",
-        )
+        with telemetry.span("extract_metadata"):
+            metadata = self.metadata_router.extract(pages) if settings.metadata_prefill_enabled else MetadataRecord()
+        trace: dict[str, Any] = {
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "pdf_path": str(pdf_path),
+            "case": namespace,
+            "model": getattr(self.llm, "model_name", None) or getattr(self.llm, "model", None),
+            "extraction_mode": extraction_mode,
+            "custom_instruction": custom_instruction,
+            "metadata": asdict(metadata),
+        }
+
+        if extraction_mode == "map_reduce":
+            with telemetry.span("map_reduce"):
+                result = self.map_reduce_extract(pages, custom_instruction=custom_instruction)
+            trace["window_responses"] = result.responses
+            self.save_trace(trace)
+            return result.summary.model_copy(update={"profile": self._apply_prefilled(result.summary.profile, metadata)})
+
+        with telemetry.span("create_retriever"):
+            retriever = self.create_retriever(pages, namespace=namespace)
+        summary_agent = self._get_summary_agent()
 
         user_instruction_lines = [
             "Use the medical_record_search tool iteratively to gather all necessary facts before producing the final summary.",
         ]
+        prefilled_context = self._prefilled_context(metadata)
+        if prefilled_context:
+            user_instruction_lines.append(prefilled_context)
         if custom_instruction:
             user_instruction_lines.append(
                 f"{custom_instruction}"
             )
 
         agent_input = {"messages": [("user", "\n\n".join(user_instruction_lines))]}
-        summary_result = summary_agent.invoke(agent_input)
+        with telemetry.span("agent"):
+            agent_start = time.perf_counter()
+            summary_result = summary_agent.invoke(
+                agent_input,
+                config={
+                    "configurable": {"retriever": retriever, "duplicate_pages": duplicate_pages},
+                    "callbacks": telemetry.callbacks(),
+                },
+            )
+            self._log_agent_usage(summary_result, time.perf_counter() - agent_start, metadata)
 
         logger.debug("Agent summary_result: %s", summary_result)
+        trace.update(self._agent_trace(summary_result))
 
         agent_summary = self._parse_agent_result(summary_result)
 
         if not agent_summary:
-            print("===summary_result:\n",summary_result,"\n====")
             logger.warning("Agent did not return structured data; attempting fallback extraction.")
-            agent_summary = self._fallback_extraction(retriever, custom_instruction)
+            with telemetry.span("fallback_extraction"):
+                agent_summary = self._fallback_extraction(
+                    retriever, custom_instruction, trace=trace, duplicate_pages=duplicate_pages
+                )
+            telemetry.metrics.increment("parse_path.fallback_extraction" if agent_summary else "parse_path.failed")
+
+        self.save_trace(trace)
+        return self._assemble_summary(agent_summary, metadata)
+
+    def replay(self, trace_path: Path | str) -> MedicalSummary:
+        """Rebuild a run's summary from its saved trace, with no LLM, embedding or vector store calls."""
+
+        trace = load_json(trace_path)
+        metadata = MetadataRecord(**trace.get("metadata", {}))
+
+        if trace.get("extraction_mode") == "map_reduce":
+            extractor = MapReduceExtractor(None, parse=self._parse_json_string)
+            summary, _ = extractor.merge(trace.get("window_responses", []))
+            return summary.model_copy(update={"profile": self._apply_prefilled(summary.profile, metadata)})
+
+        agent_summary = self._parse_agent_result(
+            {
+                "messages": messages_from_dict(trace.get("agent_messages", [])),
+                "structured_response": trace.get("structured_response"),
+            }
+        )
+        if not agent_summary and trace.get("fallback_response"):
+            agent_summary = self._parse_json_string(trace["fallback_response"])
+        return self._assemble_summary(agent_summary, metadata)
+
+    def save_trace(self, trace: dict[str, Any]) -> Path | None:
+        """Write the run's raw model outputs to ``diagnostics_dir/traces`` for offline replay."""
+
+        if not settings.agent_trace_enabled:
+            return None
+        stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        try:
+            path = save_json(trace, settings.diagnostics_dir / "traces" / f"{trace['case'][:12]}-{stamp}.json")
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("Could not save run trace: %s", exc)
+            return None
+        logger.info("Saved run trace to %s", path)
+        return path
 
+    @staticmethod
+    def _agent_trace(result: Any) -> dict[str, Any]:
+        if not isinstance(result, dict):
+            return {"agent_messages": []}
+        trace: dict[str, Any] = {"agent_messages": messages_to_dict(result.get("messages", []))}
+        structured_response = result.get("structured_response")
+        if isinstance(structured_response, BaseModel):
+            trace["structured_response"] = structured_response.model_dump(mode="json")
+        elif isinstance(structured_response, dict):
+            # Copied: _normalize_agent_payload later coerces dates in place, which JSON cannot encode.
+            trace["structured_response"] = copy.deepcopy(structured_response)
+        return trace
+
+    def _assemble_summary(self, agent_summary: AgentSummary | None, metadata: MetadataRecord) -> MedicalSummary:
         if not agent_summary:
             logger.error("Fallback extraction failed; returning empty medical summary.")
-            return MedicalSummary()
+            return MedicalSummary(profile=self._apply_prefilled(ClaimantProfile(), metadata))
 
         return MedicalSummary(
-            profile=agent_summary.profile,
+            profile=self._apply_prefilled(agent_summary.profile, metadata),
             events=agent_summary.events,
             custom_tables=agent_summary.custom_tables,
         )
 
+    def map_reduce_extract(self, pages: list[Document], *, custom_instruction: Optional[str] = None) -> MapReduceResult:
+        """Extract the summary from page windows in parallel instead of through the agent."""
+
+        return self._map_reduce_extractor().extract(pages, custom_instruction=custom_instruction)
+
+    def _map_reduce_extractor(self) -> MapReduceExtractor:
+        return MapReduceExtractor(
+            self.llm,
+            parse=self._parse_json_string,
+            window_size=self.page_ranker.window_size,
+            max_concurrency=settings.map_reduce_max_concurrency,
+        )
+
+    def _report_duplicates(
+        self,
+        run_span: telemetry.Span,
+        dedup: NearDuplicateFilter | None,
+        *,
+        indexed: bool,
+    ) -> dict[object, list[str]]:
+        """Log and count the near-duplicate pages skipped; returns their labels by representative page."""
+
+        if dedup is None or not dedup.duplicates:
+            return {}
+        saved = sum(1 for _ in self.chunker.iter_split(dedup.duplicates)) if indexed else 0
+        run_span.add(duplicate_pages=len(dedup.duplicates), embeddings_saved=saved)
+        logger.info(
+            "Skipped %d near-duplicate pages in %d clusters (%d chunk embeddings saved).",
+            len(dedup.duplicates),
+            len(dedup.duplicate_pages),
+            saved,
+        )
+        return dedup.duplicate_pages
+
+    def _embedding_cache_stats(self) -> dict[str, float] | None:
+        return self._embedding_model.stats() if isinstance(self._embedding_model, CachedEmbeddings) else None
+
+    def _report_embedding_cache(self, run_span: telemetry.Span, before: dict[str, float] | None) -> None:
+        """Log this run's embedding cache hit rate and count it into ``/metrics``."""
+
+        after = self._embedding_cache_stats()
+        if before is None or after is None:
+            return
+        hits = after["hits"] - before["hits"]
+        misses = after["misses"] - before["misses"]
+        if not hits + misses:
+            return
+        run_span.add(embedding_cache_hits=hits, embedding_cache_misses=misses)
+        telemetry.metrics.increment("embedding_cache.hits", hits)
+        telemetry.metrics.increment("embedding_cache.misses", misses)
+        logger.info(
+            "Embedding cache: %d/%d hits (%.0f%%), %.1f MiB stored.",
+            hits,
+            hits + misses,
+            100 * hits / (hits + misses),
+            after["stored_bytes"] / 2**20,
+        )
+
+    @staticmethod
+    def _collect_pages(documents: Iterable[Document], sink: list[Document]) -> Iterator[Document]:
+        """Pass documents through while keeping them for post-indexing passes."""
+
+        for document in documents:
+            sink.append(document)
+            yield document
+
+    @staticmethod
+    def _prefilled_context(metadata: MetadataRecord) -> str:
+        found = metadata.found_fields()
+        if not found:
+            return ""
+
+        lines = ["Candidate profile values found by pattern match in the case file (cited page in brackets):"]
+        for field_name, value in found.items():
+            if isinstance(value, list):
+                value = ", ".join(value)
+            lines.append(f"- {PREFILL_LABELS[field_name]}: {value} [{metadata.citations.get(field_name, 'n/a')}]")
+        missing = [PREFILL_LABELS[field_name] for field_name in metadata.missing_fields()]
+        if missing:
+            lines.append(f"Still missing: {', '.join(missing)}.")
+        lines.append(
+            "Treat these as hints, not facts: confirm each one against the cited page before using it, correct "
+            "any that the record contradicts, and search for the missing fields, the remaining profile fields, "
+            "and the timeline of medical events."
+        )
+        return "\n".join(lines)
+
+    def _apply_prefilled(self, profile: ClaimantProfile, metadata: MetadataRecord) -> ClaimantProfile:
+        """Fill profile gaps left by the agent with rule-extracted values."""
+
+        updates: dict[str, Any] = {}
+        for profile_field, record_field in (
+            ("claimant_name", "claimant_name"),
+            ("ssn", "ssn"),
+            ("education", "education"),
+            ("claim_title", "claim_title"),
+        ):
+            value = getattr(metadata, record_field)
+            if value and getattr(profile, profile_field) in (None, "", "N/A"):
+                updates[profile_field] = value
+        for profile_field, record_field in (
+            ("date_of_birth", "dob"),
+            ("alleged_onset_date", "aod"),
+            ("date_last_insured", "dli"),
+        ):
+            value = self._coerce_date(getattr(metadata, record_field))
+            if isinstance(value, datetime.date) and getattr(profile, profile_field) is None:
+                updates[profile_field] = value
+        return profile.model_copy(update=updates) if updates else profile
+
+    @staticmethod
+    def _log_agent_usage(result: Any, elapsed: float, metadata: MetadataRecord) -> None:
+        messages = result.get("messages", []) if isinstance(result, dict) else []
+        ai_messages = [message for message in messages if isinstance(message, AIMessage)]
+        tool_calls = sum(1 for message in messages if isinstance(message, ToolMessage))
+        input_tokens = sum((message.usage_metadata or {}).get("input_tokens", 0) for message in ai_messages)
+        output_tokens = sum((message.usage_metadata or {}).get("output_tokens", 0) for message in ai_messages)
+        logger.info(
+            "Agent finished in %.1fs with %d LLM calls and %d tool calls, %d input / %d output tokens "
+            "(%d profile fields pre-filled).",
+            elapsed,
+            len(ai_messages),
+            tool_calls,
+            input_tokens,
+            output_tokens,
+            len(metadata.found_fields()),
+        )
+
     def _parse_agent_result(self, result: dict[str, Any]) -> AgentSummary | None:
-        """Normalize agent output (messages/return_values) into an AgentSummary instance."""
+        """Normalize agent output (messages/return_values) into an AgentSummary instance.
+
+        Counts which path produced the summary (``parse_path.*`` in ``/metrics``), so the
+        share of runs that still need free-text scraping is visible.
+        """
+
+        path, summary = self._match_agent_result(result)
+        telemetry.metrics.increment(f"parse_path.{path}")
+        logger.info("Agent result parsed via %s.", path)
+        return summary
+
+    def _match_agent_result(self, result: dict[str, Any]) -> tuple[str, AgentSummary | None]:
         if not isinstance(result, dict):
-            return None
+            return "unparsed", None
 
         # Path 1: LangGraph with `response_format` provides `structured_response`
         structured_response = result.get("structured_response")
         if isinstance(structured_response, AgentSummary):
-            return structured_response
+            return "structured_response", structured_response
         if isinstance(structured_response, BaseModel):
             try:
-                return AgentSummary.model_validate(
+                return "structured_response", AgentSummary.model_validate(
                     self._normalize_agent_payload(structured_response.model_dump())
                 )
             except ValidationError as exc:
                 logger.debug("Validation error on BaseModel structured_response: %s", exc)
         if isinstance(structured_response, dict):
             try:
-                return AgentSummary.model_validate(self._normalize_agent_payload(structured_response))
+                return "structured_response", AgentSummary.model_validate(
+                    self._normalize_agent_payload(structured_response)
+                )
             except ValidationError as exc:
                 logger.debug("Validation error on 'structured_response': %s", exc)
 
@@ -178,16 +724,16 @@ class MedicalSummaryPipeline:
         if isinstance(return_values, dict) and "output" in return_values:
             candidate = return_values["output"]
             if isinstance(candidate, AgentSummary):
-                return candidate
+                return "return_values", candidate
             if isinstance(candidate, dict):
                 try:
-                    return AgentSummary.model_validate(self._normalize_agent_payload(candidate))
+                    return "return_values", AgentSummary.model_validate(self._normalize_agent_payload(candidate))
                 except ValidationError as exc:
                     logger.debug("Validation error on dict from 'return_values': %s", exc)
             if isinstance(candidate, str):
                 parsed = self._parse_json_string(candidate)
                 if parsed:
-                    return parsed
+                    return "return_values", parsed
 
         # Path 3: Fallback to parsing the final message content
         messages = result.get("messages")
@@ -198,38 +744,60 @@ class MedicalSummaryPipeline:
             for candidate_text in self._content_text_candidates(content):
                 parsed = self._parse_json_string(candidate_text)
                 if parsed:
-                    return parsed
+                    return "message_text", parsed
 
             if isinstance(content, dict):
                 try:
-                    return AgentSummary.model_validate(self._normalize_agent_payload(content))
+                    return "message_text", AgentSummary.model_validate(self._normalize_agent_payload(content))
                 except (ValidationError, TypeError) as exc:
                     logger.debug("Failed to validate dict content from last message: %s", exc)
 
-        return None
+        return "unparsed", None
 
     @staticmethod
-    def _balanced_json_substrings(text: str) -> list[str]:
-        substrings: list[str] = []
-        if not text:
-            return substrings
-
-        for opening, closing in (("{", "}"), ("[", "]")):
-            stack: list[int] = []
-            start_index: Optional[int] = None
-
-            for idx, char in enumerate(text):
-                if char == opening:
-                    if not stack:
-                        start_index = idx
-                    stack.append(idx)
-                elif char == closing and stack:
-                    stack.pop()
-                    if not stack and start_index is not None:
-                        substrings.append(text[start_index : idx + 1])
-                        start_index = None
-
-        return substrings
+    def _json_spans(text: str) -> list[tuple[int, int]]:
+        """Return ``(start, end)`` of every outermost ``{...}`` and ``[...]`` block, largest first.
+
+        One pass over the text, jumping between structural characters. Quoted strings
+        inside an open block are skipped whole, and each bracket type is balanced
+        independently, so an object nested in an array is still a candidate of its own.
+        """
+
+        spans: list[tuple[int, int]] = []
+        depth = {"{": 0, "[": 0}
+        starts = {"{": 0, "[": 0}
+        closers = {"}": "{", "]": "["}
+        position = 0
+
+        while (match := _JSON_STRUCTURAL.search(text, position)) is not None:
+            idx = match.start()
+            char = text[idx]
+            position = idx + 1
+
+            if char in depth:
+                if depth[char] == 0:
+                    starts[char] = idx
+                depth[char] += 1
+            elif char in closers:
+                opening = closers[char]
+                if depth[opening]:
+                    depth[opening] -= 1
+                    if depth[opening] == 0:
+                        spans.append((starts[opening], idx + 1))
+            elif depth["{"] or depth["["]:
+                # A string can only start where JSON or a Python literal allows one, so
+                # apostrophes in bracketed prose ("[claimant's notes]") are not strings.
+                previous = idx - 1
+                while previous >= 0 and text[previous].isspace():
+                    previous -= 1
+                if previous >= 0 and text[previous] in "{[,:":
+                    # An unterminated quote is a literal character; keep scanning after it.
+                    string_end = _JSON_STRING_END[char].match(text, position)
+                    if string_end is not None:
+                        position = string_end.end()
+
+        spans.sort(key=lambda span: span[0] - span[1])
+        return spans
 
     def _parse_json_string(self, text: str) -> AgentSummary | None:
         if not text:
@@ -239,28 +807,12 @@ class MedicalSummaryPipeline:
         if "JSON output:" in text:
             text = text.split("JSON output:", 1)[1]
 
-        candidates = self._json_candidates(text)
-        if not candidates:
-            fallback = self._attempt_literal_eval(text)
-            if fallback is not None:
-                try:
-                    return AgentSummary.model_validate(self._normalize_agent_payload(fallback))
-                except ValidationError as exc:
-                    logger.debug("Validation error on literal-eval fallback: %s", exc)
-                    return None
-            else:
-                logger.debug("Could not find any JSON candidates or literal-eval content in text.")
-
-        for candidate in candidates:
-            try:
-                data = json.loads(candidate)
-            except json.JSONDecodeError as e:
-                logger.debug("json.loads failed: %s. Trying ast.literal_eval.", e)
-                fallback_data = self._attempt_literal_eval(candidate)
-                if fallback_data is None:
-                    logger.debug("ast.literal_eval also failed for candidate.")
-                    continue
-                data = fallback_data
+        found_candidate = False
+        for candidate in self._json_candidates(text):
+            found_candidate = True
+            data = self._load_candidate(candidate)
+            if data is None:
+                continue
 
             normalized = self._normalize_agent_payload(data)
             try:
@@ -274,12 +826,39 @@ class MedicalSummaryPipeline:
                 logger.debug("Validation error on JSON candidate: %s\nData: %s", exc, normalized_str)
                 continue
 
+        if not found_candidate:
+            fallback = self._attempt_literal_eval(text)
+            if fallback is not None:
+                try:
+                    return AgentSummary.model_validate(self._normalize_agent_payload(fallback))
+                except ValidationError as exc:
+                    logger.debug("Validation error on literal-eval fallback: %s", exc)
+                    return None
+            else:
+                logger.debug("Could not find any JSON candidates or literal-eval content in text.")
+
         return None
 
+    def _load_candidate(self, candidate: str) -> Any | None:
+        # Anything that does not open like JSON fails both parsers; skip the full parse.
+        if candidate[0] not in "{[":
+            return None
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError as e:
+            logger.debug("json.loads failed: %s. Trying ast.literal_eval.", e)
+        fallback_data = self._attempt_literal_eval(candidate)
+        if fallback_data is None:
+            logger.debug("ast.literal_eval also failed for candidate.")
+        return fallback_data
+
     def _fallback_extraction(
         self,
         retriever,
         custom_instruction: Optional[str],
+        *,
+        trace: dict[str, Any] | None = None,
+        duplicate_pages: dict[object, list[str]] | None = None,
     ) -> AgentSummary | None:
         """Best-effort structured extraction using retrieved context and the base LLM."""
 
@@ -306,6 +885,7 @@ class MedicalSummaryPipeline:
                 "Medical Records treatment start date"
             ],
             max_chunks=12,
+            duplicate_pages=duplicate_pages,
         )
 
         if not context:
@@ -330,7 +910,7 @@ class MedicalSummaryPipeline:
         prompt = "\n\n".join(prompt_parts)
 
         try:
-            response = self.llm.invoke(prompt)
+            response = self.llm.invoke(prompt, config={"callbacks": telemetry.callbacks()})
         except Exception as exc:
             logger.error("Fallback extraction LLM call failed: %s", exc)
             return None
@@ -349,6 +929,9 @@ class MedicalSummaryPipeline:
             logger.warning("Fallback extraction returned empty response.")
             return None
 
+        if trace is not None:
+            trace["fallback_response"] = response_text
+
         
         parsed = self._parse_json_string(response_text)
         if not parsed:
@@ -371,7 +954,7 @@ class MedicalSummaryPipeline:
             if not stripped:
                 return None
 
-            for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
+            for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%B %d, %Y", "%b %d, %Y"):
                 try:
                     return datetime.datetime.strptime(stripped, fmt).date()
                 except ValueError:
@@ -428,12 +1011,13 @@ class MedicalSummaryPipeline:
 
         return data
 
-    def _json_candidates(self, text: str) -> list[str]:
+    def _json_candidates(self, text: str) -> Iterator[str]:
+        """Yield parse candidates lazily, largest first: the whole text, then each outermost block."""
+
         if not text:
-            return []
+            return
 
         stripped = text.strip()
-        candidates: list[str] = []
 
         def strip_code_fence(value: str) -> str:
             lines = value.strip().splitlines()
@@ -444,12 +1028,14 @@ class MedicalSummaryPipeline:
             return "\n".join(lines).strip()
 
         fence_stripped = strip_code_fence(stripped)
-        for candidate in {stripped, fence_stripped}:
-            if candidate:
-                candidates.append(candidate)
+        if stripped:
+            yield stripped
+        if fence_stripped and fence_stripped != stripped:
+            yield fence_stripped
 
-        candidates.extend(self._balanced_json_substrings(fence_stripped))
-        return [cand for cand in candidates if cand]
+        for start, end in self._json_spans(fence_stripped):
+            if end - start < len(fence_stripped):
+                yield fence_stripped[start:end]
 
     def _content_text_candidates(self, content: Any) -> list[str]:
         candidates: list[str] = []
@@ -509,19 +1095,22 @@ class MedicalSummaryPipeline:
         queries: Iterable[str],
         *,
         max_chunks: int = 25,
+        duplicate_pages: dict[object, list[str]] | None = None,
     ) -> str:
         """Aggregate top documents from the retriever into a single text context."""
 
         collected: list[str] = []
         seen_ids: set[str] = set()
+        queries = list(queries)
 
-        for query in queries:
-            try:
-                documents = retriever.invoke(query)
-            except Exception as exc:
-                logger.debug("Retriever invoke failed for query '%s': %s", query, exc)
-                documents = []
+        # One embedding batch and concurrent searches instead of a round trip per query.
+        try:
+            results = search_many(retriever, queries, max_concurrency=settings.retrieval_max_concurrency)
+        except Exception as exc:
+            logger.debug("Batched retrieval failed for %d queries: %s", len(queries), exc)
+            results = [[] for _ in queries]
 
+        for documents in results:
             for doc in documents:
                 if len(collected) >= max_chunks:
                     break
@@ -534,7 +1123,8 @@ class MedicalSummaryPipeline:
                 snippet = doc.page_content.strip()
                 if snippet:
                     collected.append(
-                        f"[Source: {doc.metadata.get('source', 'unknown')} | Page: {doc.metadata.get('page_label', 'n/a')}]\n{snippet}"
+                        f"[Source: {doc.metadata.get('source', 'unknown')} | "
+                        f"Page: {page_citation(doc.metadata, (duplicate_pages or {}).get(doc.metadata.get('page_number')))}]\n{snippet}"
                     )
 
             if len(collected) >= max_chunks:
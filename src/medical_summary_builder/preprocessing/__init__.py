@@ -1,11 +1,21 @@
 """Pre-processing utilities: cleaning, chunking, metadata extraction."""
 
-from .chunker import DocumentChunker
-from .metadata_router import MetadataRouter
+from .boilerplate import BoilerplateStripper
+from .chunker import ChunkedDocument, ChunkSpan, DocumentChunker
+from .dedup import NearDuplicateFilter, page_citation
+from .lexical_index import LexicalPageIndex
+from .metadata_router import MetadataRecord, MetadataRouter
 from .page_ranker import PageRelevanceRanker
 
 __all__ = [
+    "BoilerplateStripper",
+    "ChunkSpan",
+    "ChunkedDocument",
     "DocumentChunker",
+    "LexicalPageIndex",
+    "MetadataRecord",
     "MetadataRouter",
+    "NearDuplicateFilter",
     "PageRelevanceRanker",
+    "page_citation",
 ]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import re
+from collections import Counter, deque
+from typing import Iterable, Iterator
+
+from langchain_core.documents import Document
+
+_DIGITS = re.compile(r"\d+")
+_HAS_LETTER = re.compile(r"[a-z]")
+
+
+def _line_key(line: str) -> str:
+    """Whitespace-collapsed, lower-cased line with digit runs masked, so "Page 3 of 40" matches "Page 4 of 40"."""
+
+    return _DIGITS.sub("#", " ".join(line.split()).lower())
+
+
+class BoilerplateStripper:
+    """Remove header and footer lines that repeat across neighbouring pages.
+
+    Only the first and last ``edge_lines`` non-blank lines of a page are candidates.
+    One is dropped when the same line (digits masked) sits at the edge of at least
+    ``min_repeats`` of the pages within ``window`` pages either side, so headers
+    that change per exhibit are caught as well as document-wide ones. Pages are
+    streamed with ``window`` pages of lookahead.
+    """
+
+    def __init__(self, *, window: int = 4, min_repeats: int = 3, edge_lines: int = 3) -> None:
+        self.window = window
+        self.min_repeats = min_repeats
+        self.edge_lines = edge_lines
+        self.removed_lines = 0
+
+    def _edge_keys(self, document: Document) -> set[str]:
+        lines = [line for line in document.page_content.splitlines() if line.strip()]
+        edges = lines[: self.edge_lines] + lines[-self.edge_lines :]
+        # Lines without letters are only boilerplate when they are bare page numbers, not list markers or dates.
+        return {key for key in map(_line_key, edges) if _HAS_LETTER.search(key) or key == "#"}
+
+    def strip(self, documents: Iterable[Document]) -> Iterator[Document]:
+        recent: deque[set[str]] = deque()
+        pending: deque[tuple[Document, set[str]]] = deque()
+        counts: Counter[str] = Counter()
+
+        for document in documents:
+            keys = self._edge_keys(document)
+            recent.append(keys)
+            counts.update(keys)
+            if len(recent) > 2 * self.window + 1:
+                counts.subtract(recent.popleft())
+            pending.append((document, keys))
+            if len(pending) > self.window:
+                yield self._strip_page(*pending.popleft(), counts)
+        while pending:
+            yield self._strip_page(*pending.popleft(), counts)
+
+    def _strip_page(self, document: Document, keys: set[str], counts: Counter[str]) -> Document:
+        repeated = {key for key in keys if counts[key] >= self.min_repeats}
+        if not repeated:
+            return document
+
+        lines = document.page_content.splitlines()
+        content = [index for index, line in enumerate(lines) if line.strip()]
+        edges = set(content[: self.edge_lines] + content[-self.edge_lines :])
+        kept = [line for index, line in enumerate(lines) if index not in edges or _line_key(line) not in repeated]
+        self.removed_lines += len(lines) - len(kept)
+        return Document(id=document.id, page_content="\n".join(kept).strip(), metadata=document.metadata)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -13,25 +13,58 @@ class ChunkedDocument:
     metadata: dict[str, object]
 
 
+class ChunkSpan:
+    """A chunk stored as a character range of its source page.
+
+    The page text and metadata are shared by every chunk of that page; the chunk
+    text and per-chunk metadata are only built when read.
+    """
+
+    __slots__ = ("page", "start", "end")
+
+    def __init__(self, page: Document, start: int, end: int) -> None:
+        self.page = page
+        self.start = start
+        self.end = end
+
+    @property
+    def text(self) -> str:
+        return self.page.page_content[self.start : self.end]
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        return {**self.page.metadata, "start_index": self.start}
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __repr__(self) -> str:
+        return f"ChunkSpan(page={self.page.metadata.get('page_number')!r}, start={self.start}, end={self.end})"
+
+
 class DocumentChunker:
     """Chunk raw documents into overlapping windows for embedding."""
 
     def __init__(self, chunk_size: int = 1500, chunk_overlap: int = 200) -> None:
+        self.chunk_overlap = chunk_overlap
         self.splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
-            separators=["\n\n", "\n", ".", " "]
+            separators=["\n\n", "\n", ".", " "],
+            add_start_index=True,
         )
 
-    def split(self, documents: Iterable[Document]) -> list[ChunkedDocument]:
-        chunks: list[ChunkedDocument] = []
+    def iter_split(self, documents: Iterable[Document]) -> Iterator[ChunkSpan]:
+        """Lazily yield chunks page by page, as offsets into each page's text."""
+
         for doc in documents:
-            chunk_docs = self.splitter.create_documents([doc.page_content], [doc.metadata])
-            for chunk_doc in chunk_docs:
-                chunks.append(
-                    ChunkedDocument(
-                        text=chunk_doc.page_content,
-                        metadata=chunk_doc.metadata,
-                    )
-                )
-        return chunks
+            text = doc.page_content
+            start = length = 0
+            for chunk in self.splitter.split_text(text):
+                # Same offset search as the splitter's ``add_start_index``, so chunk ids are unchanged.
+                start = text.find(chunk, max(0, start + length - self.chunk_overlap))
+                length = len(chunk)
+                yield ChunkSpan(doc, start, start + length)
+
+    def split(self, documents: Iterable[Document]) -> list[ChunkedDocument]:
+        return [ChunkedDocument(text=chunk.text, metadata=chunk.metadata) for chunk in self.iter_split(documents)]
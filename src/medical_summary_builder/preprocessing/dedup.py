@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import defaultdict
+from typing import Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+
+from .lexical_index import tokenize
+
+_DATE_PATTERN = re.compile(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b")
+# Fax machine and transmission stamps: "FAX 03/12/2024 ... P. 004", "TX OK", "From: ...", "Page 2 of 7".
+_TRANSMISSION_LINE = re.compile(
+    r"(?i)\b(?:e-?fax|fax|tx|rx|transmission|received|sent)\b|^\s*from\s*:|\bpage\s+\d+\s*(?:of|/)\s*\d+\b"
+)
+_BANDS = 8
+_ROWS = 4
+# Odd multipliers and offsets of the universal hash family behind the MinHash permutations.
+_SEEDS = np.random.default_rng(0).integers(1, 2**63, size=(2, _BANDS * _ROWS), dtype=np.uint64)
+_SEEDS[0] |= np.uint64(1)
+
+
+def shingle_hashes(text: str, *, shingle_size: int = 3) -> np.ndarray:
+    """Sorted, unique 64-bit hashes of the word shingles in ``text``."""
+
+    tokens = tokenize(text)
+    shingles = [" ".join(tokens[index : index + shingle_size]) for index in range(max(1, len(tokens) - shingle_size + 1))]
+    digests = b"".join(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest() for shingle in shingles)
+    return np.unique(np.frombuffer(digests, dtype=">u8"))
+
+
+def minhash_bands(hashes: np.ndarray) -> list[bytes]:
+    """MinHash signature of the shingle hashes, split into ``_BANDS`` band keys of ``_ROWS`` values each."""
+
+    with np.errstate(over="ignore"):
+        signature = (hashes.astype(np.uint64)[:, None] * _SEEDS[0] + _SEEDS[1]).min(axis=0)
+    return [band.tobytes() for band in signature.reshape(_BANDS, _ROWS)]
+
+
+def page_body(text: str, *, edge_lines: int = 3) -> str:
+    """A page without the fax or transmission stamps among its first and last ``edge_lines`` non-blank lines.
+
+    Every other line is kept, including dates of service and signature dates near the edges.
+    """
+
+    lines = [line for line in text.splitlines() if line.strip()]
+    last = len(lines) - edge_lines
+    return "\n".join(
+        line
+        for index, line in enumerate(lines)
+        if edge_lines <= index < last or not _TRANSMISSION_LINE.search(line)
+    )
+
+
+def page_citation(metadata: Mapping[str, object], duplicates: Sequence[str] | None = None) -> str:
+    """The page label for a passage, followed by the labels of pages it stands in for."""
+
+    label = str(metadata.get("page_label", metadata.get("page_number", "n/a")))
+    duplicates = duplicates if duplicates is not None else metadata.get("duplicate_pages")
+    if not duplicates:
+        return label
+    return f"{label} (duplicated on {', '.join(duplicates)})"
+
+
+class NearDuplicateFilter:
+    """Drop pages that repeat an earlier page, e.g. a record faxed twice.
+
+    Pages are compared by the word shingles of their body, that is without fax
+    or transmission stamps in the first and last ``edge_lines`` lines, so the
+    dated header a refaxed copy gains does not count against it. Candidates share at least one of eight
+    4-row MinHash bands, which finds a pair with Jaccard similarity 0.9 with
+    probability above 0.999. A candidate counts as a duplicate only if its
+    shingle Jaccard similarity is at least ``min_similarity`` and both bodies
+    mention the same dates, so a template form filled in on a different day is
+    kept. Each duplicate's page label is added to the first occurrence's
+    ``duplicate_pages`` metadata, so citations can still name every copy.
+    """
+
+    def __init__(self, *, min_similarity: float = 0.9, shingle_size: int = 3, edge_lines: int = 3) -> None:
+        self.min_similarity = min_similarity
+        self.shingle_size = shingle_size
+        self.edge_lines = edge_lines
+        self.duplicates: list[Document] = []
+        self._bands: list[dict[bytes, list[int]]] = [defaultdict(list) for _ in range(_BANDS)]
+        # Shingle hashes are kept as compact arrays: about 4 KB per representative page.
+        self._representatives: list[tuple[Document, np.ndarray, frozenset[str]]] = []
+
+    @property
+    def duplicate_pages(self) -> dict[object, list[str]]:
+        """Duplicate page labels keyed by the representative's page number."""
+
+        return {
+            document.metadata.get("page_number"): list(document.metadata["duplicate_pages"])
+            for document, *_ in self._representatives
+            if document.metadata.get("duplicate_pages")
+        }
+
+    def filter(self, documents: Iterable[Document]) -> Iterator[Document]:
+        """Yield the first page of every near-duplicate cluster, in order."""
+
+        for document in documents:
+            body = page_body(document.page_content, edge_lines=self.edge_lines)
+            shingles = shingle_hashes(body, shingle_size=self.shingle_size)
+            dates = frozenset(_DATE_PATTERN.findall(body))
+            bands = minhash_bands(shingles)
+
+            representative = self._match(bands, shingles, dates)
+            if representative is not None:
+                labels = representative.metadata.setdefault("duplicate_pages", [])
+                labels.append(str(document.metadata.get("page_label", document.metadata.get("page_number"))))
+                self.duplicates.append(document)
+                continue
+
+            position = len(self._representatives)
+            self._representatives.append((document, shingles, dates))
+            for key, table in zip(bands, self._bands):
+                table[key].append(position)
+            yield document
+
+    def _match(self, bands: list[bytes], shingles: np.ndarray, dates: frozenset[str]) -> Document | None:
+        checked: set[int] = set()
+        for key, table in zip(bands, self._bands):
+            for position in table.get(key, ()):
+                if position in checked:
+                    continue
+                checked.add(position)
+                document, other_shingles, other_dates = self._representatives[position]
+                if dates != other_dates:
+                    continue
+                shared = len(np.intersect1d(shingles, other_shingles, assume_unique=True))
+                if shared / (len(shingles) + len(other_shingles) - shared) >= self.min_similarity:
+                    return document
+        return None
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import re
+from array import array
+from collections import Counter
+from typing import Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+
+# Letters and digits are split apart so "10th grade" also matches the query "th grade".
+_TOKEN_PATTERN = re.compile(r"[a-z]+|[0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class LexicalPageIndex:
+    """In-memory BM25 index over pages.
+
+    Postings are stored CSR-style: one contiguous array of page ids and one of
+    term frequencies, sliced per term through ``offsets``.
+    """
+
+    def __init__(self, documents: Sequence[Document], *, k1: float = 1.5, b: float = 0.75) -> None:
+        self.documents = list(documents)
+        self.k1 = k1
+        self.b = b
+
+        vocabulary: dict[str, int] = {}
+        term_ids, page_ids, frequencies = array("i"), array("i"), array("i")
+        doc_lengths = np.zeros(len(self.documents), dtype=np.float32)
+
+        for page_id, doc in enumerate(self.documents):
+            counts = Counter(tokenize(doc.page_content))
+            doc_lengths[page_id] = sum(counts.values())
+            for term, frequency in counts.items():
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                page_ids.append(page_id)
+                frequencies.append(frequency)
+
+        term_array = np.frombuffer(term_ids, dtype=np.int32)
+        order = np.argsort(term_array, kind="stable")
+        self.vocabulary = vocabulary
+        self.postings = np.frombuffer(page_ids, dtype=np.int32)[order]
+        self.frequencies = np.frombuffer(frequencies, dtype=np.int32)[order].astype(np.float32)
+        self.offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_array, minlength=len(vocabulary)), out=self.offsets[1:])
+
+        document_frequency = np.diff(self.offsets).astype(np.float32)
+        page_count = len(self.documents)
+        self.idf = np.log1p((page_count - document_frequency + 0.5) / (document_frequency + 0.5))
+        average_length = float(doc_lengths.mean()) if page_count else 0.0
+        # Per-page BM25 length normalisation, precomputed once.
+        self.length_norm = k1 * (1 - b + b * doc_lengths / (average_length or 1.0))
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every page for ``query``."""
+
+        scores = np.zeros(len(self.documents), dtype=np.float32)
+        for term in set(tokenize(query)):
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            pages = self.postings[start:end]
+            frequency = self.frequencies[start:end]
+            scores[pages] += self.idf[term_id] * frequency * (self.k1 + 1) / (frequency + self.length_norm[pages])
+        return scores
+
+    def search(self, query: str, k: int = 10) -> list[tuple[Document, float]]:
+        """Top ``k`` pages with a positive BM25 score, best first."""
+
+        scores = self.scores(query)
+        k = min(k, int(np.count_nonzero(scores)))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.documents[page], float(scores[page])) for page in top]
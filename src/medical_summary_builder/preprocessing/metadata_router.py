@@ -1,10 +1,74 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field, fields
 from typing import Iterable
 
 from langchain_core.documents import Document
 
+_DATE = r"(\d{1,2}/\d{1,2}/\d{2,4}|\d{4}-\d{2}-\d{2}|[A-Z][a-z]{2,8}\.? \d{1,2}, \d{4})"
+_TITLE = r"(?:T2|T16|Title II|Title XVI)"
+_CLAIM_TITLE = re.compile(rf"\b({_TITLE})\b")
+
+
+def _dated_field(labels: str, abbreviations: str) -> re.Pattern[str]:
+    """A labelled date on the same line as its label.
+
+    Only spaces and tabs may separate the two, so a table header is not read as
+    the label of a value in the row below, and abbreviations need a ``:`` or
+    ``-`` separator.
+    """
+
+    return re.compile(rf"(?i:\b(?:{labels})[ \t]*[:\-]?|\b(?:{abbreviations})[ \t]*[:\-])[ \t]*" + _DATE)
+
+
+# Labelled patterns are tried before bare ones so form fields win over stray matches.
+_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    "claimant_name": [
+        re.compile(
+            r"(?i:\b(?:claimant(?:'s)? name|name of claimant|claimant|patient name))\s*[:\-]\s*"
+            r"([A-Z][A-Za-z'\-]+(?:,? [A-Z][A-Za-z'\-]*\.?){1,3})"
+        ),
+    ],
+    "ssn": [
+        re.compile(r"(?i:\b(?:SSN|social security (?:number|no\.?)))\s*[:#]?\s*(\d{3}-\d{2}-\d{4}|[X*]{3}-[X*]{2}-\d{4})"),
+        re.compile(r"\b(\d{3}-\d{2}-\d{4})\b"),
+    ],
+    "dob": [
+        _dated_field(r"date of birth|birth ?date", r"D\.?O\.?B\.?"),
+    ],
+    "aod": [
+        _dated_field(r"alleged onset(?: date)?|onset date", r"AOD"),
+    ],
+    "dli": [
+        _dated_field(r"date last insured|last insured", r"DLI"),
+    ],
+    "education": [
+        re.compile(r"(?i)\b(\d{1,2}(?:st|nd|rd|th) grade)\b"),
+        re.compile(r"(?i)\bhighest grade(?: completed)?\s*[:\-]?\s*(\d{1,2})\b"),
+    ],
+    "claim_title": [
+        # T2/T16 also name MRI sequences, so the short forms only count after a claim label.
+        re.compile(
+            rf"(?i:\b(?:claim type|type of claim|claim title|claim|title))[ \t]*[:\-][ \t]*"
+            rf"({_TITLE}(?:[ \t]*(?:/|,|&|and)[ \t]*{_TITLE})*)\b"
+        ),
+        re.compile(r"\b(Title II|Title XVI)\b"),
+    ],
+    "alleged_impairments": [
+        re.compile(r"(?i:\balleged impairments?)\s*[:\-]\s*([^\n]+)"),
+    ],
+}
+
+_CLAIM_TITLES = {"T2": "T2", "Title II": "T2", "T16": "T16", "Title XVI": "T16"}
+
+
+def _ordinal(number: int) -> str:
+    """``1st``, ``2nd``, ``3rd``, ``4th`` ... with ``11th`` to ``13th``."""
+
+    suffix = "th" if 11 <= number % 100 <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return f"{number}{suffix}"
+
 
 @dataclass
 class MetadataRecord:
@@ -14,15 +78,75 @@ class MetadataRecord:
     aod: str | None = None
     dli: str | None = None
     education: str | None = None
+    claim_title: str | None = None
     alleged_impairments: list[str] | None = None
+    citations: dict[str, str] = field(default_factory=dict)
+
+    def found_fields(self) -> dict[str, object]:
+        return {
+            item.name: getattr(self, item.name)
+            for item in fields(self)
+            if item.name != "citations" and getattr(self, item.name)
+        }
+
+    def missing_fields(self) -> list[str]:
+        found = self.found_fields()
+        return [item.name for item in fields(self) if item.name != "citations" and item.name not in found]
 
 
 class MetadataRouter:
-    """Accumulate structured claimant metadata using LLM extraction."""
+    """Accumulate structured claimant metadata with a rule-based pass over page text.
 
-    def __init__(self, llm) -> None:
+    Fields with rigid SSA formats (SSN, DOB, AOD, DLI, claim title, grade completed)
+    are matched with compiled patterns; the first page that matches is cited.
+    """
+
+    def __init__(self, llm=None) -> None:
         self.llm = llm
 
     def extract(self, documents: Iterable[Document]) -> MetadataRecord:
-        # Placeholder for future LLM chain integration
-        raise NotImplementedError
+        record = MetadataRecord()
+        # Rank of the best pattern matched so far per field; 0 (labelled) is final.
+        best_rank: dict[str, int] = {}
+
+        for doc in documents:
+            pending = [name for name in _PATTERNS if best_rank.get(name, len(_PATTERNS[name])) > 0]
+            if not pending:
+                break
+            text = doc.page_content
+            citation = f"Pg {doc.metadata.get('page_number', '?')}"
+
+            for field_name in pending:
+                limit = best_rank.get(field_name, len(_PATTERNS[field_name]))
+                match = self._match(field_name, text, limit)
+                if match is None:
+                    continue
+                best_rank[field_name], value = match
+                setattr(record, field_name, value)
+                record.citations[field_name] = citation
+
+        return record
+
+    @staticmethod
+    def _match(field_name: str, text: str, limit: int) -> tuple[int, object] | None:
+        """Return ``(rank, value)`` for the first of the field's top ``limit`` patterns that matches."""
+
+        for rank, pattern in enumerate(_PATTERNS[field_name][:limit]):
+            if field_name == "claim_title":
+                titles = {
+                    _CLAIM_TITLES[title] for match in pattern.findall(text) for title in _CLAIM_TITLE.findall(match)
+                }
+                if titles:
+                    return rank, "/".join(sorted(titles, key=len))
+                continue
+
+            match = pattern.search(text)
+            if match is None:
+                continue
+            value = match.group(1).strip()
+            if field_name == "education" and value.isdigit():
+                value = f"{_ordinal(int(value))} grade"
+            if field_name == "alleged_impairments":
+                return rank, [item.strip() for item in re.split(r"[;,]", value) if item.strip()]
+            return rank, value
+        return None
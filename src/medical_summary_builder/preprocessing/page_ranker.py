@@ -5,6 +5,8 @@ from typing import Iterable, Sequence
 
 from langchain_core.documents import Document
 
+from .lexical_index import LexicalPageIndex
+
 
 @dataclass
 class RankedPage:
@@ -19,9 +21,24 @@ class PageRelevanceRanker:
         self.llm = llm
         self.window_size = window_size
 
-    def rank(self, documents: Sequence[Document], instruction: str) -> list[RankedPage]:
-        # Placeholder logic will be replaced with LLM-based scoring
-        return [
-            RankedPage(score=1.0, document=doc)
-            for doc in documents
+    def rank(
+        self,
+        documents: Sequence[Document],
+        instruction: str,
+        *,
+        index: LexicalPageIndex | None = None,
+    ) -> list[RankedPage]:
+        """Order pages by BM25 relevance to ``instruction``, best first.
+
+        Pass the case's prebuilt ``index`` to avoid re-indexing ``documents``.
+        """
+
+        if index is None:
+            index = LexicalPageIndex(documents)
+        scores = index.scores(instruction)
+        ranked = [
+            RankedPage(score=float(score), document=doc)
+            for doc, score in zip(index.documents, scores)
         ]
+        ranked.sort(key=lambda page: page.score, reverse=True)
+        return ranked
@@ -1,9 +1,12 @@
 """High-level services that orchestrate extraction and report generation."""
 
+from .batch_runner import BatchReport, BatchSummaryRunner
 from .summary_builder import SummaryBuilderService
 from .template_filler import TemplateFiller
 
 __all__ = [
+    "BatchReport",
+    "BatchSummaryRunner",
     "SummaryBuilderService",
     "TemplateFiller",
 ]
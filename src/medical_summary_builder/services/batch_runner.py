@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from .. import telemetry
+from ..utils import ensure_directory, file_digest, save_json
+from .summary_builder import SummaryBuilderService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchReport:
+    """Outcome of a batch run, used for the throughput summary."""
+
+    completed: list[Path] = field(default_factory=list)
+    skipped: list[Path] = field(default_factory=list)
+    failed: dict[Path, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def cases_per_minute(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return len(self.completed) * 60.0 / self.elapsed_seconds
+
+
+class BatchSummaryRunner:
+    """Summarise many case files concurrently, one output folder per case.
+
+    A case counts as done once ``summary.json`` exists in its folder; it is written
+    last and atomically, so an interrupted batch resumes where it stopped.
+    """
+
+    completion_marker = "summary.json"
+
+    def __init__(self, service: SummaryBuilderService, *, output_dir: Path | str, max_workers: int = 2) -> None:
+        self.service = service
+        self.output_dir = ensure_directory(output_dir)
+        self.max_workers = max(1, max_workers)
+
+    @staticmethod
+    def discover(source: Path | str) -> list[Path]:
+        """List case PDFs from a directory (recursively) or a manifest with one path per line."""
+
+        source = Path(source)
+        if source.is_dir():
+            return sorted(path for path in source.rglob("*") if path.suffix.lower() == ".pdf")
+
+        pdf_paths: list[Path] = []
+        for line in source.read_text(encoding="utf-8").splitlines():
+            entry = line.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            path = Path(entry)
+            pdf_paths.append(path if path.is_absolute() else source.parent / path)
+        return pdf_paths
+
+    def case_dir(self, pdf_path: Path) -> Path:
+        # The content hash keeps same-named files from different folders apart.
+        return self.output_dir / f"{pdf_path.stem}-{file_digest(pdf_path)[:12]}"
+
+    def run(
+        self,
+        pdf_paths: list[Path],
+        *,
+        template_path: Path | str,
+        custom_instruction: Optional[str] = None,
+        on_case_done: Callable[[Path, str], None] | None = None,
+    ) -> BatchReport:
+        report = BatchReport()
+        start = time.perf_counter()
+
+        pending: list[tuple[Path, Path]] = []
+        for pdf_path in pdf_paths:
+            case_dir = self.case_dir(pdf_path)
+            if (case_dir / self.completion_marker).exists():
+                report.skipped.append(pdf_path)
+                if on_case_done:
+                    on_case_done(pdf_path, "skipped")
+            else:
+                pending.append((pdf_path, case_dir))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="batch-case") as executor:
+            futures = {
+                executor.submit(self._run_case, pdf_path, case_dir, template_path, custom_instruction): pdf_path
+                for pdf_path, case_dir in pending
+            }
+            for future in as_completed(futures):
+                pdf_path = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    logger.exception("Batch case failed: %s", pdf_path)
+                    report.failed[pdf_path] = str(exc)
+                    status = "failed"
+                else:
+                    report.completed.append(pdf_path)
+                    status = "completed"
+                if on_case_done:
+                    on_case_done(pdf_path, status)
+
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
+
+    def _run_case(
+        self,
+        pdf_path: Path,
+        case_dir: Path,
+        template_path: Path | str,
+        custom_instruction: Optional[str],
+    ) -> None:
+        with telemetry.span("batch_case", pdf_path=str(pdf_path)):
+            summary = self.service.build_summary(
+                pdf_path=pdf_path,
+                template_path=template_path,
+                custom_instruction=custom_instruction,
+                emit_reports=False,
+            )
+            self.service.write_reports(summary, output_dir=case_dir, template_path=template_path)
+
+        marker = case_dir / self.completion_marker
+        partial = save_json(summary.model_dump(mode="json"), marker.with_suffix(".json.tmp"))
+        partial.replace(marker)
@@ -3,7 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
+from .. import telemetry
 from ..pipelines import MedicalSummaryPipeline
+from ..pipelines.orchestrator import ExtractionMode
 from ..reporting import ReportWriter
 from ..schemas import MedicalSummary
 from ..config import settings
@@ -23,17 +25,52 @@ class SummaryBuilderService:
         custom_instruction: Optional[str] = None,
         emit_reports: bool = True,
         skip_indexing: bool = False,
+        use_page_cache: bool = True,
+        output_dir: Path | str | None = None,
+        extraction_mode: ExtractionMode | None = None,
     ) -> MedicalSummary:
-        summary = self.pipeline.run(
-            pdf_path=pdf_path,
-            template_path=template_path,
-            custom_instruction=custom_instruction,
-            skip_indexing=skip_indexing,
-        )
+        with telemetry.span("build_summary", pdf_path=str(pdf_path)):
+            summary = self.pipeline.run(
+                pdf_path=pdf_path,
+                template_path=template_path,
+                custom_instruction=custom_instruction,
+                skip_indexing=skip_indexing,
+                use_page_cache=use_page_cache,
+                extraction_mode=extraction_mode,
+            )
 
-        if emit_reports:
-            writer = ReportWriter(settings.reports_dir)
-            writer.write_markdown(summary)
-            writer.write_docx(summary, template_path=template_path)
+            if emit_reports:
+                self.write_reports(summary, output_dir=output_dir, template_path=template_path)
 
         return summary
+
+    def replay_summary(
+        self,
+        trace_path: Path | str,
+        *,
+        template_path: Path | str | None = None,
+        emit_reports: bool = True,
+        output_dir: Path | str | None = None,
+    ) -> MedicalSummary:
+        """Rebuild a summary from a saved run trace and re-render its reports offline."""
+
+        summary = self.pipeline.replay(trace_path)
+        if emit_reports:
+            self.write_reports(summary, output_dir=output_dir, template_path=template_path)
+        return summary
+
+    def write_reports(
+        self,
+        summary: MedicalSummary,
+        *,
+        output_dir: Path | str | None = None,
+        template_path: Path | str | None = None,
+    ) -> dict[str, Path]:
+        """Render markdown and DOCX reports, returning their paths keyed by format."""
+
+        with telemetry.span("write_reports"):
+            writer = ReportWriter(output_dir or settings.reports_dir)
+            return {
+                "markdown": writer.write_markdown(summary),
+                "docx": writer.write_docx(summary, template_path=template_path),
+            }
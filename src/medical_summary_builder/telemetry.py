@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, Iterator
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from .config import settings
+from .utils import save_json
+
+try:  # Not available on Windows.
+    import resource
+except ImportError:  # pragma: no cover - platform dependent
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_active: ContextVar[tuple["Span", ...]] = ContextVar("telemetry_spans", default=())
+
+
+def peak_rss_mb(who: int | None = None) -> float | None:
+    """High-water resident set size of this process (or its reaped children) in MiB."""
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF if who is None else who).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and KiB elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class Span:
+    """One timed pipeline stage with its counters and nested stages."""
+
+    name: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    peak_rss_mb: float | None = None
+
+    def add(self, **counts: int) -> None:
+        with _lock:
+            for name, value in counts.items():
+                self.counts[name] = self.counts.get(name, 0) + value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "attributes": self.attributes,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "peak_rss_mb": self.peak_rss_mb,
+            "counts": dict(self.counts),
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def walk(self) -> Iterator["Span"]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+class _NoOpSpan(Span):
+    def add(self, **counts: int) -> None:
+        pass
+
+
+_DISABLED = nullcontext(_NoOpSpan(name="disabled"))
+
+
+class TelemetryCallbackHandler(BaseCallbackHandler):
+    """Count LLM calls, tokens and tool calls into the span that was active when it was created."""
+
+    def __init__(self, span: Span) -> None:
+        self.span = span
+
+    def on_llm_start(self, serialized: dict[str, Any], prompts: list[str], **kwargs: Any) -> None:
+        self.span.add(llm_calls=1)
+
+    def on_chat_model_start(self, serialized: dict[str, Any], messages: list[list[Any]], **kwargs: Any) -> None:
+        self.span.add(llm_calls=1)
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        input_tokens = output_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                input_tokens += usage.get("input_tokens", 0)
+                output_tokens += usage.get("output_tokens", 0)
+        self.span.add(input_tokens=input_tokens, output_tokens=output_tokens)
+
+    def on_tool_start(self, serialized: dict[str, Any], input_str: str, **kwargs: Any) -> None:
+        self.span.add(tool_calls=1)
+
+
+class MetricsRegistry:
+    """In-process aggregate of finished runs, served by the API's ``/metrics`` endpoint."""
+
+    def __init__(self, *, max_recent: int = 50) -> None:
+        self.runs = 0
+        self.stages: dict[str, dict[str, float]] = {}
+        self.counters: dict[str, int] = {}
+        self.recent: deque[dict[str, Any]] = deque(maxlen=max_recent)
+
+    def record(self, root: Span) -> None:
+        with _lock:
+            self.runs += 1
+            self.recent.append(root.to_dict())
+            for span in root.walk():
+                stage = self.stages.setdefault(span.name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+                stage["count"] += 1
+                stage["total_seconds"] += span.wall_seconds
+                stage["max_seconds"] = max(stage["max_seconds"], span.wall_seconds)
+                for name, value in span.counts.items():
+                    stage[name] = stage.get(name, 0) + value
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Bump an event counter; counters are kept even when span telemetry is disabled."""
+
+        with _lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self) -> dict[str, Any]:
+        with _lock:
+            return {
+                "enabled": settings.enable_telemetry,
+                "runs": self.runs,
+                "counters": dict(self.counters),
+                "peak_rss_mb": peak_rss_mb(),
+                "stages": {
+                    name: {**stage, "mean_seconds": stage["total_seconds"] / stage["count"]}
+                    for name, stage in self.stages.items()
+                },
+                "recent": list(self.recent),
+            }
+
+
+metrics = MetricsRegistry()
+
+
+def span(name: str, **attributes: Any) -> ContextManager[Span]:
+    """Time a stage. Spans nest per thread/task; the outermost one is written to ``diagnostics_dir``.
+
+    Returns a shared no-op span when ``enable_telemetry`` is off, so call sites cost
+    next to nothing in production.
+    """
+
+    if not settings.enable_telemetry:
+        return _DISABLED
+    return _record(name, attributes)
+
+
+def callbacks() -> list[BaseCallbackHandler]:
+    """LangChain callbacks that attribute LLM and tool usage to the innermost active span."""
+
+    stack = _active.get()
+    if not stack or not settings.enable_telemetry:
+        return []
+    return [TelemetryCallbackHandler(stack[-1])]
+
+
+@contextmanager
+def _record(name: str, attributes: dict[str, Any]) -> Iterator[Span]:
+    stack = _active.get()
+    current = Span(name=name, attributes=attributes)
+    if stack:
+        with _lock:
+            stack[-1].children.append(current)
+    token = _active.set(stack + (current,))
+    start = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.wall_seconds = time.perf_counter() - start
+        current.peak_rss_mb = peak_rss_mb()
+        _active.reset(token)
+        if stack:
+            stack[-1].add(**current.counts)
+        else:
+            _finish_root(current)
+
+
+def _finish_root(root: Span) -> None:
+    if resource is not None:
+        root.attributes["peak_child_rss_mb"] = peak_rss_mb(resource.RUSAGE_CHILDREN)
+    metrics.record(root)
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    try:
+        path = save_json(root.to_dict(), settings.diagnostics_dir / "telemetry" / f"{root.name}-{stamp}.json")
+    except (OSError, TypeError, ValueError) as exc:
+        logger.warning("Could not write telemetry for %s: %s", root.name, exc)
+        return
+    logger.info("%s finished in %.1fs; telemetry written to %s", root.name, root.wall_seconds, path)
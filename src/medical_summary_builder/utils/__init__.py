@@ -1,11 +1,17 @@
 """Utility helpers for file IO, prompt management, and pipeline orchestration."""
 
-from .io import ensure_directory, load_json, save_json
+from .cache import DiskLRUCache
+from .io import content_hasher, ensure_directory, file_digest, load_json, save_json
 from .prompts import PromptLibrary
+from .tokens import count_tokens
 
 __all__ = [
+    "DiskLRUCache",
+    "content_hasher",
     "ensure_directory",
+    "file_digest",
     "load_json",
     "save_json",
     "PromptLibrary",
+    "count_tokens",
 ]
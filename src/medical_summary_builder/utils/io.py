@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 from typing import Any
@@ -23,3 +24,19 @@ def save_json(data: Any, path: Path | str) -> Path:
     file_path.parent.mkdir(parents=True, exist_ok=True)
     file_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
     return file_path
+
+
+def content_hasher() -> "hashlib._Hash":
+    """Return the hasher used for content-addressed file names and cache keys."""
+
+    return hashlib.blake2b(digest_size=20)
+
+
+def file_digest(path: Path | str, *, chunk_size: int = 1 << 20) -> str:
+    """Return a stable content hash for a file, streamed in fixed-size chunks."""
+
+    hasher = content_hasher()
+    with Path(path).open("rb") as handle:
+        for block in iter(lambda: handle.read(chunk_size), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
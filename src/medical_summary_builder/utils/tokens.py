@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as exc:  # pragma: no cover - offline hosts without the BPE file
+        logger.warning("tiktoken unavailable (%s); estimating tokens from character counts.", exc)
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the cl100k encoding, or estimate ~4 characters per token offline."""
+
+    encoding = _encoding()
+    if encoding is None:
+        return max(1, len(text) // 4)
+    return len(encoding.encode(text, disallowed_special=()))
@@ -1,7 +1,16 @@
-"""Vectorstore management using Pinecone and LangChain retrievers."""
+"""Vectorstore management using Pinecone or a local store and LangChain retrievers."""
 
+from .backends import LocalBackend, PineconeBackend, VectorStoreBackend
+from .hybrid import HybridRetriever, search_many
 from .index import VectorIndexManager
+from .local_store import LocalVectorStore
 
 __all__ = [
+    "HybridRetriever",
+    "LocalBackend",
+    "LocalVectorStore",
+    "PineconeBackend",
     "VectorIndexManager",
+    "VectorStoreBackend",
+    "search_many",
 ]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Iterable, Sequence
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+from langchain_pinecone import PineconeVectorStore
+from pinecone import Pinecone
+
+from ..config import settings
+from .local_store import LocalVectorStore
+
+
+class VectorStoreBackend(ABC):
+    """Storage backend used by `VectorIndexManager` to persist and query chunk vectors."""
+
+    max_open_stores = 16
+
+    def __init__(self, embeddings: Embeddings, index_name: str) -> None:
+        self.embeddings = embeddings
+        self.index_name = index_name
+        self._stores: OrderedDict[str | None, VectorStore] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(self, namespace: str | None = None) -> VectorStore:
+        """Return a LangChain vector store scoped to ``namespace``, reusing recently opened ones."""
+
+        with self._lock:
+            store = self._stores.get(namespace)
+            if store is None:
+                store = self._open(namespace)
+                self._stores[namespace] = store
+                if len(self._stores) > self.max_open_stores:
+                    self._stores.popitem(last=False)
+            self._stores.move_to_end(namespace)
+            return store
+
+    @abstractmethod
+    def _open(self, namespace: str | None) -> VectorStore:
+        """Create a LangChain vector store scoped to ``namespace``."""
+
+    def existing_ids(self, ids: Sequence[str], *, namespace: str | None = None) -> set[str]:
+        """Return the subset of ``ids`` already stored in ``namespace``."""
+
+        return {doc.id for doc in self.open(namespace).get_by_ids(list(ids)) if doc.id}
+
+    def upsert(self, documents: Iterable[Document], *, namespace: str | None = None) -> VectorStore:
+        store = self.open(namespace)
+        store.add_documents(list(documents))
+        return store
+
+
+class PineconeBackend(VectorStoreBackend):
+    """Remote Pinecone index; namespaces map onto Pinecone namespaces."""
+
+    fetch_batch_size = 200
+
+    def __init__(self, embeddings: Embeddings, index_name: str) -> None:
+        super().__init__(embeddings, index_name)
+        self._pinecone_index = None
+
+    def _index(self):
+        if self._pinecone_index is None:
+            self._pinecone_index = Pinecone(api_key=settings.pinecone_api_key).Index(self.index_name)
+        return self._pinecone_index
+
+    def _open(self, namespace: str | None) -> VectorStore:
+        # Share one index handle (and its connection pool) across all namespaces.
+        return PineconeVectorStore(
+            index=self._index(),
+            embedding=self.embeddings,
+            namespace=namespace,
+        )
+
+    def existing_ids(self, ids: Sequence[str], *, namespace: str | None = None) -> set[str]:
+        index = self._index()
+        found: set[str] = set()
+        # Fetch is a GET with ids in the query string, so keep batches modest.
+        for offset in range(0, len(ids), self.fetch_batch_size):
+            response = index.fetch(ids=list(ids[offset : offset + self.fetch_batch_size]), namespace=namespace or "")
+            found.update(response.vectors.keys())
+        return found
+
+
+class LocalBackend(VectorStoreBackend):
+    """Embedded NumPy store persisted under ``settings.cache_dir``, one directory per namespace."""
+
+    def _open(self, namespace: str | None) -> VectorStore:
+        directory = settings.cache_dir / "vectors" / self.index_name / (namespace or "default")
+        return LocalVectorStore(self.embeddings, directory)
+
+
+BACKENDS: dict[str, type[VectorStoreBackend]] = {
+    "pinecone": PineconeBackend,
+    "local": LocalBackend,
+}
+
+
+def create_backend(name: str, embeddings: Embeddings, index_name: str) -> VectorStoreBackend:
+    try:
+        backend_cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown vector backend '{name}'. Expected one of: {', '.join(BACKENDS)}") from None
+    return backend_cls(embeddings, index_name)
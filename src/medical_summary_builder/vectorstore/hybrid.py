@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Sequence
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.vectorstores import VectorStoreRetriever
+from pydantic import PrivateAttr
+
+from ..preprocessing.lexical_index import LexicalPageIndex, tokenize
+from ..utils import count_tokens
+
+logger = logging.getLogger(__name__)
+
+
+def search_many(
+    retriever: BaseRetriever,
+    queries: Sequence[str],
+    *,
+    max_concurrency: int = 8,
+) -> list[list[Document]]:
+    """Run several queries at once, embedding them in a single batch where possible.
+
+    Failures never raise: a query whose search fails gets an empty result, and if
+    the shared embedding call fails every dense result is empty. A
+    `HybridRetriever` then still returns its BM25 hits.
+    """
+
+    queries = list(queries)
+    if isinstance(retriever, HybridRetriever):
+        return retriever.invoke_many(queries, max_concurrency=max_concurrency)
+    if isinstance(retriever, VectorStoreRetriever) and retriever.search_type == "similarity":
+        return _dense_search_many(retriever, queries, max_concurrency=max_concurrency)
+
+    results = retriever.batch(queries, config={"max_concurrency": max_concurrency}, return_exceptions=True)
+    return [[] if isinstance(result, Exception) else result for result in results]
+
+
+def _dense_search_many(
+    retriever: VectorStoreRetriever,
+    queries: list[str],
+    *,
+    max_concurrency: int,
+) -> list[list[Document]]:
+    if not queries:
+        return []
+
+    vectorstore = retriever.vectorstore
+    try:
+        vectors = vectorstore.embeddings.embed_documents(queries)
+    except Exception as exc:
+        logger.warning("Query embedding failed for %d queries; dense results are empty: %s", len(queries), exc)
+        return [[] for _ in queries]
+
+    def search(vector: list[float]) -> list[Document]:
+        try:
+            return vectorstore.similarity_search_by_vector(vector, **retriever.search_kwargs)
+        except Exception as exc:
+            logger.debug("Vector search failed during batched retrieval: %s", exc)
+            return []
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(queries))) as executor:
+        return list(executor.map(search, vectors))
+
+
+class HybridRetriever(BaseRetriever):
+    """Fuse dense chunk hits and BM25 page hits with reciprocal rank fusion.
+
+    Results are collapsed to one passage per page, cut to a token budget, and
+    cached by normalised query for the lifetime of the retriever (one run).
+    """
+
+    dense: BaseRetriever
+    lexical_index: Optional[LexicalPageIndex] = None
+    k: int = 8
+    lexical_k: int = 25
+    rrf_k: int = 60
+    max_tokens: int = 4000
+    excerpt_chars: int = 1500
+
+    _cache: dict[str, list[Document]] = PrivateAttr(default_factory=dict)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Cache key that treats case, punctuation and word order as insignificant."""
+
+        return " ".join(sorted(set(tokenize(query))))
+
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: CallbackManagerForRetrieverRun,
+    ) -> list[Document]:
+        key = self.normalize_query(query)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            dense_docs = self.dense.invoke(query, config={"callbacks": run_manager.get_child()})
+        except Exception as exc:
+            logger.warning("Dense search failed; using BM25 hits only: %s", exc)
+            dense_docs = []
+        lexical_pages = [doc for doc, _ in self.lexical_index.search(query, k=self.lexical_k)] if self.lexical_index else []
+        results = self.fuse(query, dense_docs, lexical_pages)
+
+        with self._lock:
+            self._cache[key] = results
+        return results
+
+    def invoke_many(self, queries: Sequence[str], *, max_concurrency: int = 8) -> list[list[Document]]:
+        """Resolve many queries with one embedding batch and concurrent vector searches."""
+
+        queries = list(queries)
+        keys = [self.normalize_query(query) for query in queries]
+        with self._lock:
+            results = {key: self._cache[key] for key in keys if key in self._cache}
+
+        pending: dict[str, str] = {}
+        for key, query in zip(keys, queries):
+            if key not in results:
+                pending.setdefault(key, query)
+
+        if pending:
+            pending_queries = list(pending.values())
+            dense_results = search_many(self.dense, pending_queries, max_concurrency=max_concurrency)
+            for key, query, dense_docs in zip(pending, pending_queries, dense_results):
+                lexical_pages = (
+                    [doc for doc, _ in self.lexical_index.search(query, k=self.lexical_k)] if self.lexical_index else []
+                )
+                results[key] = self.fuse(query, dense_docs, lexical_pages)
+            with self._lock:
+                self._cache.update({key: results[key] for key in pending})
+
+        return [results[key] for key in keys]
+
+    def fuse(self, query: str, dense_docs: list[Document], lexical_pages: list[Document]) -> list[Document]:
+        scores: dict[tuple[Any, Any], float] = {}
+        passages: dict[tuple[Any, Any], Document] = {}
+
+        for ranking, from_lexical in ((dense_docs, False), (lexical_pages, True)):
+            seen: set[tuple[Any, Any]] = set()
+            for rank, doc in enumerate(ranking):
+                page_key = (doc.metadata.get("source"), doc.metadata.get("page_number"))
+                # Only a page's best-ranked hit per list counts, so overlapping chunks don't stack.
+                if page_key in seen:
+                    continue
+                seen.add(page_key)
+                scores[page_key] = scores.get(page_key, 0.0) + 1.0 / (self.rrf_k + rank + 1)
+                if page_key not in passages:
+                    passages[page_key] = self._excerpt(doc, query) if from_lexical else doc
+
+        results: list[Document] = []
+        used_tokens = 0
+        for page_key in sorted(scores, key=scores.get, reverse=True):
+            doc = passages[page_key]
+            tokens = count_tokens(doc.page_content)
+            if results and used_tokens + tokens > self.max_tokens:
+                break
+            results.append(doc)
+            used_tokens += tokens
+            if len(results) >= self.k:
+                break
+        return results
+
+    def _excerpt(self, page: Document, query: str) -> Document:
+        """Trim a whole page to a chunk-sized window around the first query term."""
+
+        text = page.page_content
+        if len(text) <= self.excerpt_chars:
+            return page
+
+        terms = [re.escape(term) for term in tokenize(query) if len(term) > 2]
+        match = re.search("|".join(terms), text, flags=re.IGNORECASE) if terms else None
+        start = max(0, (match.start() if match else 0) - self.excerpt_chars // 4)
+        return Document(page_content=text[start : start + self.excerpt_chars], metadata=page.metadata)
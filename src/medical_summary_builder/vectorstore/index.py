@@ -1,33 +1,65 @@
 from __future__ import annotations
 
+import logging
 from typing import Iterable
 
-from langchain_pinecone import PineconeVectorStore
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
-from langchain_core.vectorstores import VectorStoreRetriever
+from langchain_core.vectorstores import VectorStore, VectorStoreRetriever
 
 from ..config import settings
+from .backends import VectorStoreBackend, create_backend
+
+logger = logging.getLogger(__name__)
 
 
 class VectorIndexManager:
-    """Wrap Pinecone index creation and retrieval utilities."""
+    """Wrap vector index creation and retrieval utilities over a configurable backend."""
 
-    def __init__(self, embeddings: Embeddings, index_name: str | None = None) -> None:
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        index_name: str | None = None,
+        *,
+        backend: str | None = None,
+    ) -> None:
         self.embeddings = embeddings
         self.index_name = index_name or settings.pinecone_index
+        self.backend: VectorStoreBackend = create_backend(
+            backend or settings.vector_backend,
+            embeddings,
+            self.index_name,
+        )
+
+    def warm_up(self) -> None:
+        """Open the default store so backend clients are connected before the first case."""
+
+        self.backend.open()
 
-    def upsert(self, documents: Iterable[Document]) -> PineconeVectorStore:
-        return PineconeVectorStore.from_documents(
-            documents=documents,
-            embedding=self.embeddings,
-            index_name=self.index_name,
+    def upsert(self, documents: Iterable[Document], *, namespace: str | None = None) -> VectorStore:
+        """Write documents into ``namespace``, skipping any whose stable id is already stored."""
+
+        documents = list(documents)
+        ids = [doc.id for doc in documents if doc.id]
+        existing = self.backend.existing_ids(ids, namespace=namespace) if ids else set()
+        fresh = [doc for doc in documents if not doc.id or doc.id not in existing]
+
+        logger.info(
+            "Upserting %d new chunks into namespace %s (%d already indexed).",
+            len(fresh),
+            namespace or "<default>",
+            len(documents) - len(fresh),
         )
+        if not fresh:
+            return self.backend.open(namespace)
+        return self.backend.upsert(fresh, namespace=namespace)
 
-    def as_retriever(self, *, search_kwargs: dict | None = None) -> VectorStoreRetriever:
+    def as_retriever(
+        self,
+        *,
+        search_kwargs: dict | None = None,
+        namespace: str | None = None,
+    ) -> VectorStoreRetriever:
         search_kwargs = search_kwargs or {"k": 25}
-        vectorstore = PineconeVectorStore(
-            embedding=self.embeddings,
-            index_name=self.index_name,
-        )
+        vectorstore = self.backend.open(namespace)
         return vectorstore.as_retriever(search_kwargs=search_kwargs)
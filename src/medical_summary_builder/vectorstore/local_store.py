@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+logger = logging.getLogger(__name__)
+
+
+class LocalVectorStore(VectorStore):
+    """In-process vector store backed by a memory-mapped float32 matrix.
+
+    Rows are L2-normalised on write so cosine similarity is a single matrix-vector
+    product. Vectors live in ``vectors.f32``, the matching ids, texts and
+    metadata in ``records.jsonl`` (one line per row) and the vector width in
+    ``meta.json`` inside ``directory``. Vectors are appended before their
+    records, so on load any rows beyond the last record are truncated away.
+    """
+
+    def __init__(self, embedding: Embeddings, directory: Path | str) -> None:
+        self._embedding = embedding
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = self.directory / "vectors.f32"
+        self._records_path = self.directory / "records.jsonl"
+        self._meta_path = self.directory / "meta.json"
+        self._dimensions: int | None = None
+        self._lock = threading.Lock()
+        self._records: list[dict[str, Any]] = []
+        self._row_by_id: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+        self._load()
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def _load(self) -> None:
+        if not self._records_path.exists() or not self._vectors_path.exists():
+            return
+
+        with self._records_path.open(encoding="utf-8") as handle:
+            lines = [line for line in handle if line.strip()]
+        for number, line in enumerate(lines):
+            try:
+                self._records.append(json.loads(line))
+            except json.JSONDecodeError:
+                if number != len(lines) - 1:
+                    raise
+                # A write interrupted mid-record leaves a torn last line; drop it before appending again.
+                logger.warning("Dropping a partially written record from %s.", self._records_path)
+                self._rewrite_records()
+        if self._meta_path.exists():
+            self._dimensions = json.loads(self._meta_path.read_text(encoding="utf-8"))["dimensions"]
+        elif self._records:
+            # Stores written before meta.json existed: infer the width once and record it.
+            self._dimensions = self._vectors_path.stat().st_size // (4 * len(self._records))
+            self._write_meta()
+
+        if self._dimensions:
+            self._repair(self._vectors_path.stat().st_size // (4 * self._dimensions))
+        self._row_by_id = {record["id"]: row for row, record in enumerate(self._records)}
+        self._remap()
+
+    def _repair(self, vector_rows: int) -> None:
+        """Make the vectors file and the records agree after an interrupted write."""
+
+        rows = len(self._records)
+        if vector_rows > rows:
+            logger.warning("Truncating %d vectors without records from %s.", vector_rows - rows, self._vectors_path)
+            os.truncate(self._vectors_path, rows * self._dimensions * 4)
+        elif vector_rows < rows:
+            logger.warning("Dropping %d records without vectors from %s.", rows - vector_rows, self._records_path)
+            del self._records[vector_rows:]
+            self._rewrite_records()
+
+    def _write_meta(self) -> None:
+        tmp_path = self._meta_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"dimensions": self._dimensions}), encoding="utf-8")
+        tmp_path.replace(self._meta_path)
+
+    def _remap(self) -> None:
+        rows = len(self._records)
+        if not rows:
+            self._matrix = None
+            return
+        self._matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(rows, self._dimensions))
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[list[dict]] = None,
+        *,
+        ids: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        texts = list(texts)
+        if not texts:
+            return []
+        metadatas = metadatas or [{} for _ in texts]
+        ids = ids or [str(uuid.uuid4()) for _ in texts]
+        vectors = self._normalize(np.asarray(self._embedding.embed_documents(texts), dtype=np.float32))
+
+        with self._lock:
+            if self._dimensions is None:
+                self._dimensions = vectors.shape[1]
+                self._write_meta()
+            elif vectors.shape[1] != self._dimensions:
+                raise ValueError(
+                    f"Embedding width {vectors.shape[1]} does not match the store's {self._dimensions} dimensions."
+                )
+            replaced = [(row, index) for index, id_ in enumerate(ids) if (row := self._row_by_id.get(id_)) is not None]
+            appended = [index for index, id_ in enumerate(ids) if id_ not in self._row_by_id]
+
+            if replaced:
+                matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=self._matrix.shape)
+                for row, index in replaced:
+                    matrix[row] = vectors[index]
+                    self._records[row] = {"id": ids[index], "text": texts[index], "metadata": metadatas[index]}
+                matrix.flush()
+                del matrix
+                self._rewrite_records()
+
+            if appended:
+                with self._vectors_path.open("ab") as handle:
+                    handle.write(np.ascontiguousarray(vectors[appended]).tobytes())
+                with self._records_path.open("a", encoding="utf-8") as handle:
+                    for index in appended:
+                        record = {"id": ids[index], "text": texts[index], "metadata": metadatas[index]}
+                        self._row_by_id[ids[index]] = len(self._records)
+                        self._records.append(record)
+                        handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            self._remap()
+        return ids
+
+    def _rewrite_records(self) -> None:
+        tmp_path = self._records_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            for record in self._records:
+                handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        tmp_path.replace(self._records_path)
+
+    def delete(self, ids: Optional[list[str]] = None, **kwargs: Any) -> Optional[bool]:
+        with self._lock:
+            drop = set(ids) if ids is not None else set(self._row_by_id)
+            keep = [row for row, record in enumerate(self._records) if record["id"] not in drop]
+            kept_vectors = np.array(self._matrix[keep]) if self._matrix is not None else np.empty((0, 0), np.float32)
+            self._matrix = None
+            self._records = [self._records[row] for row in keep]
+            self._row_by_id = {record["id"]: row for row, record in enumerate(self._records)}
+            self._vectors_path.write_bytes(np.ascontiguousarray(kept_vectors, dtype=np.float32).tobytes())
+            self._rewrite_records()
+            self._remap()
+        return True
+
+    def get_by_ids(self, ids: Sequence[str], /) -> list[Document]:
+        # Locked because concurrent ``add_texts`` calls register ids before appending their records.
+        with self._lock:
+            return [self._to_document(row) for id_ in ids if (row := self._row_by_id.get(id_)) is not None]
+
+    def _to_document(self, row: int) -> Document:
+        record = self._records[row]
+        return Document(id=record["id"], page_content=record["text"], metadata=dict(record["metadata"]))
+
+    def similarity_search_with_score_by_vector(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        filter: Optional[Callable[[dict], bool]] = None,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        matrix = self._matrix
+        if matrix is None or k <= 0:
+            return []
+
+        query = self._normalize(np.asarray(embedding, dtype=np.float32))
+        scores = matrix @ query
+        if filter is not None:
+            mask = np.fromiter((filter(record["metadata"]) for record in self._records[: len(scores)]), bool, len(scores))
+            scores = np.where(mask, scores, -np.inf)
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._to_document(int(row)), float(scores[row])) for row in top if np.isfinite(scores[row])]
+
+    def similarity_search_by_vector(self, embedding: list[float], k: int = 4, **kwargs: Any) -> list[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k, **kwargs)]
+
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs: Any) -> list[tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(self._embedding.embed_query(query), k, **kwargs)
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> list[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, **kwargs)]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # Scores are already cosine similarities in [-1, 1]; map them onto [0, 1].
+        return lambda score: (score + 1.0) / 2.0
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: Optional[list[dict]] = None,
+        *,
+        directory: Path | str,
+        ids: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> "LocalVectorStore":
+        store = cls(embedding, directory)
+        store.add_texts(texts, metadatas, ids=ids)
+        return store
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import itertools
+
+from medical_summary_builder.utils import DiskLRUCache
+from medical_summary_builder.utils import cache as cache_module
+
+
+def test_put_evicts_least_recently_used_entries_down_to_the_byte_cap(tmp_path, monkeypatch) -> None:
+    clock = itertools.count(1)
+    monkeypatch.setattr(cache_module.time, "time", lambda: float(next(clock)))
+    cache = DiskLRUCache(tmp_path / "cache.sqlite", max_bytes=100)
+
+    cache.put_many({"a": b"a" * 40, "b": b"b" * 40})
+    cache.put("c", b"c" * 10)
+    assert cache.get("a") == b"a" * 40  # "a" is now more recent than "b"
+    cache.put("d", b"d" * 40)
+
+    assert cache.get_many(["a", "b", "c", "d"]).keys() == {"a", "c", "d"}
+    assert cache.total_bytes() == 90
+
+
+def test_entry_larger_than_the_cap_is_not_kept(tmp_path) -> None:
+    cache = DiskLRUCache(tmp_path / "cache.sqlite", max_bytes=16)
+
+    cache.put("big", b"x" * 32)
+
+    assert cache.get("big") is None
+    assert cache.total_bytes() == 0
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from medical_summary_builder.data_ingestion.converters import DocumentConverter
+
+LAYOUT_PAGE = """
+    Patient Name          Jane Q. Doe
+    DOB:                  04/12/1968
+    Arthur Miller                 Unit B
+    Name: John Doe        DOB: 01/01/1960
+"""
+
+
+def test_only_label_cells_become_key_value_lines() -> None:
+    markdown = DocumentConverter.layout_page_to_markdown(LAYOUT_PAGE)
+
+    assert markdown.splitlines() == [
+        "Patient Name: Jane Q. Doe",
+        "DOB: 04/12/1968",
+        "Arthur Miller | Unit B",
+        "Name: John Doe | DOB: 01/01/1960",
+    ]
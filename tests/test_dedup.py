@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from langchain_core.documents import Document
+
+from medical_summary_builder.preprocessing.dedup import NearDuplicateFilter, page_body
+
+FOLLOW_UP = """Date of service: {date}
+Provider: Riverside Family Medicine
+Chief complaint: follow-up for low back pain and type 2 diabetes.
+Patient reports pain 6/10, worse with prolonged sitting; no new numbness or weakness.
+Medications reviewed: metformin 500 mg twice daily, naproxen as needed.
+Exam: lumbar paraspinal tenderness, straight leg raise negative bilaterally.
+Assessment: chronic lumbar strain, diabetes without complications.
+Plan: continue home exercise program, recheck A1c in three months.
+Electronically signed by Dana Whitfield, MD on {date}
+"""
+
+
+def page(number: int, text: str) -> Document:
+    return Document(page_content=text, metadata={"page_number": number, "page_label": str(number)})
+
+
+def test_same_template_on_different_dates_is_kept() -> None:
+    dedup = NearDuplicateFilter()
+    pages = [page(10, FOLLOW_UP.format(date="01/05/2023")), page(40, FOLLOW_UP.format(date="06/12/2023"))]
+
+    kept = list(dedup.filter(pages))
+
+    assert [document.metadata["page_number"] for document in kept] == [10, 40]
+    assert dedup.duplicate_pages == {}
+
+
+def test_refaxed_copy_with_different_fax_header_is_merged() -> None:
+    dedup = NearDuplicateFilter()
+    original = FOLLOW_UP.format(date="01/05/2023")
+    header = "FAX 03/12/2024 14:07 FROM (555) 010-2231 TO DDS INTAKE P. 041\n"
+    pages = [page(10, "FAX 02/01/2024 09:15 FROM (555) 010-8890 TO DDS INTAKE P. 010\n" + original), page(41, header + original)]
+
+    kept = list(dedup.filter(pages))
+
+    assert [document.metadata["page_number"] for document in kept] == [10]
+    assert dedup.duplicate_pages == {10: ["41"]}
+
+
+def test_page_body_keeps_dates_near_the_edges() -> None:
+    text = "Page 3 of 7\n" + FOLLOW_UP.format(date="01/05/2023")
+
+    body = page_body(text)
+
+    assert "Page 3 of 7" not in body
+    assert body.startswith("Date of service: 01/05/2023")
+    assert body.endswith("on 01/05/2023")
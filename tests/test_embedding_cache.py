@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from langchain_core.embeddings import Embeddings
+
+from medical_summary_builder.llm.embedding_cache import CachedEmbeddings
+from medical_summary_builder.utils import DiskLRUCache
+
+
+class FallbackEmbeddings(Embeddings):
+    """Reports every vector as produced by ``model_name``, like a call served by the fallback model."""
+
+    def __init__(self, model_name: str) -> None:
+        self.model_name = model_name
+        self.calls = 0
+
+    def embed_with_models(self, texts: list[str]) -> list[tuple[str, list[float]]]:
+        self.calls += 1
+        return [(self.model_name, [float(len(text)), 1.0]) for text in texts]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [vector for _, vector in self.embed_with_models(texts)]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def test_repeated_texts_are_served_from_the_cache(tmp_path) -> None:
+    inner = FallbackEmbeddings("primary")
+    store = DiskLRUCache(tmp_path / "e.sqlite", max_bytes=2**20)
+    embeddings = CachedEmbeddings(inner, store, model_name="primary", dimensions=2)
+
+    first = embeddings.embed_documents(["hip x-ray", "MRI"])
+    second = embeddings.embed_documents(["MRI", "hip x-ray"])
+
+    assert second == first[::-1]
+    assert inner.calls == 1
+    assert embeddings.stats()["hits"] == 2
+
+
+def test_fallback_vectors_are_not_served_as_the_primary_model(tmp_path) -> None:
+    store = DiskLRUCache(tmp_path / "e.sqlite", max_bytes=2**20)
+    fallback = FallbackEmbeddings("fallback")
+    CachedEmbeddings(fallback, store, model_name="primary", dimensions=2).embed_documents(["hip x-ray"])
+
+    primary = FallbackEmbeddings("primary")
+    CachedEmbeddings(primary, store, model_name="primary", dimensions=2).embed_documents(["hip x-ray"])
+    CachedEmbeddings(fallback, store, model_name="fallback", dimensions=2).embed_documents(["hip x-ray"])
+
+    assert primary.calls == 1
+    assert fallback.calls == 1
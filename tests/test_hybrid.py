@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from medical_summary_builder.preprocessing.lexical_index import LexicalPageIndex
+from medical_summary_builder.vectorstore.hybrid import HybridRetriever, search_many
+
+PAGES = [
+    Document(
+        page_content="MRI of the cervical spine shows a C4-C5 disc herniation.",
+        metadata={"source": "case.pdf", "page_number": 1},
+    ),
+    Document(
+        page_content="Hemoglobin A1c 7.9 percent, diabetes poorly controlled.",
+        metadata={"source": "case.pdf", "page_number": 2},
+    ),
+]
+
+
+class UnavailableEmbeddings(Embeddings):
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        raise ConnectionError("embedding endpoint unavailable")
+
+    def embed_query(self, text: str) -> list[float]:
+        raise ConnectionError("embedding endpoint unavailable")
+
+
+def retriever() -> HybridRetriever:
+    dense = InMemoryVectorStore(UnavailableEmbeddings()).as_retriever(search_kwargs={"k": 4})
+    return HybridRetriever(dense=dense, lexical_index=LexicalPageIndex(PAGES))
+
+
+def test_search_many_keeps_bm25_hits_when_query_embedding_fails() -> None:
+    results = search_many(retriever(), ["cervical spine MRI", "A1c lab result"])
+
+    assert [documents[0].metadata["page_number"] for documents in results] == [1, 2]
+
+
+def test_invoke_keeps_bm25_hits_when_dense_search_fails() -> None:
+    results = retriever().invoke("cervical spine MRI")
+
+    assert results[0].metadata["page_number"] == 1
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+
+from medical_summary_builder.pipelines import MedicalSummaryPipeline
+
+SUMMARY = {
+    "profile": {"claimant_name": "Jane Q. Doe", "ssn": "123-45-6789"},
+    "events": [{"date": "03/15/2023", "provider": "Clinic", "reason": "Follow-up", "reference": "Pg 12"}],
+    "custom_tables": {},
+}
+# Tool output full of unbalanced-looking brackets and quotes, like OCR'd clinic notes.
+TOOL_OUTPUT = (
+    "[Page: 12/504]\nPatient seen {follow-up} for hip pain [R > L]; notes: \"pain 7/10\". "
+    "Plan: {PT 2x/week} [reassess in 6 weeks]. Claimant's mother present. "
+)
+
+
+def parser() -> MedicalSummaryPipeline:
+    return MedicalSummaryPipeline.__new__(MedicalSummaryPipeline)
+
+
+def test_unterminated_quote_before_answer() -> None:
+    text = f"Evidence [Pg 12, 'see chart] was reviewed.\nFinal answer:\n{json.dumps(SUMMARY)}"
+
+    parsed = parser()._parse_json_string(text)
+
+    assert parsed is not None
+    assert parsed.profile.claimant_name == "Jane Q. Doe"
+    assert parsed.events[0].reference == "Pg 12"
+
+
+def test_unterminated_double_quote_inside_answer_prose() -> None:
+    text = f'Notes {{"pain: 7/10}} then\n```json\n{json.dumps(SUMMARY)}\n```'
+
+    parsed = parser()._parse_json_string(text)
+
+    assert parsed is not None
+    assert parsed.profile.ssn == "123-45-6789"
+
+
+def test_long_transcript() -> None:
+    events = [
+        {
+            "date": f"{1 + i % 12:02d}/15/2023",
+            "provider": f"Clinic {{{i}}}",
+            "reason": "Visit [follow-up]",
+            "reference": f"Pg {i}",
+        }
+        for i in range(20)
+    ]
+    answer = json.dumps({**SUMMARY, "events": events})
+    text = f"Evidence gathered:\n{TOOL_OUTPUT * 800}\nFinal answer:\n```json\n{answer}\n```"
+
+    parsed = parser()._parse_json_string(text)
+
+    assert parsed is not None
+    assert len(parsed.events) == 20
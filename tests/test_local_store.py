@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from medical_summary_builder.vectorstore.local_store import LocalVectorStore
+
+TEXTS = ["hip x-ray shows arthritis", "cervical spine MRI", "hemoglobin A1c 7.9"]
+
+
+def store(directory) -> LocalVectorStore:
+    return LocalVectorStore(DeterministicFakeEmbedding(size=8), directory)
+
+
+def test_vectors_without_records_are_truncated_on_load(tmp_path) -> None:
+    store(tmp_path).add_texts(TEXTS, ids=["a", "b", "c"])
+    # A write interrupted after the vectors but before their records: 13 rows on disk for 3 records.
+    with (tmp_path / "vectors.f32").open("ab") as handle:
+        handle.write(np.ones((10, 8), dtype=np.float32).tobytes())
+
+    reloaded = store(tmp_path)
+
+    assert len(reloaded) == 3
+    assert reloaded._matrix.shape == (3, 8)
+    assert (tmp_path / "vectors.f32").stat().st_size == 3 * 8 * 4
+    assert reloaded.similarity_search(TEXTS[1], k=1)[0].page_content == TEXTS[1]
+
+
+def test_torn_last_record_is_dropped_and_store_stays_appendable(tmp_path) -> None:
+    store(tmp_path).add_texts(TEXTS, ids=["a", "b", "c"])
+    records = tmp_path / "records.jsonl"
+    records.write_text(records.read_text(encoding="utf-8")[:-20], encoding="utf-8")
+
+    reloaded = store(tmp_path)
+    reloaded.add_texts(["lumbar strain"], ids=["d"])
+
+    lines = records.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["a", "b", "d"]
+    assert len(store(tmp_path)) == 3
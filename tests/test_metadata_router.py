@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+from langchain_core.documents import Document
+
+from medical_summary_builder.preprocessing.metadata_router import MetadataRouter
+
+
+@pytest.mark.parametrize(
+    ("grade", "expected"),
+    [
+        ("1", "1st"),
+        ("2", "2nd"),
+        ("3", "3rd"),
+        ("4", "4th"),
+        ("11", "11th"),
+        ("12", "12th"),
+        ("13", "13th"),
+        ("21", "21st"),
+        ("22", "22nd"),
+    ],
+)
+def test_highest_grade_completed_is_an_ordinal(grade: str, expected: str) -> None:
+    page = Document(page_content=f"Highest grade completed: {grade}", metadata={"page_number": 3})
+
+    record = MetadataRouter().extract([page])
+
+    assert record.education == f"{expected} grade"
+    assert record.citations["education"] == "Pg 3"
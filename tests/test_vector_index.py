@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding, Embeddings
+
+from medical_summary_builder.config import settings
+from medical_summary_builder.vectorstore import VectorIndexManager
+
+
+class RecordingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.inner = DeterministicFakeEmbedding(size=8)
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return self.inner.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.inner.embed_query(text)
+
+
+def chunk(id_: str, text: str) -> Document:
+    return Document(id=id_, page_content=text, metadata={"page_number": 1})
+
+
+def test_upsert_embeds_only_ids_not_already_stored(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "cache_dir", tmp_path)
+    embeddings = RecordingEmbeddings()
+    manager = VectorIndexManager(embeddings, "test-index", backend="local")
+
+    indexed = [chunk("case:1:0:aa", "first chunk"), chunk("case:1:50:bb", "second chunk")]
+    manager.upsert(indexed, namespace="case")
+    store = manager.upsert([*indexed, chunk("case:2:0:cc", "third chunk")], namespace="case")
+
+    assert embeddings.embedded == ["first chunk", "second chunk", "third chunk"]
+    assert len(store) == 3